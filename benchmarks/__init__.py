@@ -0,0 +1 @@
+"""Offline benchmarks for the scrapers. Run with ``python -m benchmarks.<name>``."""
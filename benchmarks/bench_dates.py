@@ -0,0 +1,115 @@
+"""Microbenchmark: scrapers.dates vs. the old strptime trial loop.
+
+Uses date strings as each source actually presents them. Checks that both
+implementations agree wherever the old one succeeds, then times them:
+
+    python -m benchmarks.bench_dates [--rounds N]
+"""
+
+import argparse
+import re
+import time
+from datetime import datetime
+
+from scrapers import dates
+
+# (source, string handed to parse_date)
+SAMPLES = [
+    ("Bar None", "MARCH 14, 2026"),
+    ("Bar None", "JULY 31, 2026"),
+    ("Vantage", "March 21, 2026"),
+    ("Vantage", "July 21, 2026"),
+    ("WCA", "April 10, 2026"),
+    ("WCA", "June 12th, 2026"),
+    ("WCA", "December 4th, 2026"),
+    ("JJ Kane", "3/10/2026"),
+    ("JJ Kane", "Mar 12, 2026"),
+    ("The Auction Company", "04/25/2026"),
+    ("The Auction Company", "APRIL 25TH, 2026"),
+    ("Ritchie Bros", "Mar 25, 2026"),
+    ("Ritchie Bros", "2026-07-31"),
+    ("GAC", "Mar 13, 2026"),
+    ("GAC", "Saturday, March 14, 2026"),
+    ("any", "Date TBD"),
+]
+
+# (source, free text handed to find_date)
+TEXT_SAMPLES = [
+    ("Vantage", "Heavy Construction EquipmentSaturday, March 21, 2026 9:00 am"),
+    ("Vantage", "Timed Land AuctionBidding Starts: Tuesday, March 10, 2026 "
+                "Bidding Ends: Tuesday, March 24, 2026 at 10:00 am"),
+    ("WCA", "Next Auction: Friday April 10th, 2026 - 8:30am"),
+    ("GAC", "First lot closing on Mar 13, 2026 at 9:00AM PDT"),
+    ("The Auction Company", "263SATURDAY, APRIL 25TH-Ring 1 Sacramento: Contractors Equipment"),
+]
+
+LEGACY_FORMATS = [
+    "%B %d, %Y", "%b %d, %Y", "%m/%d/%Y", "%Y-%m-%d", "%A, %B %d, %Y",
+    "%B %dst, %Y", "%B %dnd, %Y", "%B %drd, %Y", "%B %dth, %Y",
+]
+
+
+def legacy_parse_date(raw: str) -> tuple[str, str]:
+    """The pre-engine BaseScraper.parse_date, kept verbatim for comparison."""
+    cleaned = re.sub(r'(\d+)(st|nd|rd|th)', r'\1', raw.strip())
+    for fmt in LEGACY_FORMATS:
+        clean_fmt = fmt.replace('st,', ',').replace('nd,', ',').replace('rd,', ',').replace('th,', ',')
+        for date_str, date_fmt in [(raw.strip(), fmt), (cleaned, clean_fmt), (cleaned, fmt)]:
+            try:
+                dt = datetime.strptime(date_str, date_fmt)
+                return dt.strftime("%Y-%m-%d"), dt.strftime("%A, %B %d, %Y")
+            except ValueError:
+                continue
+    raise ValueError(f"Could not parse date: '{raw}'")
+
+
+def _try(fn, raw):
+    try:
+        return fn(raw)
+    except ValueError:
+        return None
+
+
+def check_agreement() -> list[str]:
+    problems = []
+    for source, raw in SAMPLES:
+        old, new = _try(legacy_parse_date, raw), _try(dates.parse_date, raw)
+        if old is not None and old != new:
+            problems.append(f"{source}: {raw!r} legacy={old} engine={new}")
+    return problems
+
+
+def time_it(fn, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for _, raw in SAMPLES:
+            _try(fn, raw)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    problems = check_agreement()
+    for p in problems:
+        print(f"MISMATCH {p}")
+
+    calls = args.rounds * len(SAMPLES)
+    legacy = time_it(legacy_parse_date, args.rounds)
+    cold = time_it(dates._parse_cached.__wrapped__, args.rounds)
+    warm = time_it(dates.parse_date, args.rounds)
+    print(f"{calls} parse_date calls over {len(SAMPLES)} strings from every source")
+    print(f"  legacy strptime loop : {legacy * 1e6 / calls:8.2f} us/call")
+    print(f"  engine, uncached     : {cold * 1e6 / calls:8.2f} us/call")
+    print(f"  engine, LRU warm     : {warm * 1e6 / calls:8.2f} us/call  ({legacy / warm:.0f}x)")
+
+    for source, text in TEXT_SAMPLES:
+        print(f"  find_date [{source}]: {dates.find_date(text, default_year=2026)}")
+
+    raise SystemExit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark: duplicate detection as the number of listings grows.
+
+Feeds synthetic listings (spread over dates, states and sources, with a
+share of URL variants and cross-source copies) through
+scrapers.dedupe.DedupeIndex and reports time per listing, which should stay
+roughly flat because only listings in the same (date, state) block are
+compared:
+
+    python -m benchmarks.bench_dedupe [--sizes 1000,10000,100000]
+"""
+
+import argparse
+import time
+from datetime import date, timedelta
+
+from scrapers.base_scraper import AuctionListing
+from scrapers.dedupe import DedupeIndex
+
+SOURCES = ["Bar None", "Ritchie Bros", "GAC", "JJ Kane", "The Auction Company"]
+CITIES = ["Sacramento, CA", "Perris, CA", "Redlands, CA", "Phoenix, AZ", "Las Vegas, NV",
+          "Reno, NV", "Fresno, CA", "Tucson, AZ"]
+KINDS = ["Contractors Equipment", "Trucks and Trailers", "Ag Equipment", "Fleet Vehicles"]
+
+
+def listings(n: int):
+    for i in range(n):
+        source = SOURCES[i % len(SOURCES)]
+        # A few sales a day, as the real sources have
+        day = (date(2026, 1, 1) + timedelta(days=i // 6)).isoformat()
+        title = f"{CITIES[i % len(CITIES)].split(',')[0]} {KINDS[i % len(KINDS)]} Sale {i // 97}"
+        url = f"https://www.{source.replace(' ', '').lower()}.com/auctions/{i}"
+        yield AuctionListing(title, day, day, CITIES[i % len(CITIES)], source, url)
+        if i % 10 == 0:
+            # Same page under another URL spelling
+            yield AuctionListing(title, day, day, CITIES[i % len(CITIES)], source,
+                                 url.replace("https://www.", "http://") + "/?utm_source=feed")
+        if i % 15 == 0:
+            # The same sale listed by another house
+            yield AuctionListing(f"{title} Auction", day, day, CITIES[i % len(CITIES)],
+                                 "Proxibid", f"https://www.proxibid.com/lot/{i}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    args = parser.parse_args()
+
+    for n in (int(size) for size in args.sizes.split(",")):
+        batch = list(listings(n))
+        index = DedupeIndex()
+        start = time.perf_counter()
+        kept = sum(index.add(listing) is None for listing in batch)
+        elapsed = time.perf_counter() - start
+        print(f"{len(batch):>7} listings: {elapsed * 1000:8.1f} ms "
+              f"({elapsed / len(batch) * 1e6:5.1f} us each), kept {kept}, "
+              f"{index.url_matches} URL / {index.near_matches} near duplicates")
+
+
+if __name__ == "__main__":
+    main()
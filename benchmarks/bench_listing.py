@@ -0,0 +1,91 @@
+"""Benchmark: listing memory footprint and JSON encoding.
+
+Builds N lot-level-sized listings both as the old plain dataclass and as the
+slotted, interned ``AuctionListing``, and compares Python heap (tracemalloc)
+and the time to encode them via ``asdict`` + ``json.dumps`` versus
+scrapers.listing_json:
+
+    python -m benchmarks.bench_listing [--rows N]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+from scrapers.base_scraper import AuctionListing
+from scrapers.listing_json import encode_listing
+
+SOURCES = ["The Auction Company", "Bar None", "Ritchie Bros", "Vantage", "WCA", "GAC", "JJ Kane"]
+LOCATIONS = ["Sacramento, CA", "Perris, CA", "Redlands, CA", "Phoenix, AZ", "Las Vegas, NV"]
+TYPES = ["Live", "Online", "Live & Online", "Timed"]
+
+
+@dataclass
+class LegacyListing:
+    """AuctionListing as it was: a plain dataclass with a per-instance __dict__."""
+    title: str
+    date: str
+    date_display: str
+    location: str
+    source: str
+    url: str
+    auction_type: str = "Live"
+    item_count: Optional[int] = None
+    notes: str = ""
+
+
+def rows(n: int):
+    for i in range(n):
+        day = i % 28 + 1
+        # Fresh string objects per row, as parsing produces them
+        yield dict(
+            title=f"Lot {i} - 2019 Caterpillar 320 Excavator",
+            date="".join(["2026-03-", f"{day:02d}"]),
+            date_display="".join(["March ", f"{day:02d}", ", 2026"]),
+            location="".join(LOCATIONS[i % len(LOCATIONS)]),
+            source="".join(SOURCES[i % len(SOURCES)]),
+            url=f"https://example.com/auctions/{i // 500}/lots/{i}",
+            auction_type="".join(TYPES[i % len(TYPES)]),
+            item_count=i % 300,
+        )
+
+
+def build(cls, n: int) -> tuple[list, int]:
+    tracemalloc.start()
+    listings = [cls(**row) for row in rows(n)]
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return listings, peak
+
+
+def timed(fn, *args) -> tuple[object, float]:
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args()
+
+    legacy, legacy_peak = build(LegacyListing, args.rows)
+    compact, compact_peak = build(AuctionListing, args.rows)
+    print(f"{args.rows} listings")
+    print(f"  plain dataclass   : peak {legacy_peak / 1024 / 1024:7.1f} MB")
+    print(f"  slotted + interned: peak {compact_peak / 1024 / 1024:7.1f} MB")
+
+    old_text, old_time = timed(
+        lambda: json.dumps([asdict(l) for l in legacy], ensure_ascii=False, separators=(",", ":")))
+    new_text, new_time = timed(lambda: "[" + ",".join(map(encode_listing, compact)) + "]")
+    if old_text != new_text:
+        print("  MISMATCH: encoded output differs")
+    print(f"  asdict + json.dumps: {old_time * 1000:7.0f} ms")
+    print(f"  listing_json       : {new_time * 1000:7.0f} ms  ({old_time / new_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Benchmark: BeautifulSoup vs. the lxml parsing backends.
+
+A quick mode of benchmarks.bench_suite over the same sources: for each one
+it builds the suite's synthetic page (``--cards`` copies of the recorded
+fixture's cards; the fixture itself for sources that aren't card-based),
+runs the scraper's parser over it with every backend, checks that all
+backends produce the same listings, and reports parse time and peak RSS
+(measured in a fresh process, as the suite does):
+
+    python -m benchmarks.bench_parsing [--cards N] [--rounds N]
+"""
+
+import argparse
+
+from benchmarks.bench_suite import SOURCES, documents, format_rss, measure
+from scrapers import parsing
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    for source in SOURCES:
+        fixture, _, synthetic = documents(source, args.cards)
+        document = synthetic if synthetic is not None else fixture
+        cards = args.cards if synthetic is not None else None
+        label = f"{cards} cards" if cards else "fixture"
+        print(f"{source.name}: {label}, {len(document) / 1024:.0f} KB")
+
+        baseline = None
+        for backend in parsing.BACKENDS:
+            scraper = source.scraper()
+            scraper.PARSER_BACKEND = backend
+            listings = source.parse(scraper, document)
+            if baseline is None:
+                baseline = listings
+            elif listings != baseline:
+                print(f"  MISMATCH {backend}: output differs from {parsing.BACKENDS[0]}")
+            row = measure(source, scraper, document, cards, args.rounds)
+            print(f"  {backend:<13} {row['seconds'] * 1000:8.1f} ms  rss {format_rss(row)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+"""Offline parser benchmark suite over recorded fixtures for every source.
+
+For each of the seven sources (Ritchie Bros twice: rendered DOM and API
+JSON) the suite parses the saved page in benchmarks/fixtures/ with the
+scraper's own parsing code (no network, browser or card memo), checks the
+number of listings against the recorded expectation, then builds a
+synthetic document with ``--cards`` copies of the fixture's cards and
+measures throughput (cards/s) and memory, per parser backend. Memory is
+the peak RSS of a fresh process parsing the document once (``VmHWM``, or
+``ru_maxrss`` where there is no /proc),
+since most of a parse's memory is libxml2's trees, which tracemalloc can't
+see; ``parse_rss_mb`` is how far the parse raised it. The results are
+written as a JSON report:
+
+    python -m benchmarks.bench_suite [--cards 10000] [--backend lxml] \\
+        [--output report.json] [--compare previous.json] [--tolerance 0.2]
+
+With ``--compare`` every (source, backend, kind, cards) row is checked
+against an earlier report; the exit status is 1 if a fixture no longer parses to the
+expected count or throughput dropped by more than ``--tolerance``.
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import cycle, islice
+from typing import Callable
+
+from bs4 import BeautifulSoup
+
+from scrapers import parsing
+from scrapers.bar_none import BarNoneScraper
+from scrapers.base_scraper import AuctionListing, BaseScraper
+from scrapers.gac import GACScraper
+from scrapers.jjkane import JJKaneScraper
+from scrapers.metrics import peak_rss_mb
+from scrapers.ritchie_bros import RitchieBrosScraper
+from scrapers.the_auction_company import TheAuctionCompanyScraper
+from scrapers.vantage import VantageScraper
+from scrapers.wca import WCAScraper
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Page wrapper for the synthetic documents: the usual head, nav and scripts
+PAGE = """<!DOCTYPE html>
+<html><head><title>Auctions</title>
+<script>window.dataLayer = []; var months = "March 14, 2026";</script>
+<style>.card {{ color: red }}</style></head>
+<body><header><nav>{nav}</nav></header>
+<main>{cards}</main>
+<footer><p>Copyright</p>{nav}</footer>
+<script src="/app.js"></script></body></html>
+"""
+NAV = "".join(f'<a href="/page-{i}/" class="nav-link">Link {i}</a>' for i in range(60))
+
+RB_CARD_RE = re.compile(r"^auction-card-\d+$")
+
+
+@dataclass
+class Source:
+    name: str
+    scraper: type[BaseScraper]
+    fixture: str
+    expected: int  # listings the fixture parses to (unbounded window, default regions)
+    parse: Callable[[BaseScraper, str], list[AuctionListing]]
+    units: Callable[[str], list[str]] | None  # markup (or JSON) of each card; None: not card-based
+    build: Callable[[list[str], int], str] | None  # synthetic document with n cards
+
+
+def card_parser(selector: str) -> Callable[[BaseScraper, str], list[AuctionListing]]:
+    """Select the cards as the scraper does, pre-check them, then parse each one."""
+    def parse(scraper, html):
+        in_scope = getattr(scraper, "_card_in_scope", None)
+        cards = scraper.select_cards(html, selector)
+        listings = (scraper._parse_card(c) for c in cards if in_scope is None or in_scope(c))
+        return [listing for listing in listings if listing]
+    return parse
+
+
+def parse_rb_dom(scraper: RitchieBrosScraper, html: str) -> list[AuctionListing]:
+    soup = scraper.make_soup(html)
+    year = "2026"
+    listings = (scraper._parse_dom_card(c, year)
+                for c in soup.find_all("div", attrs={"data-testid": RB_CARD_RE})
+                if scraper._card_in_scope(c, year))
+    return [listing for listing in listings if listing]
+
+
+def parse_rb_api(scraper: RitchieBrosScraper, text: str) -> list[AuctionListing]:
+    return scraper._parse_api_response(json.loads(text))
+
+
+def html_units(selector: str) -> Callable[[str], list[str]]:
+    return lambda html: [str(el) for el in BeautifulSoup(html, "lxml").select(selector)]
+
+
+def html_page(units: list[str], n: int) -> str:
+    return PAGE.format(nav=NAV, cards="".join(islice(cycle(units), n)))
+
+
+def json_units(text: str) -> list[str]:
+    return [json.dumps(item) for item in json.loads(text)["results"]]
+
+
+def json_page(units: list[str], n: int) -> str:
+    return '{"results":[' + ",".join(islice(cycle(units), n)) + "]}"
+
+
+SOURCES = [
+    Source("Bar None", BarNoneScraper, "bar_none.html", 5,
+           card_parser("div.elementskit-post-card"),
+           html_units("div.elementskit-post-card"), html_page),
+    Source("JJ Kane", JJKaneScraper, "jjkane.html", 4,
+           card_parser("div.row.border.shadow-sm"),
+           html_units("div.row.border.shadow-sm"), html_page),
+    Source("The Auction Company", TheAuctionCompanyScraper, "the_auction_company.html", 5,
+           card_parser("ul.auclting"), html_units("ul.auclting"), html_page),
+    Source("GAC", GACScraper, "gac.html", 5,
+           card_parser("div.auction-card"), html_units("div.auction-card"), html_page),
+    Source("Ritchie Bros (DOM)", RitchieBrosScraper, "ritchie_bros.html", 4,
+           parse_rb_dom, html_units('div[data-testid^="auction-card-"]'), html_page),
+    Source("Ritchie Bros (API)", RitchieBrosScraper, "ritchie_bros_api.json", 4,
+           parse_rb_api, json_units, json_page),
+    Source("Vantage", VantageScraper, "vantage.html", 5,
+           lambda scraper, html: scraper._parse_page(html),
+           html_units("a.auction-tile"), html_page),
+    # One block of free text per page (each listing counts as a card), nothing to scale
+    Source("WCA", WCAScraper, "wca.html", 5,
+           lambda scraper, html: scraper._parse_page(html), None, None),
+]
+
+
+def measure(source: Source, scraper: BaseScraper, document: str, cards: int | None,
+            rounds: int) -> dict:
+    """Time ``rounds`` parses of ``document``, then measure the memory of one more.
+
+    ``cards`` is the number of cards in the document (None: one per listing).
+    """
+    start = time.perf_counter()
+    for _ in range(rounds):
+        listings = source.parse(scraper, document)
+    seconds = (time.perf_counter() - start) / rounds
+
+    cards = len(listings) if cards is None else cards
+    row = {
+        "cards": cards,
+        "listings": len(listings),
+        "bytes": len(document.encode("utf-8")),
+        "seconds": round(seconds, 6),
+        "cards_per_sec": round(cards / seconds, 1) if seconds else None,
+    }
+    row.update(parse_rss(source, scraper.PARSER_BACKEND, document))
+    return row
+
+
+def parse_rss(source: Source, backend: str, document: str) -> dict:
+    """Peak RSS of a fresh process parsing ``document`` once, and the parse's share of it.
+
+    In-process numbers would carry over every earlier parse's high-water mark.
+    """
+    if peak_rss_mb() is None:  # no getrusage (Windows)
+        return {"peak_rss_mb": None, "parse_rss_mb": None}
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", delete=False) as f:
+        f.write(document)
+    try:
+        probe = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_suite", "--probe", source.name, backend, f.name],
+            capture_output=True, text=True, cwd=REPO_DIR, check=True)
+    finally:
+        os.unlink(f.name)
+    return json.loads(probe.stdout.splitlines()[-1])
+
+
+def _peak_rss_mb() -> float | None:
+    # Linux keeps ru_maxrss across fork and exec, so a child would report the
+    # parent's peak; VmHWM belongs to the process's own address space
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    return peak_rss_mb()
+
+
+def _probe(name: str, backend: str, path: str) -> None:
+    """Child side of ``parse_rss``: parse the document at ``path`` and print the RSS as JSON."""
+    source = next(source for source in SOURCES if source.name == name)
+    scraper = source.scraper()
+    scraper.PARSER_BACKEND = backend
+    # Warm up on the fixture, so lazy imports and caches don't count as the parse's
+    source.parse(scraper, documents(source, 0)[0])
+    with open(path, encoding="utf-8") as f:
+        document = f.read()
+    before = _peak_rss_mb()
+    source.parse(scraper, document)
+    after = _peak_rss_mb()
+    print(json.dumps({"peak_rss_mb": after, "parse_rss_mb": round(after - before, 1)}))
+
+
+def documents(source: Source, cards: int) -> tuple[str, list[str] | None, str | None]:
+    """The source's fixture, its cards' markup and a synthetic page with ``cards`` cards.
+
+    The last two are None for sources that aren't card-based.
+    """
+    with open(os.path.join(FIXTURE_DIR, source.fixture), encoding="utf-8") as f:
+        fixture = f.read()
+    units = source.units(fixture) if source.units else None
+    synthetic = source.build(units, cards) if source.build else None
+    return fixture, units, synthetic
+
+
+def run_suite(backends: list[str], cards: int, rounds: int, synthetic_rounds: int) -> list[dict]:
+    results = []
+    for source in SOURCES:
+        fixture, units, synthetic = documents(source, cards)
+
+        for backend in backends:
+            scraper = source.scraper()
+            scraper.PARSER_BACKEND = backend
+            row = {"source": source.name, "backend": backend, "kind": "fixture",
+                   "expected": source.expected}
+            row.update(measure(source, scraper, fixture, units and len(units), rounds))
+            row["ok"] = row["listings"] == source.expected
+            results.append(row)
+            print(format_row(row), file=sys.stderr)
+
+            if synthetic is not None:
+                row = {"source": source.name, "backend": backend, "kind": "synthetic"}
+                row.update(measure(source, scraper, synthetic, cards, synthetic_rounds))
+                results.append(row)
+                print(format_row(row), file=sys.stderr)
+    return results
+
+
+def format_row(row: dict) -> str:
+    flag = "" if row.get("ok", True) else f"  MISMATCH: expected {row['expected']} listings"
+    return (f"{row['source']:<20} {row['backend']:<13} {row['kind']:<9} {row['cards']:>6} cards "
+            f"{row['cards_per_sec'] or 0:>10.0f} cards/s  rss {format_rss(row)}{flag}")
+
+
+def format_rss(row: dict) -> str:
+    if row["peak_rss_mb"] is None:
+        return "n/a"
+    return f"{row['peak_rss_mb']:7.1f} MB (parse +{row['parse_rss_mb']:.1f})"
+
+
+def compare(results: list[dict], previous: dict, tolerance: float) -> list[str]:
+    """Problems in ``results``: failed fixtures, and throughput regressions against ``previous``."""
+    problems = [f"{r['source']} [{r['backend']}]: {r['listings']} listings, expected {r['expected']}"
+                for r in results if r.get("ok") is False]
+    # Only rows measured on the same document size are comparable
+    before = {(r["source"], r["backend"], r["kind"], r["cards"]): r
+              for r in previous.get("results", [])}
+    for row in results:
+        old = before.get((row["source"], row["backend"], row["kind"], row["cards"]))
+        if not old or not old.get("cards_per_sec") or not row["cards_per_sec"]:
+            continue
+        ratio = row["cards_per_sec"] / old["cards_per_sec"]
+        if ratio < 1 - tolerance:
+            problems.append(f"{row['source']} [{row['backend']}, {row['kind']}]: "
+                            f"{old['cards_per_sec']:.0f} -> {row['cards_per_sec']:.0f} cards/s "
+                            f"({(1 - ratio) * 100:.0f}% slower)")
+    return problems
+
+
+def _commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              cwd=FIXTURE_DIR, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backend", choices=parsing.BACKENDS, action="append",
+                        help="Backend to measure (repeatable; default: all)")
+    parser.add_argument("--cards", type=int, default=10_000, help="Cards per synthetic page")
+    parser.add_argument("--rounds", type=int, default=50, help="Timed parses of each fixture")
+    parser.add_argument("--synthetic-rounds", type=int, default=1,
+                        help="Timed parses of each synthetic page")
+    parser.add_argument("--output", help="Write the JSON report here (default: stdout)")
+    parser.add_argument("--compare", help="Earlier report to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed throughput drop against --compare (default: 0.2)")
+    parser.add_argument("--probe", nargs=3, metavar=("SOURCE", "BACKEND", "PATH"),
+                        help=argparse.SUPPRESS)  # internal: see parse_rss
+    args = parser.parse_args()
+    if args.probe:
+        _probe(*args.probe)
+        return
+
+    results = run_suite(args.backend or list(parsing.BACKENDS), args.cards,
+                        args.rounds, args.synthetic_rounds)
+    report = {
+        "generated": datetime.now().isoformat(timespec="seconds"),
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "synthetic_cards": args.cards,
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    previous = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)
+    problems = compare(results, previous, args.tolerance)
+    for problem in problems:
+        print(f"REGRESSION {problem}", file=sys.stderr)
+    raise SystemExit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,17 +3,43 @@
  *
  * Loads auction data from JSON, renders cards with countdown timers,
  * and provides source filtering + text search.
+ *
+ * Data comes in per-source, per-month shards listed in data/manifest.json:
+ * the shards up to the current month are loaded first and rendered, the rest
+ * follow in the background (or right away when a filter or search needs
+ * them). Without a manifest the single data/auctions.json is used.
+ *
+ * Search runs against a token-prefix index built once when the data loads,
+ * so a keystroke costs a few map lookups instead of a scan of every listing.
+ *
+ * Cards are keyed by listing ID: each one is built once and its DOM node is
+ * reused and reordered as the filter changes. The periodic refresh only
+ * touches the countdown badges.
  */
 
 (function () {
     "use strict";
 
-    const DATA_URL = "data/auctions.json";
+    const DATA_URL = "data/auctions.json"; // fallback when there is no manifest
+    const MANIFEST_URL = "data/manifest.json";
     const REFRESH_INTERVAL_MS = 60_000; // Recalculate countdowns every 60s
+    const SEARCH_DEBOUNCE_MS = 150;
+    const SEARCH_FIELDS = ["title", "location", "notes", "source", "auction_type"];
+    const MAX_PREFIX = 12; // longer query words are checked against the listing's tokens
 
     let auctionData = [];
     let currentFilter = "all";
     let currentSearch = "";
+    let searchIndex = null;
+
+    let manifest = null;
+    const shardLoads = new Map(); // shard URL -> Promise of { url, auctions }
+    const mergedShards = new Set();
+
+    // Listing ID -> { auction, el, badge } for every card built so far
+    const cards = new Map();
+    let visibleCards = [];
+    let emptyStateEl = null;
 
     // --- DOM References ---
     const container = document.getElementById("auctions-container");
@@ -25,13 +51,7 @@
     // --- Init ---
     async function init() {
         try {
-            const resp = await fetch(DATA_URL);
-            if (!resp.ok) throw new Error(`HTTP ${resp.status}`);
-            const json = await resp.json();
-
-            auctionData = json.auctions || [];
-            updateLastUpdated(json.last_updated);
-            render();
+            await loadInitialData();
         } catch (err) {
             container.innerHTML =
                 '<div class="error-state">Unable to load auction data. Please try again later.</div>';
@@ -42,15 +62,88 @@
         sourceFilter.addEventListener("change", (e) => {
             currentFilter = e.target.value;
             render();
+            if (currentFilter !== "all") loadShardsWhere((s) => s.source === currentFilter);
         });
 
-        searchInput.addEventListener("input", (e) => {
+        searchInput.addEventListener("input", debounce((e) => {
             currentSearch = e.target.value.toLowerCase().trim();
             render();
-        });
+            if (currentSearch) loadShardsWhere(() => true);
+        }, SEARCH_DEBOUNCE_MS));
 
         // Auto-refresh countdowns
-        setInterval(render, REFRESH_INTERVAL_MS);
+        setInterval(updateCountdowns, REFRESH_INTERVAL_MS);
+    }
+
+    // --- Data loading ---
+    async function fetchJson(url) {
+        const resp = await fetch(url);
+        if (!resp.ok) throw new Error(`HTTP ${resp.status} for ${url}`);
+        return resp.json();
+    }
+
+    async function loadInitialData() {
+        try {
+            manifest = await fetchJson(MANIFEST_URL);
+        } catch (err) {
+            const json = await fetchJson(DATA_URL);
+            mergeAuctions(json.auctions || []);
+            updateLastUpdated(json.last_updated);
+            render();
+            return;
+        }
+
+        updateLastUpdated(manifest.last_updated);
+        const shards = manifest.shards || [];
+        const now = new Date();
+        const thisMonth = `${now.getFullYear()}-${String(now.getMonth() + 1).padStart(2, "0")}`;
+        const firstMonth = shards.length && shards[0].month > thisMonth ? shards[0].month : thisMonth;
+
+        await loadShards(shards.filter((s) => s.month <= firstMonth));
+        render();
+
+        // Everything else once the first view is on screen
+        const idle = window.requestIdleCallback || ((fn) => setTimeout(fn, 0));
+        idle(() => loadShardsWhere(() => true));
+    }
+
+    function loadShard(shard) {
+        let promise = shardLoads.get(shard.url);
+        if (!promise) {
+            // The hash changes with the content, so unchanged shards stay cached
+            promise = fetchJson(`data/${shard.url}?v=${shard.hash}`)
+                .then((json) => ({ url: shard.url, auctions: json.auctions || [] }))
+                .catch((err) => {
+                    shardLoads.delete(shard.url); // retry on the next request
+                    throw err;
+                });
+            shardLoads.set(shard.url, promise);
+        }
+        return promise;
+    }
+
+    async function loadShards(shards) {
+        const loaded = await Promise.all(shards.map(loadShard));
+        const fresh = loaded.filter((shard) => !mergedShards.has(shard.url));
+        fresh.forEach((shard) => mergedShards.add(shard.url));
+        if (fresh.length) mergeAuctions(fresh.flatMap((shard) => shard.auctions));
+        return fresh.length > 0;
+    }
+
+    // Load the matching shards not loaded yet, then re-render
+    function loadShardsWhere(predicate) {
+        if (!manifest) return;
+        const wanted = (manifest.shards || []).filter((s) => predicate(s) && !mergedShards.has(s.url));
+        if (!wanted.length) return;
+        loadShards(wanted)
+            .then((changed) => { if (changed) render(); })
+            .catch((err) => console.error("Failed to load auction shard:", err));
+    }
+
+    function mergeAuctions(auctions) {
+        auctionData = auctionData.concat(auctions);
+        auctionData.sort((a, b) => (a.date < b.date ? -1 : a.date > b.date ? 1 : 0));
+        searchIndex = buildSearchIndex(auctionData);
     }
 
     // --- Countdown ---
@@ -69,22 +162,85 @@
         return { text: `${diffDays} DAYS AWAY`, cssClass: "later" };
     }
 
-    // --- Filtering ---
-    function getFilteredAuctions() {
-        return auctionData.filter((a) => {
-            // Source filter
-            if (currentFilter !== "all" && a.source !== currentFilter) return false;
-
-            // Text search
-            if (currentSearch) {
-                const haystack = [a.title, a.location, a.notes, a.source, a.auction_type]
-                    .join(" ")
-                    .toLowerCase();
-                if (!haystack.includes(currentSearch)) return false;
+    // --- Search index ---
+    function tokenize(text) {
+        return String(text || "").toLowerCase().split(/[^\p{L}\p{N}]+/u).filter(Boolean);
+    }
+
+    // prefix -> ascending positions in auctionData, plus a source facet
+    function buildSearchIndex(auctions) {
+        const prefixes = new Map();
+        const bySource = new Map();
+        const tokens = [];
+
+        auctions.forEach((a, pos) => {
+            const docTokens = [...new Set(SEARCH_FIELDS.flatMap((f) => tokenize(a[f])))];
+            tokens.push(docTokens);
+
+            const docPrefixes = new Set();
+            for (const token of docTokens) {
+                for (let len = 1; len <= Math.min(token.length, MAX_PREFIX); len++) {
+                    docPrefixes.add(token.slice(0, len));
+                }
+            }
+            for (const prefix of docPrefixes) {
+                let list = prefixes.get(prefix);
+                if (!list) prefixes.set(prefix, (list = []));
+                list.push(pos);
             }
 
-            return true;
+            let list = bySource.get(a.source);
+            if (!list) bySource.set(a.source, (list = []));
+            list.push(pos);
         });
+        return { prefixes, bySource, tokens };
+    }
+
+    function intersect(a, b) {
+        const out = [];
+        let i = 0;
+        let j = 0;
+        while (i < a.length && j < b.length) {
+            if (a[i] === b[j]) {
+                out.push(a[i]);
+                i++;
+                j++;
+            } else if (a[i] < b[j]) {
+                i++;
+            } else {
+                j++;
+            }
+        }
+        return out;
+    }
+
+    // Positions of listings where every query word starts some word of the listing
+    function searchPositions(query, source) {
+        const lists = [];
+        if (source !== "all") lists.push(searchIndex.bySource.get(source) || []);
+
+        const words = tokenize(query);
+        for (const word of words) {
+            lists.push(searchIndex.prefixes.get(word.slice(0, MAX_PREFIX)) || []);
+        }
+        if (lists.length === 0) return null;
+
+        lists.sort((a, b) => a.length - b.length);
+        let positions = lists.reduce(intersect);
+
+        const longWords = words.filter((w) => w.length > MAX_PREFIX);
+        if (longWords.length) {
+            positions = positions.filter((pos) => longWords.every(
+                (w) => searchIndex.tokens[pos].some((t) => t.startsWith(w))
+            ));
+        }
+        return positions;
+    }
+
+    // --- Filtering ---
+    function getFilteredAuctions() {
+        const positions = searchPositions(currentSearch, currentFilter);
+        return positions ? positions.map((pos) => auctionData[pos]) : auctionData;
     }
 
     // --- Rendering ---
@@ -93,21 +249,69 @@
 
         auctionCountEl.textContent = `${filtered.length} auction${filtered.length !== 1 ? "s" : ""}`;
 
-        if (filtered.length === 0) {
-            container.innerHTML = '<div class="empty-state">No upcoming auctions found.</div>';
+        visibleCards = filtered.map(getCard);
+        if (visibleCards.length === 0) {
+            if (!emptyStateEl) {
+                emptyStateEl = document.createElement("div");
+                emptyStateEl.className = "empty-state";
+                emptyStateEl.textContent = "No upcoming auctions found.";
+            }
+            container.replaceChildren(emptyStateEl);
             return;
         }
 
-        container.innerHTML = filtered.map(renderCard).join("");
+        // Walk the container in step with the wanted order, moving only the
+        // nodes that are out of place, then drop whatever is left over
+        let cursor = container.firstChild;
+        for (const card of visibleCards) {
+            if (card.el === cursor) {
+                cursor = cursor.nextSibling;
+            } else {
+                container.insertBefore(card.el, cursor);
+            }
+        }
+        while (cursor) {
+            const next = cursor.nextSibling;
+            container.removeChild(cursor);
+            cursor = next;
+        }
+        updateCountdowns();
+    }
+
+    function cardKey(auction) {
+        return auction.id || auction.url;
+    }
+
+    function getCard(auction) {
+        const key = cardKey(auction);
+        let card = cards.get(key);
+        if (!card || card.auction !== auction) {
+            const template = document.createElement("template");
+            template.innerHTML = renderCard(auction).trim();
+            const el = template.content.firstElementChild;
+            card = { auction, el, badge: el.querySelector(".countdown-badge"), countdown: null };
+            cards.set(key, card);
+        }
+        return card;
+    }
+
+    // Only the badges change over time; touch the DOM when their text does
+    function updateCountdowns() {
+        for (const card of visibleCards) {
+            const countdown = getCountdown(card.auction.date);
+            if (card.countdown && card.countdown.text === countdown.text) continue;
+            card.badge.textContent = countdown.text;
+            card.badge.className = `countdown-badge ${countdown.cssClass}`;
+            card.countdown = countdown;
+        }
     }
 
     function renderCard(auction) {
-        const countdown = getCountdown(auction.date);
         const itemCountText = auction.item_count != null ? `${auction.item_count} lots` : "";
 
         return `
         <article class="auction-card">
-            <span class="countdown-badge ${countdown.cssClass}">${countdown.text}</span>
+            <span class="countdown-badge"></span>
             <h2 class="card-title">
                 <a href="${escapeHtml(auction.url)}" target="_blank" rel="noopener">${escapeHtml(auction.title)}</a>
             </h2>
@@ -134,11 +338,19 @@
     }
 
     // --- Helpers ---
+    const HTML_ESCAPES = { "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;" };
+
     function escapeHtml(str) {
         if (!str) return "";
-        const div = document.createElement("div");
-        div.textContent = str;
-        return div.innerHTML;
+        return String(str).replace(/[&<>"']/g, (ch) => HTML_ESCAPES[ch]);
+    }
+
+    function debounce(fn, waitMs) {
+        let timer = null;
+        return (...args) => {
+            clearTimeout(timer);
+            timer = setTimeout(() => fn(...args), waitMs);
+        };
     }
 
     function updateLastUpdated(isoTimestamp) {
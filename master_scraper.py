@@ -1,17 +1,56 @@
 """Master scraper orchestrator.
 
 Runs all auction scrapers, combines results, sorts by date,
-filters out past auctions, and writes to docs/data/auctions.json.
+filters out past auctions, and writes to docs/data/auctions.json (plus the
+delta feed docs/data/auctions.delta.json and the per-source, per-month
+shards under docs/data/shards/ listed in docs/data/manifest.json).
+
+Scrapers run concurrently on daemon threads so the run takes about as long
+as the slowest source. Each source gets its own time budget
+(``BaseScraper.TIME_BUDGET``); a source that blows its budget is abandoned
+and counted as failed without holding up the others. A source that fails
+run after run is skipped for a while by ``scrapers.circuit_breaker``. The
+Selenium scrapers share one Chrome, each leasing a WebDriver session on it
+from ``scrapers.browser_pool`` (up to one per browser scraper by default,
+``--browsers``); the session of a scraper that is abandoned is quit, its tab
+closed, and its slot handed back to the pool.
+
+Every scraper gets the run's ``scrapers.query.RunQuery`` (date window and
+regions) and drops out-of-scope auctions as early as it can. Scrapers stream
+their listings, and each one goes through the ``scrapers.pipeline`` stages
+(SQLite store, date window, dedupe) as soon as it arrives, so a source that
+fails part way still contributes what it found.
+
+Every source's timings, bytes downloaded, card counts and outcome (see
+``scrapers.metrics``) are written to a JSON run report under
+``.cache/reports/`` and kept in the listing store's ``source_runs`` table;
+``--profile DIR`` also dumps a cProfile of each source's thread.
 """
 
-import json
+import argparse
+import cProfile
 import logging
 import os
+import queue
 import sys
-from dataclasses import asdict
-from datetime import datetime, timedelta
+import threading
+import time
+from collections import Counter
+from datetime import datetime
 
-from scrapers.base_scraper import AuctionListing
+from scrapers.base_scraper import AuctionListing, BaseScraper
+from scrapers.browser_pool import BROWSER_POOL
+from scrapers.circuit_breaker import CircuitBreaker
+from scrapers.delta import DeltaFeed, delta_path, listing_id
+from scrapers.http_client import HTTP_CLIENT
+from scrapers.metrics import RunReport
+from scrapers.listing_json import encode_listing
+from scrapers.output import EncodedArray, OutputWriter
+from scrapers.shards import write_sharded
+from scrapers.store import STORE_PATH, ListingStore
+from scrapers.parsing import BACKENDS
+from scrapers.pipeline import CollectStage, DedupeStage, Pipeline, StoreStage, WindowStage
+from scrapers.query import DEFAULT_REGIONS, STATE_NAMES, RunQuery
 from scrapers.the_auction_company import TheAuctionCompanyScraper
 from scrapers.bar_none import BarNoneScraper
 from scrapers.ritchie_bros import RitchieBrosScraper
@@ -30,6 +69,17 @@ SCRAPERS = [
     JJKaneScraper,
 ]
 
+# Number of scrapers allowed to run at once. 1 runs them one after another.
+MAX_WORKERS = len(SCRAPERS)
+
+# WebDriver sessions on the shared Chrome: one per browser scraper, so a hung
+# site can't make the others wait
+BROWSER_SESSIONS = sum(scraper.USES_BROWSER for scraper in SCRAPERS)
+
+# Published window: auctions from GRACE_DAYS ago up to WINDOW_DAYS ahead
+GRACE_DAYS = 3
+WINDOW_DAYS = 30
+
 OUTPUT_PATH = os.path.join(os.path.dirname(__file__), "docs", "data", "auctions.json")
 WEBSITE_OUTPUT_PATH = os.path.join(
     os.path.dirname(__file__), "..", "SealcoatSAS Website",
@@ -37,77 +87,241 @@ WEBSITE_OUTPUT_PATH = os.path.join(
 )
 
 
-def run_all_scrapers() -> list[AuctionListing]:
-    """Run every registered scraper and collect results."""
-    all_auctions = []
-    succeeded = 0
-    failed = 0
+# Queue marker a worker sends after its scraper's last listing
+_FINISHED = object()
+
+
+def _run_one(scraper: BaseScraper, done: queue.Queue, profile_dir: str | None = None) -> None:
+    """Worker thread body: stream one scraper's listings onto the done queue."""
+    profiler = _start_profiler(scraper) if profile_dir else None
+    error = None
+    try:
+        for listing in scraper.stream():
+            done.put((scraper, listing, None))
+    except Exception as e:
+        error = e
+    finally:
+        if profiler:
+            profiler.disable()
+            path = os.path.join(profile_dir, f"{scraper.cache_name}.prof")
+            try:
+                os.makedirs(profile_dir, exist_ok=True)
+                profiler.dump_stats(path)
+                scraper.metrics.profile = path
+            except OSError as e:
+                logging.warning(f"Could not write profile for {scraper.source_name}: {e}")
+    done.put((scraper, _FINISHED, error))
+
+
+def _start_profiler(scraper: BaseScraper) -> cProfile.Profile | None:
+    """Profile the calling thread, or None if another profiler already is (Python 3.12+)."""
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        logging.warning(f"Not profiling {scraper.source_name}: only one profiler can run "
+                        f"at a time on this Python, use --workers 1")
+        return None
+    return profiler
+
 
-    for scraper_cls in SCRAPERS:
-        scraper = scraper_cls()
+def run_all_scrapers(pipeline: Pipeline, query: RunQuery, max_workers: int = MAX_WORKERS,
+                     report: RunReport | None = None, profile_dir: str | None = None,
+                     breaker: CircuitBreaker | None = None) -> int:
+    """Run every registered scraper for ``query``, pushing listings into ``pipeline``.
+
+    Listings are pushed as they arrive. At most ``max_workers`` scrapers run
+    at once. Each scraper's budget starts when it is launched; if it has not
+    finished by then it is abandoned (its daemon thread is left to die with
+    the process, and anything it yields later is ignored) and its slot is
+    given to the next scraper in line. Its browser session, if it holds one,
+    is revoked so the other browser scrapers can have it. Listings a scraper
+    produced before failing or timing out are kept.
+
+    A scraper only counts as succeeded if its stream finished cleanly
+    (``metrics.status == "ok"``); one that failed, failed part way or timed
+    out does not. With a ``breaker`` each outcome is recorded in it, sources
+    whose circuit is open are skipped, and the rest run in order of their
+    recent failures.
+
+    Each scraper's metrics are added to ``report`` once it finishes, times
+    out or is skipped; with ``profile_dir`` each one's thread is profiled
+    into ``<profile_dir>/<source>.prof``. Returns the number of listings
+    received.
+    """
+    outcomes: Counter = Counter()  # metrics status -> number of sources
+
+    def settle(scraper: BaseScraper) -> None:
+        status = scraper.metrics.status
+        outcomes[status] += 1
+        if breaker:
+            # Listings from a source that broke part way still count as a working source
+            breaker.record(scraper.source_name, status in ("ok", "partial"), scraper.metrics.error)
+        if report:
+            report.add(scraper.metrics)
+
+    waiting = []
+    for scraper in (scraper_cls(query) for scraper_cls in SCRAPERS):
+        if breaker and not breaker.allow(scraper.source_name):
+            until = breaker.open_until(scraper.source_name)
+            logging.warning(f"{scraper.source_name} SKIPPED: failed "
+                            f"{breaker.failures(scraper.source_name)} runs in a row, "
+                            f"circuit open until {until:%Y-%m-%d %H:%M}")
+            scraper.metrics.finish("skipped", f"circuit open until {until.isoformat()}")
+            outcomes["skipped"] += 1
+            if report:
+                report.add(scraper.metrics)
+            continue
+        waiting.append(scraper)
+    if breaker:
+        # Sources that have been failing go last, so they don't hold up healthy ones' slots
+        waiting.sort(key=lambda scraper: breaker.failures(scraper.source_name))
+    running: dict[BaseScraper, float] = {}  # scraper -> monotonic deadline
+    threads: dict[BaseScraper, threading.Thread] = {}
+    done: queue.Queue = queue.Queue()
+    max_workers = max(1, max_workers)
+
+    while waiting or running:
+        while waiting and len(running) < max_workers:
+            scraper = waiting.pop(0)
+            running[scraper] = time.monotonic() + scraper.TIME_BUDGET
+            threads[scraper] = threading.Thread(
+                target=_run_one, args=(scraper, done, profile_dir),
+                name=f"scraper-{scraper.source_name}", daemon=True,
+            )
+            threads[scraper].start()
+
+        timeout = max(0.0, min(running.values()) - time.monotonic())
         try:
-            results = scraper.scrape()
-            all_auctions.extend(results)
-            succeeded += 1
-        except Exception as e:
-            logging.error(f"{scraper.source_name} FAILED: {e}")
-            failed += 1
-
-    logging.info(f"Scraping complete: {succeeded}/{succeeded + failed} scrapers succeeded, "
-                 f"{len(all_auctions)} total auctions found")
-    return all_auctions
-
-
-def deduplicate(auctions: list[AuctionListing]) -> list[AuctionListing]:
-    """Remove duplicate auctions based on URL."""
-    seen = set()
-    unique = []
-    for a in auctions:
-        key = a.url.rstrip("/")
-        if key not in seen:
-            seen.add(key)
-            unique.append(a)
-    removed = len(auctions) - len(unique)
-    if removed:
-        logging.info(f"Removed {removed} duplicate auctions")
-    return unique
-
-
-def filter_and_sort(auctions: list[AuctionListing]) -> list[AuctionListing]:
-    """Remove past auctions, deduplicate, and sort by date ascending."""
-    grace = (datetime.now() - timedelta(days=3)).strftime("%Y-%m-%d")
-    cutoff = (datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d")
-    upcoming = [a for a in auctions if grace <= a.date <= cutoff]
-    upcoming = deduplicate(upcoming)
-    upcoming.sort(key=lambda a: a.date)
-
-    removed = len(auctions) - len(upcoming)
-    if removed:
-        logging.info(f"Filtered out {removed} past/duplicate auctions")
-
-    return upcoming
-
-
-def write_json(auctions: list[AuctionListing]) -> None:
-    """Write auction data to the JSON file consumed by the frontend."""
+            scraper, item, error = done.get(timeout=timeout)
+        except queue.Empty:
+            now = time.monotonic()
+            for scraper, deadline in list(running.items()):
+                if deadline <= now:
+                    del running[scraper]
+                    logging.error(f"{scraper.source_name} TIMED OUT after {scraper.TIME_BUDGET}s")
+                    scraper.metrics.finish("timed out", f"no result within {scraper.TIME_BUDGET}s")
+                    if scraper.USES_BROWSER:
+                        BROWSER_POOL.revoke(threads[scraper])
+                    settle(scraper)
+            continue
+
+        if scraper not in running:
+            # Reported after its budget ran out; it was already counted as failed
+            continue
+        if item is not _FINISHED:
+            pipeline.push(item)
+            continue
+        del running[scraper]
+
+        if error is not None:
+            logging.error(f"{scraper.source_name} FAILED: {error}")
+            scraper.metrics.finish("failed", str(error))
+        settle(scraper)
+
+    if breaker:
+        breaker.save()
+    total = sum(outcomes.values())
+    others = ", ".join(f"{n} {status}" for status, n in outcomes.items() if status != "ok")
+    logging.info(f"Scraping complete: {outcomes['ok']}/{total} scrapers succeeded"
+                 + (f" ({others})" if others else "")
+                 + f", {pipeline.received} total auctions found")
+    return pipeline.received
+
+
+def build_pipeline(store: ListingStore, query: RunQuery) -> tuple[Pipeline, CollectStage]:
+    """Store every listing, then keep the in-window, deduplicated ones for the JSON output.
+
+    Of two duplicates the listing from the source earlier in SCRAPERS is kept.
+    """
+    collector = CollectStage()
+    priority = [scraper_cls(query).source_name for scraper_cls in SCRAPERS]
+    pipeline = Pipeline(StoreStage(store), WindowStage(query.start, query.end),
+                        DedupeStage(priority), collector)
+    return pipeline, collector
+
+
+def write_json(auctions: list[AuctionListing], minified: bool = False) -> bool:
+    """Write auction data to the JSON files consumed by the frontend.
+
+    Each listing gets a stable ``id``; when the set changed since the last
+    run the snapshot's ``sequence`` is bumped and the change is appended to
+    the delta feed next to it (see ``scrapers.delta``). Files whose content
+    (ignoring ``last_updated``) is unchanged are left alone. Returns True if
+    anything was written.
+    """
+    # Encoded once, straight from the listings, for the snapshot, delta and shards
+    ids = [listing_id(a.source, a.url) for a in auctions]
+    encoded = [encode_listing(a, id_) for a, id_ in zip(auctions, ids)]
+    feed = DeltaFeed(OUTPUT_PATH)
+    feed.update(dict(zip(ids, encoded)))
+
     output = {
         "last_updated": datetime.now().isoformat(timespec="seconds"),
+        "sequence": feed.sequence,
         "total_count": len(auctions),
-        "auctions": [asdict(a) for a in auctions],
+        "auctions": EncodedArray(encoded),
     }
+    paths = [OUTPUT_PATH, WEBSITE_OUTPUT_PATH]
+    written = OutputWriter(paths, minified=minified).write(output)
+    # Written second, so a client never sees a delta newer than the snapshot
+    OutputWriter([delta_path(p) for p in paths]).write(feed.document())
+    # Per-source, per-month shards + manifest that the docs frontend loads lazily
+    written |= write_sharded(auctions, encoded, os.path.dirname(OUTPUT_PATH),
+                             output["last_updated"], feed.sequence)
+    return written
+
+
+def _regions(value: str) -> tuple[str, ...]:
+    codes = tuple(code.strip().upper() for code in value.split(",") if code.strip())
+    unknown = [code for code in codes if code not in STATE_NAMES]
+    if not codes or unknown:
+        raise argparse.ArgumentTypeError(f"expected US state codes, got {value!r}")
+    return codes
 
-    for path in [OUTPUT_PATH, WEBSITE_OUTPUT_PATH]:
-        try:
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(output, f, indent=2, ensure_ascii=False)
-            logging.info(f"Wrote {len(auctions)} auctions to {path}")
-        except OSError as e:
-            logging.warning(f"Could not write to {path}: {e}")
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Run all auction scrapers.")
+    parser.add_argument(
+        "--workers", type=int, default=MAX_WORKERS,
+        help=f"Scrapers to run at once (default: {MAX_WORKERS}; 1 = sequential)",
+    )
+    parser.add_argument(
+        "--browsers", type=int, default=BROWSER_SESSIONS,
+        help="WebDriver sessions the browser scrapers may lease on the one Chrome "
+             f"(default: {BROWSER_SESSIONS}, one per browser scraper)",
+    )
+    parser.add_argument(
+        "--parser", choices=BACKENDS, default=BaseScraper.PARSER_BACKEND,
+        help=f"HTML parsing backend (default: {BaseScraper.PARSER_BACKEND})",
+    )
+    parser.add_argument(
+        "--minified", action="store_true",
+        help="Also write a minified auctions.min.json next to each output file",
+    )
+    parser.add_argument(
+        "--regions", type=_regions, default=DEFAULT_REGIONS,
+        help=f"Comma-separated state codes to keep (default: {','.join(DEFAULT_REGIONS)})",
+    )
+    parser.add_argument(
+        "--store", default=STORE_PATH,
+        help="SQLite listing store (default: .cache/listings.sqlite3)",
+    )
+    parser.add_argument(
+        "--reset-breaker", action="store_true",
+        help="Forget past failures and run every source, even ones whose circuit is open",
+    )
+    parser.add_argument(
+        "--profile", metavar="DIR",
+        help="Dump a cProfile of each source's scrape into DIR (<source>.prof)",
+    )
+    return parser.parse_args(argv)
 
 
 def main():
     """Main entry point."""
+    args = parse_args()
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
@@ -118,9 +332,30 @@ def main():
     logging.info("Auction Tracker - Starting scrape run")
     logging.info("=" * 50)
 
-    all_auctions = run_all_scrapers()
-    upcoming = filter_and_sort(all_auctions)
-    write_json(upcoming)
+    BROWSER_POOL.max_sessions = max(1, args.browsers)
+    BaseScraper.PARSER_BACKEND = args.parser
+    query = RunQuery.upcoming(GRACE_DAYS, WINDOW_DAYS, args.regions)
+    logging.info(f"Looking for auctions {query.start}..{query.end} in {', '.join(query.regions)}")
+    report = RunReport(query.key)
+    breaker = CircuitBreaker()
+    if args.reset_breaker:
+        breaker.reset()
+    with ListingStore(args.store) as store:
+        pipeline, collector = build_pipeline(store, query)
+        try:
+            run_all_scrapers(pipeline, query, args.workers, report, args.profile, breaker)
+        finally:
+            BROWSER_POOL.close()
+            HTTP_CLIENT.close()
+        pipeline.close()
+        report.set_published(Counter(listing.source for listing in collector.listings))
+        store.record_sources(report.sources.values())
+    report.log_summary()
+    path = report.write()
+    if path:
+        logging.info(f"Run report written to {path}")
+    upcoming = collector.sorted()
+    write_json(upcoming, minified=args.minified)
 
     logging.info("=" * 50)
     logging.info(f"Done! {len(upcoming)} upcoming auctions saved.")
@@ -1 +1,6 @@
 """Auction site scrapers package."""
+
+import os
+
+# Run-to-run state (driver paths, HTTP cache, previous results) lives here
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache")
@@ -12,8 +12,7 @@ DOM Structure (discovered 2026-03-11):
 """
 
 import re
-import requests
-from bs4 import BeautifulSoup
+from typing import Iterable
 
 from scrapers.base_scraper import BaseScraper, AuctionListing
 
@@ -28,27 +27,30 @@ class BarNoneScraper(BaseScraper):
     def base_url(self) -> str:
         return "https://www.barnoneauction.com/auctions"
 
-    def _scrape_impl(self) -> list[AuctionListing]:
-        resp = requests.get(self.base_url, headers={
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        }, timeout=30)
-        resp.raise_for_status()
+    def _scrape_impl(self) -> Iterable[AuctionListing]:
+        resp = self.fetch()
+        previous = self.previous_results()
+        if previous is not None:
+            return previous
 
-        soup = BeautifulSoup(resp.text, "lxml")
-        listings = []
-
-        cards = soup.select("div.elementskit-post-card")
+        cards = self.select_cards(resp.text, "div.elementskit-post-card")
         self.logger.info(f"Found {len(cards)} auction cards")
 
-        for card in cards:
-            try:
-                listing = self._parse_card(card)
-                if listing:
-                    listings.append(listing)
-            except Exception as e:
-                self.logger.warning(f"Failed to parse card: {e}")
+        return self.iter_cards(cards, self._parse_card, in_scope=self._card_in_scope)
 
-        return listings
+    def _card_in_scope(self, card) -> bool:
+        """Date and location check that reads just the title link and category span."""
+        title_el = card.select_one(".entry-title a")
+        if title_el:
+            try:
+                iso_date, _ = self.parse_date(title_el.get_text(strip=True))
+            except ValueError:
+                iso_date = None
+            if iso_date and not self.query.in_window(iso_date):
+                return False
+        # The sales are all over the West (e.g. "Portland, Oregon")
+        loc_el = card.select_one("span.post-cat a")
+        return loc_el is None or self.query.in_region(loc_el.get_text(strip=True))
 
     def _parse_card(self, card) -> AuctionListing | None:
         # URL from the title link
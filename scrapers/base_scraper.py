@@ -1,16 +1,40 @@
 """Base scraper class and shared data model for all auction scrapers."""
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, asdict, field
-from datetime import datetime
-from typing import Optional
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+import hashlib
+import json
 import logging
+import os
+import re
+import sys
 import time
 
+import requests
 
-@dataclass
+from scrapers import CACHE_DIR, dates, parsing
+from scrapers.card_memo import CardMemo
+from scrapers.listing_json import encode_listing
+from scrapers.http_client import HTTP_CLIENT
+from scrapers.metrics import SourceMetrics, current
+from scrapers.query import RunQuery
+from scrapers.retry import backoff_delay, call_with_retry, is_transient
+
+# Last successful results per source, reused when its pages haven't changed
+RESULTS_DIR = os.path.join(CACHE_DIR, "results")
+
+
+@dataclass(slots=True)
 class AuctionListing:
-    """Unified auction listing data model used by all scrapers."""
+    """Unified auction listing data model used by all scrapers.
+
+    Slotted (no per-instance ``__dict__``), and the low-cardinality string
+    fields are interned so every listing from the same source, place or day
+    shares one string object. Use ``to_dict`` (shallow) rather than
+    ``dataclasses.asdict`` (deep copy), or scrapers.listing_json to encode
+    listings without building dicts at all.
+    """
     title: str
     date: str                       # ISO 8601: "2026-04-10"
     date_display: str               # Human-readable: "Saturday, April 10, 2026"
@@ -21,19 +45,20 @@ class AuctionListing:
     item_count: Optional[int] = None
     notes: str = ""
 
+    def __post_init__(self):
+        self.source = _intern(self.source)
+        self.auction_type = _intern(self.auction_type)
+        self.location = _intern(self.location)
+        self.date = _intern(self.date)
+        self.date_display = _intern(self.date_display)
+
+    def to_dict(self) -> dict:
+        """Shallow field -> value dict (the fields are all immutable scalars)."""
+        return {name: getattr(self, name) for name in self.__slots__}
 
-# Common date format patterns found across auction sites
-DATE_FORMATS = [
-    "%B %d, %Y",           # March 14, 2026
-    "%b %d, %Y",           # Mar 14, 2026
-    "%m/%d/%Y",            # 03/14/2026
-    "%Y-%m-%d",            # 2026-03-14
-    "%A, %B %d, %Y",       # Saturday, March 14, 2026
-    "%B %dst, %Y",         # March 1st, 2026
-    "%B %dnd, %Y",         # March 2nd, 2026
-    "%B %drd, %Y",         # March 3rd, 2026
-    "%B %dth, %Y",         # March 14th, 2026
-]
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
 
 
 class BaseScraper(ABC):
@@ -42,15 +67,32 @@ class BaseScraper(ABC):
     Subclasses must implement:
         - source_name (property): Short display name
         - base_url (property): URL to scrape
-        - scrape(): Returns list of AuctionListing
+        - _scrape_impl(): Returns (or yields) AuctionListing objects
+
+    ``stream()`` yields listings as the scraper produces them; ``scrape()``
+    collects them into a list. Only listings within ``self.query`` (see
+    scrapers.query) are kept; subclasses should check it as early as they can.
+    Each stream records its timings and counts in ``self.metrics`` (see
+    scrapers.metrics).
     """
 
-    MAX_RETRIES = 2
-    RETRY_DELAY = 5  # seconds
+    MAX_RETRIES = 2  # attempts at the whole scrape; see stream()
+    FETCH_RETRIES = 3  # tries of each request or page load; see retry_fetch()
+    RETRY_DELAY = 2  # seconds; base of the exponential backoff (with jitter)
+    MAX_RETRY_DELAY = 30  # seconds
+    TIME_BUDGET = 90  # seconds the orchestrator waits for scrape() before giving up
+    USES_BROWSER = False  # leases tabs from scrapers.browser_pool
+    PARSER_VERSION = 3  # bump when parsing changes so memoized cards and saved results are redone
+    PARSER_BACKEND = "bs4"  # one of parsing.BACKENDS; master_scraper --parser sets it
 
-    def __init__(self):
+    def __init__(self, query: RunQuery | None = None):
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.query = query or RunQuery()
         self.results: list[AuctionListing] = []
+        self._deadline: float | None = None  # monotonic end of TIME_BUDGET, set by stream()
+        self.metrics = SourceMetrics(self.source_name)
+        # url -> body hash of every page fetched during the current attempt
+        self._page_hashes: dict[str, str] = {}
 
     @property
     @abstractmethod
@@ -63,30 +105,235 @@ class BaseScraper(ABC):
         """Primary URL to scrape."""
 
     @abstractmethod
-    def _scrape_impl(self) -> list[AuctionListing]:
-        """Internal scrape logic. Subclasses implement this instead of scrape()."""
+    def _scrape_impl(self) -> Iterable[AuctionListing]:
+        """Internal scrape logic. Subclasses implement this instead of scrape().
+
+        May return a list or be a generator; a generator lets the orchestrator
+        process listings while later cards and pages are still being parsed.
+        """
 
     def scrape(self) -> list[AuctionListing]:
-        """Execute the scrape with retry logic. Returns listings or empty list on failure."""
-        for attempt in range(1, self.MAX_RETRIES + 1):
-            try:
+        """Execute the scrape with retry logic. Returns listings or empty list on failure.
+
+        ``self.metrics.status`` tells an empty result apart from a failure.
+        """
+        return list(self.stream())
+
+    def stream(self) -> Iterator[AuctionListing]:
+        """Yield listings as they are produced, with retry logic.
+
+        Failing requests and page loads are retried in place (``retry_fetch``),
+        so a whole attempt is only repeated, after a jittered exponential
+        backoff, for a transient error nothing retried yet, such as the
+        browser session dying. Parse errors and permanent errors (a 404) are not
+        retried: the same input fails the same way. An attempt that fails
+        part way is not retried either (its listings have already been
+        handed on): the stream ends with what it produced. The outcome is
+        ``self.metrics.status``. Listings dated outside the query window are
+        dropped here whatever the scraper did.
+        """
+        self.metrics = metrics = SourceMetrics(self.source_name)
+        self._deadline = time.monotonic() + self.TIME_BUDGET
+        with metrics.activate():
+            for attempt in range(1, self.MAX_RETRIES + 1):
                 self.logger.info(f"Scraping {self.source_name} (attempt {attempt})...")
-                results = self._scrape_impl()
-                self.logger.info(f"Found {len(results)} auctions from {self.source_name}")
-                return results
-            except Exception as e:
-                self.logger.warning(f"Attempt {attempt} failed: {e}")
-                if attempt < self.MAX_RETRIES:
-                    time.sleep(self.RETRY_DELAY)
+                metrics.attempts = attempt
+                started = time.perf_counter()
+                self._page_hashes = {}
+                snapshot = _ResultsWriter(self._results_path(), self.logger)
+                count = dropped = 0
+                try:
+                    for listing in self._scrape_impl():
+                        if not self.query.in_window(listing.date):
+                            dropped += 1
+                            metrics.add("dropped")
+                            continue
+                        if self._page_hashes:
+                            snapshot.add(listing)
+                        count += 1
+                        metrics.add("kept")
+                        yield listing
+                except GeneratorExit:
+                    snapshot.discard()
+                    metrics.finish("cancelled")
+                    raise
+                except Exception as e:
+                    snapshot.discard()
+                    if count:
+                        self.logger.error(f"{self.source_name} failed after {count} auctions, "
+                                          f"keeping them: {e}")
+                        metrics.finish("partial", str(e))
+                        return
+                    phase = getattr(e, "scrape_phase", None)
+                    self.logger.warning(f"Attempt {attempt} failed"
+                                        + (f" in {phase}" if phase else "") + f": {e}")
+                    if attempt < self.MAX_RETRIES and self._retry_attempt(e):
+                        # The failed attempt's phases stay where they were; retry is the waste
+                        metrics.phases["retry"] += time.perf_counter() - started
+                        with metrics.phase("retry"):
+                            time.sleep(backoff_delay(attempt - 1, self.RETRY_DELAY,
+                                                     self.MAX_RETRY_DELAY))
+                        continue
+                    self.logger.error(f"{self.source_name} failed after {attempt} "
+                                      f"attempt{'s' if attempt > 1 else ''}: {e}")
+                    metrics.finish("failed", str(e))
+                    return
+
+                self.logger.info(f"Found {count} auctions from {self.source_name}"
+                                 + (f" ({dropped} more outside the date window)" if dropped else ""))
+                if self._page_hashes:
+                    snapshot.commit(self._page_hashes, self.query.key, self.PARSER_VERSION)
                 else:
-                    self.logger.error(f"All {self.MAX_RETRIES} attempts failed for {self.source_name}")
-                    return []
+                    snapshot.discard()
+                metrics.finish("ok")
+                return
+
+    def time_left(self) -> float | None:
+        """Seconds left of TIME_BUDGET for the current stream (None outside one)."""
+        if self._deadline is None:
+            return None
+        return max(0.0, self._deadline - time.monotonic())
+
+    @staticmethod
+    def _retry_attempt(error: Exception) -> bool:
+        """Whether an attempt that failed with ``error`` is worth repeating from scratch."""
+        if getattr(error, "scrape_phase", None) == "parse":
+            return False
+        return is_transient(error) and not getattr(error, "scrape_retried", False)
+
+    def retry_fetch(self, fn, *args, **kwargs):
+        """Call a fetch step (a request, ``driver.get``), retrying transient failures.
+
+        Up to FETCH_RETRIES tries with jittered exponential backoff; see
+        scrapers.retry.
+        """
+        return call_with_retry(fn, *args, tries=self.FETCH_RETRIES, base=self.RETRY_DELAY,
+                               cap=self.MAX_RETRY_DELAY, logger=self.logger, **kwargs)
+
+    def fetch(self, url: str | None = None, use_cache: bool = True, **kwargs) -> requests.Response:
+        """GET a page (default: base_url) through the shared pooled HTTP client.
+
+        The request is revalidated against the on-disk HTTP cache, and the
+        body hash is recorded so ``previous_results`` can tell whether the
+        page changed since the last successful run. Connection errors,
+        timeouts and 429/5xx responses are retried (``retry_fetch``).
+
+        Raises:
+            requests.HTTPError: On a 4xx/5xx response
+        """
+        url = url or self.base_url
+
+        def get() -> requests.Response:
+            resp = HTTP_CLIENT.get(url, use_cache=use_cache, **kwargs)
+            resp.raise_for_status()
+            return resp
+
+        resp = self.retry_fetch(get)
+        self._page_hashes[url] = hashlib.sha256(resp.content).hexdigest()
+        return resp
+
+    def fetch_many(self, urls: list[str], **kwargs) -> list:
+        """Fetch several pages concurrently.
+
+        Returns a list aligned with ``urls`` holding each ``Response`` or the
+        exception raised for it; HTTP error statuses are not raised and
+        nothing is retried.
+        """
+        with current().phase("fetch"):
+            return HTTP_CLIENT.get_many(urls, **kwargs)
+
+    @property
+    def cache_name(self) -> str:
+        """File-system friendly source name for run-to-run state files."""
+        return re.sub(r"\W+", "_", self.source_name.lower()).strip("_")
+
+    def _results_path(self) -> str:
+        return os.path.join(RESULTS_DIR, f"{self.cache_name}.json")
+
+    def previous_results(self) -> list[AuctionListing] | None:
+        """Return last run's listings if every page fetched so far is unchanged.
+
+        Call after ``fetch``; returns None when any page differs (or was not
+        fetched last time), or the last run had a different query or an older
+        PARSER_VERSION, meaning the source has to be parsed.
+        """
+        try:
+            with open(self._results_path(), encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not self._page_hashes or saved.get("pages") != self._page_hashes:
+            return None
+        if saved.get("query") != self.query.key or saved.get("parser") != self.PARSER_VERSION:
+            return None
+
+        self.logger.info(f"{self.source_name} pages unchanged since last run, reusing results")
+        return [AuctionListing(**d) for d in saved["listings"]]
+
+    def make_soup(self, html: str):
+        """Parse a whole page with the configured backend (BeautifulSoup-compatible API)."""
+        with current().phase("parse"):
+            return parsing.parse_html(html, self.PARSER_BACKEND)
+
+    def select_cards(self, html: str, selector: str) -> list:
+        """Return the elements of ``html`` matching a ``tag.class`` card selector.
+
+        With the ``lxml-partial`` backend only the card subtrees are built;
+        otherwise the whole page is parsed and searched.
+        """
+        with current().phase("parse"):
+            if self.PARSER_BACKEND == "lxml-partial":
+                return parsing.parse_card_subtrees(html, selector)
+            return self.make_soup(html).select(selector)
+
+    def iter_cards(self, cards, parse_card, context: str = "",
+                   in_scope=None) -> Iterator[AuctionListing]:
+        """Parse every card with ``parse_card``, yielding each listing as it is parsed.
+
+        Cards whose markup is unchanged since the last run are not parsed
+        again. ``context`` must capture anything else the parse depends on
+        (e.g. the current year). A card that fails to parse is logged and
+        skipped.
+
+        ``in_scope(card)`` is a cheap pre-check against ``self.query`` (reading
+        only, say, the date element); cards it rejects are neither looked up
+        in the memo nor parsed. It must not depend on anything but the query,
+        so that parse results stay reusable across queries. The memo is only
+        saved once every card has been consumed.
+        """
+        salt = f"{self.PARSER_VERSION}:{self.PARSER_BACKEND}:{context}"
+        memo = CardMemo(self.cache_name, salt, AuctionListing)
+        metrics = current()
+        skipped = 0
+        # Timed per card: pulling the next card may be a page load (counted as fetch/wait)
+        for card in cards:
+            metrics.add("cards")
+            try:
+                with metrics.phase("parse"):
+                    if in_scope is not None and not in_scope(card):
+                        skipped += 1
+                        continue
+                    listing = memo.get_or_parse(card, parse_card)
+            except Exception as e:
+                self.logger.warning(f"Failed to parse card: {e}")
+                metrics.add("card_errors")
+                continue
+            if listing:
+                yield listing
+        memo.save()
+        metrics.add("skipped", skipped)
+        metrics.add("reused", memo.hits)
+        metrics.add("parsed", memo.misses)
+        if skipped:
+            self.logger.info(f"Skipped {skipped} cards outside the query")
+        if memo.hits:
+            self.logger.info(f"Reused {memo.hits} unchanged cards, parsed {memo.misses}")
 
     def parse_date(self, raw: str) -> tuple[str, str]:
         """Parse a raw date string into (iso_date, display_date).
 
-        Tries multiple common formats. Strips ordinal suffixes (st, nd, rd, th)
-        before parsing.
+        Accepts the formats listed in scrapers.dates, with or without ordinal
+        suffixes (st, nd, rd, th). Results are memoized.
 
         Returns:
             Tuple of (ISO date string "YYYY-MM-DD", display string "Weekday, Month Day, Year")
@@ -94,23 +341,11 @@ class BaseScraper(ABC):
         Raises:
             ValueError: If no format matches
         """
-        # Strip ordinal suffixes: "14th" -> "14", "1st" -> "1"
-        import re
-        cleaned = re.sub(r'(\d+)(st|nd|rd|th)', r'\1', raw.strip())
-
-        for fmt in DATE_FORMATS:
-            # Also try the cleaned version against formats without ordinals
-            clean_fmt = fmt.replace('st,', ',').replace('nd,', ',').replace('rd,', ',').replace('th,', ',')
-            for date_str, date_fmt in [(raw.strip(), fmt), (cleaned, clean_fmt), (cleaned, fmt)]:
-                try:
-                    dt = datetime.strptime(date_str, date_fmt)
-                    iso = dt.strftime("%Y-%m-%d")
-                    display = dt.strftime("%A, %B %d, %Y")
-                    return iso, display
-                except ValueError:
-                    continue
+        return dates.parse_date(raw)
 
-        raise ValueError(f"Could not parse date: '{raw}'")
+    def find_date(self, text: str, default_year: int | str | None = None) -> tuple[str, str] | None:
+        """Find the first date in free text; see scrapers.dates.find_date."""
+        return dates.find_date(text, default_year)
 
     def _create_listing(self, **kwargs) -> AuctionListing:
         """Factory that auto-fills the source field."""
@@ -120,4 +355,66 @@ class BaseScraper(ABC):
     @staticmethod
     def to_dict(listing: AuctionListing) -> dict:
         """Convert a listing to a JSON-serializable dict."""
-        return asdict(listing)
+        return listing.to_dict()
+
+
+class _ResultsWriter:
+    """Streams one attempt's listings into the results snapshot file.
+
+    Listings are appended to a temp file as they are produced; ``commit``
+    adds the page hashes, query and parser version and moves it into place,
+    ``discard`` drops it.
+    """
+
+    def __init__(self, path: str, logger: logging.Logger):
+        self.path = path
+        self.tmp = f"{path}.tmp"
+        self.logger = logger
+        self._file = None
+        self._failed = False
+
+    def _open(self) -> bool:
+        if self._file is None and not self._failed:
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                self._file = open(self.tmp, "w", encoding="utf-8")
+                self._file.write('{"listings":[')
+                self._first = True
+            except OSError as e:
+                self._fail(e)
+        return self._file is not None
+
+    def _fail(self, error: OSError) -> None:
+        self.logger.warning(f"Could not save results snapshot: {error}")
+        self._failed = True
+        self.discard()
+
+    def add(self, listing: AuctionListing) -> None:
+        if not self._open():
+            return
+        try:
+            self._file.write(encode_listing(listing) if self._first else "," + encode_listing(listing))
+            self._first = False
+        except OSError as e:
+            self._fail(e)
+
+    def commit(self, pages: dict[str, str], query: str, parser: int) -> None:
+        if not self._open():
+            return
+        try:
+            self._file.write(f'],"pages":{json.dumps(pages)},"query":{json.dumps(query)},'
+                             f'"parser":{parser}}}')
+            self._file.close()
+            self._file = None
+            os.replace(self.tmp, self.path)
+        except OSError as e:
+            self._fail(e)
+
+    def discard(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        try:
+            os.remove(self.tmp)
+        except OSError:
+            pass
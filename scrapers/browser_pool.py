@@ -0,0 +1,315 @@
+"""Shared headless Chrome pool for the Selenium-based scrapers.
+
+Starting Chrome is the biggest fixed cost of a run, so instead of every
+scraper launching (and on retry relaunching) its own browser, they lease a
+tab from a pool that starts Chrome once and keeps it for the whole run:
+
+    with BROWSER_POOL.tab() as driver:
+        driver.get(url)
+        ...
+
+There is one Chrome process per run. A WebDriver session can only drive one
+tab at a time, though, so each scraper leases its own session, attached to
+that browser through its DevTools address (``debuggerAddress``); the
+session that launched Chrome only keeps it alive and is never leased.
+``max_sessions`` caps the attached sessions (master_scraper defaults it to
+one per browser scraper); extra scrapers wait for a free session, but no
+longer than their ``tab(timeout)``. Page loads time out after
+PAGE_LOAD_TIMEOUT, and the orchestrator ``revoke``s the session of a
+scraper it abandons, closing its tab, so one hung site cannot hold a
+session for the rest of the run. A session that stops answering is thrown
+away and replaced on the next lease; if Chrome itself died, it is started
+again first.
+
+The chromedriver path from webdriver-manager is cached on disk so normal runs
+don't hit the network to resolve it.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException, WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+from scrapers import CACHE_DIR
+from scrapers.metrics import current
+from scrapers.readiness import PENDING_REQUESTS_SCRIPT
+
+logger = logging.getLogger("BrowserPool")
+
+DRIVER_CACHE_PATH = os.path.join(CACHE_DIR, "chromedriver.json")
+DRIVER_CACHE_MAX_AGE = 7 * 86_400  # re-resolve weekly to pick up Chrome upgrades
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/131.0.0.0 Safari/537.36"
+)
+
+# Hide navigator.webdriver; has to be registered again on every new tab
+STEALTH_SCRIPT = "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+
+
+def resolve_chromedriver(refresh: bool = False) -> str:
+    """Return the chromedriver binary path, using the on-disk cache when fresh."""
+    if not refresh:
+        try:
+            with open(DRIVER_CACHE_PATH, encoding="utf-8") as f:
+                cached = json.load(f)
+            path = cached["path"]
+            if os.path.isfile(path) and time.time() - cached["resolved_at"] < DRIVER_CACHE_MAX_AGE:
+                return path
+        except (OSError, KeyError, TypeError, ValueError):
+            pass
+
+    path = ChromeDriverManager().install()
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(DRIVER_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump({"path": path, "resolved_at": time.time()}, f)
+    except OSError as e:
+        logger.warning(f"Could not cache chromedriver path: {e}")
+    return path
+
+
+def build_options() -> Options:
+    """Chrome options shared by every pooled session."""
+    options = Options()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument(f"user-agent={USER_AGENT}")
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    return options
+
+
+def open_tab(driver: webdriver.Chrome) -> str:
+    """Open a blank tab in ``driver``'s session, focus it and register the init scripts.
+
+    Returns the new window handle. Navigate it afterwards so the scripts run.
+    """
+    driver.switch_to.new_window("tab")
+    for script in (STEALTH_SCRIPT, PENDING_REQUESTS_SCRIPT):
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": script})
+    return driver.current_window_handle
+
+
+class BrowserPool:
+    """Lazily started, thread-safe pool of WebDriver sessions on one headless Chrome."""
+
+    PAGE_LOAD_TIMEOUT = 30  # seconds before driver.get gives up on a hung page
+
+    def __init__(self, max_sessions: int = 1):
+        self.max_sessions = max(1, max_sessions)
+        self._browser: webdriver.Chrome | None = None  # the session that launched Chrome
+        self._browser_lock = threading.Lock()
+        self._idle: list[webdriver.Chrome] = []
+        self._leased: dict[object, threading.Thread] = {}  # driver (or placeholder) -> lessee
+        self._tabs: dict[webdriver.Chrome, list[str]] = {}  # session -> its home tab, leased tab
+        self._cond = threading.Condition()
+        self._closed = False
+
+    @staticmethod
+    def _launch(options: Options) -> webdriver.Chrome:
+        try:
+            return webdriver.Chrome(service=Service(resolve_chromedriver()), options=options)
+        except SessionNotCreatedException:
+            # Cached driver no longer matches the installed Chrome
+            logger.info("Cached chromedriver rejected, re-resolving")
+            return webdriver.Chrome(service=Service(resolve_chromedriver(refresh=True)),
+                                    options=options)
+
+    def _browser_address(self) -> str:
+        """DevTools address of the run's Chrome, starting (or restarting) it if needed."""
+        with self._browser_lock:
+            if self._browser is not None and not self._is_alive(self._browser):
+                logger.warning("Chrome is gone, restarting it")
+                self._quit(self._browser)
+                self._browser = None
+            if self._browser is None:
+                start = time.perf_counter()
+                self._browser = self._launch(build_options())
+                logger.info(f"Started Chrome in {time.perf_counter() - start:.1f}s")
+            return self._browser.capabilities["goog:chromeOptions"]["debuggerAddress"]
+
+    def _start_session(self) -> webdriver.Chrome:
+        options = Options()
+        options.debugger_address = self._browser_address()
+        driver = self._launch(options)
+        try:
+            driver.set_page_load_timeout(self.PAGE_LOAD_TIMEOUT)
+            # The session's own blank tab, to fall back to between leases
+            driver.switch_to.new_window("tab")
+        except WebDriverException:
+            self._quit(driver)
+            raise
+        with self._cond:
+            self._tabs[driver] = [driver.current_window_handle]
+        return driver
+
+    def _close_tabs(self, handles: list[str]) -> None:
+        """Close tabs through the Chrome-owning session (their own session may be hung)."""
+        with self._browser_lock:
+            for handle in handles:
+                try:
+                    # Window handles are DevTools target IDs (prefixed by old chromedrivers)
+                    self._browser.execute_cdp_cmd(
+                        "Target.closeTarget", {"targetId": handle.removeprefix("CDwindow-")})
+                except (AttributeError, WebDriverException):
+                    pass  # already gone, or so is the browser
+
+    @staticmethod
+    def _is_alive(driver: webdriver.Chrome) -> bool:
+        try:
+            driver.window_handles
+            return True
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def _quit(driver: webdriver.Chrome) -> None:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _discard(self, driver: webdriver.Chrome) -> None:
+        """Drop an attached session; quitting it leaves Chrome running, so close its tabs."""
+        with self._cond:
+            tabs = self._tabs.pop(driver, [])
+        self._close_tabs(tabs)
+        self._quit(driver)
+
+    def _acquire(self, timeout: float | None = None) -> webdriver.Chrome:
+        """Lease an idle session or start one; waits at most ``timeout`` seconds for a free slot.
+
+        Raises:
+            TimeoutError: If every session stayed leased for ``timeout`` seconds
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        owner = threading.current_thread()
+        with self._cond:
+            while True:
+                while self._idle:
+                    driver = self._idle.pop()
+                    if self._is_alive(driver):
+                        self._leased[driver] = owner
+                        return driver
+                    logger.warning("Discarding dead browser session")
+                    self._discard(driver)
+                if len(self._leased) < self.max_sessions:
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"No browser session free within {timeout:.0f}s")
+                self._cond.wait(remaining)
+            # Reserve the slot before starting Chrome outside the lock
+            placeholder = object()
+            self._leased[placeholder] = owner
+
+        try:
+            driver = self._start_session()
+        except Exception:
+            with self._cond:
+                self._leased.pop(placeholder, None)
+                self._cond.notify()
+            raise
+        with self._cond:
+            if self._leased.pop(placeholder, None) is not None:
+                self._leased[driver] = owner
+                return driver
+        # Revoked while Chrome was starting
+        self._discard(driver)
+        raise TimeoutError("Browser lease revoked")
+
+    def _release(self, driver: webdriver.Chrome, healthy: bool) -> None:
+        with self._cond:
+            if self._leased.pop(driver, None) is None:
+                healthy = False  # revoked; the slot was already given back
+            elif healthy and not self._closed:
+                self._idle.append(driver)
+            else:
+                healthy = False
+            self._cond.notify()
+        if not healthy:
+            self._discard(driver)
+
+    def revoke(self, owner: threading.Thread) -> None:
+        """Take back every session leased by ``owner`` (an abandoned scraper's thread).
+
+        The sessions' tabs are closed and the sessions quit, so the thread's
+        pending WebDriver calls fail, and their slots go to the scrapers
+        waiting for one.
+        """
+        with self._cond:
+            revoked = [d for d, lessee in self._leased.items() if lessee is owner]
+            for driver in revoked:
+                del self._leased[driver]
+            self._cond.notify_all()
+        for driver in revoked:
+            if isinstance(driver, webdriver.Chrome):
+                logger.warning(f"Quitting the browser session held by {owner.name}")
+                self._discard(driver)
+
+    @contextmanager
+    def tab(self, timeout: float | None = None):
+        """Lease a session and yield its driver focused on a fresh tab.
+
+        Waits at most ``timeout`` seconds (default: no limit) for a free
+        session. The tab is closed on exit and the session goes back to the
+        pool, or is discarded if the browser died while it was leased.
+        """
+        with current().phase("driver"):
+            driver = self._acquire(timeout)
+            try:
+                home = driver.current_window_handle
+                handle = open_tab(driver)
+            except WebDriverException:
+                self._release(driver, healthy=False)
+                raise
+            with self._cond:
+                if driver in self._tabs:
+                    self._tabs[driver][1:] = [handle]
+
+        healthy = True
+
+        try:
+            yield driver
+        finally:
+            try:
+                driver.close()
+                driver.switch_to.window(home)
+            except WebDriverException:
+                healthy = False
+            with self._cond:
+                if driver in self._tabs:
+                    del self._tabs[driver][1:]
+            self._release(driver, healthy)
+
+    def close(self) -> None:
+        """Quit every session, including ones still leased by abandoned scrapers, and Chrome."""
+        with self._cond:
+            drivers = self._idle + [d for d in self._leased if isinstance(d, webdriver.Chrome)]
+            self._leased = {}
+            self._idle = []
+            self._tabs = {}
+            self._closed = True
+        for driver in drivers:
+            self._quit(driver)
+        with self._browser_lock:
+            browser, self._browser = self._browser, None
+        if browser is not None:
+            self._quit(browser)
+
+
+# Shared pool for the whole run; master_scraper closes it at the end
+BROWSER_POOL = BrowserPool()
@@ -0,0 +1,78 @@
+"""Per-card parse memo that persists across runs.
+
+Most auction cards are identical from one run to the next, so re-running
+``select_one`` calls, regexes and ``parse_date`` on them is wasted work. The
+memo keys each card on a hash of its whitespace-normalized markup and stores
+the resulting listing (or None for a card the parser skipped). Only new or
+changed cards reach the parser, and cards that no longer appear on the page
+are evicted when the memo is saved.
+
+Entries are tied to a ``salt`` (the scraper's PARSER_VERSION plus any context
+the parse depends on, such as the current year); a different salt discards
+the whole memo.
+"""
+
+import hashlib
+import json
+import logging
+import os
+
+from scrapers import CACHE_DIR
+
+MEMO_DIR = os.path.join(CACHE_DIR, "cards")
+
+_MISSING = object()
+
+
+class CardMemo:
+    """Card-hash -> parsed listing table for one source."""
+
+    def __init__(self, name: str, salt: str, listing_cls):
+        self.path = os.path.join(MEMO_DIR, f"{name}.json")
+        self.salt = salt
+        self.listing_cls = listing_cls
+        self.logger = logging.getLogger("CardMemo")
+        self._entries: dict[str, dict | None] = {}
+        self._seen: dict[str, dict | None] = {}
+        self.hits = 0
+        self.misses = 0
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                saved = json.load(f)
+            if saved.get("salt") == salt:
+                self._entries = saved["cards"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    @staticmethod
+    def key(card) -> str:
+        markup = " ".join(str(card).split())
+        return hashlib.blake2b(markup.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get_or_parse(self, card, parse):
+        """Return the memoized listing for ``card``, calling ``parse(card)`` on a miss."""
+        key = self.key(card)
+        cached = self._entries.get(key, _MISSING)
+        if cached is not _MISSING:
+            self.hits += 1
+            self._seen[key] = cached
+            return self.listing_cls(**cached) if cached is not None else None
+
+        self.misses += 1
+        listing = parse(card)
+        self._seen[key] = listing.to_dict() if listing is not None else None
+        return listing
+
+    def save(self) -> None:
+        """Persist the cards seen this run, dropping the ones that disappeared."""
+        evicted = len(set(self._entries) - set(self._seen))
+        self.logger.debug(f"{os.path.basename(self.path)}: {self.hits} hits, "
+                          f"{self.misses} parsed, {evicted} evicted")
+        try:
+            os.makedirs(MEMO_DIR, exist_ok=True)
+            tmp = f"{self.path}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"salt": self.salt, "cards": self._seen}, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            self.logger.warning(f"Could not save card memo: {e}")
@@ -0,0 +1,90 @@
+"""Per-source circuit breaker that persists across runs.
+
+A source that fails run after run (site down, layout changed, blocked)
+would otherwise spend its whole time budget every run. The breaker keeps
+each source's consecutive failed runs in ``.cache/breaker.json``:
+
+    closed     fewer than FAILURE_THRESHOLD failures in a row: the source
+               runs, after the sources with fewer failures
+    open       at the threshold: the source is skipped for COOLDOWN,
+               doubling with every further failure (up to MAX_COOLDOWN)
+    half-open  the cooldown has passed: the source gets one trial run; a
+               success closes the breaker, a failure re-opens it for longer
+
+A run that produced listings counts as a success, even if the source
+failed part way.
+"""
+
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+
+from scrapers import CACHE_DIR
+
+BREAKER_PATH = os.path.join(CACHE_DIR, "breaker.json")
+
+
+class CircuitBreaker:
+    """Consecutive-failure counts and cooldowns of every source."""
+
+    FAILURE_THRESHOLD = 3  # failed runs in a row before the source is skipped
+    COOLDOWN = timedelta(hours=6)
+    MAX_COOLDOWN = timedelta(days=7)
+
+    def __init__(self, path: str = BREAKER_PATH):
+        self.path = path
+        self.logger = logging.getLogger("CircuitBreaker")
+        try:
+            with open(path, encoding="utf-8") as f:
+                self._sources: dict[str, dict] = json.load(f)
+        except (OSError, ValueError):
+            self._sources = {}
+
+    def failures(self, source: str) -> int:
+        """Consecutive failed runs of ``source``."""
+        return self._sources.get(source, {}).get("failures", 0)
+
+    def open_until(self, source: str) -> datetime | None:
+        """When the source may run again, or None if its breaker is closed."""
+        until = self._sources.get(source, {}).get("open_until")
+        return datetime.fromisoformat(until) if until else None
+
+    def allow(self, source: str, now: datetime | None = None) -> bool:
+        """Whether ``source`` should run now (closed, or open but cooled down)."""
+        until = self.open_until(source)
+        return until is None or (now or datetime.now()) >= until
+
+    def record(self, source: str, ok: bool, error: str | None = None,
+               now: datetime | None = None) -> None:
+        """Count one run of ``source``; a failure at the threshold (re-)opens its breaker."""
+        if ok:
+            if self._sources.pop(source, None):
+                self.logger.info(f"{source} recovered, breaker closed")
+            return
+
+        now = now or datetime.now()
+        state = self._sources.setdefault(source, {"failures": 0})
+        state["failures"] += 1
+        state["last_error"] = error
+        state["last_failure"] = now.isoformat(timespec="seconds")
+        excess = state["failures"] - self.FAILURE_THRESHOLD
+        if excess >= 0:
+            cooldown = min(self.MAX_COOLDOWN, self.COOLDOWN * 2 ** min(excess, 10))
+            state["open_until"] = (now + cooldown).isoformat(timespec="seconds")
+            self.logger.warning(f"{source} failed {state['failures']} runs in a row, "
+                                f"skipping it until {state['open_until']}")
+
+    def reset(self) -> None:
+        """Forget every source's failures (``master_scraper --reset-breaker``)."""
+        self._sources.clear()
+
+    def save(self) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp = f"{self.path}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._sources, f, indent=2)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            self.logger.warning(f"Could not save circuit breaker state: {e}")
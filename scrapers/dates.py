@@ -0,0 +1,111 @@
+"""Date extraction engine shared by every scraper.
+
+Replaces the old ``strptime`` trial loop (up to 27 attempts, each raising on a
+miss) and the per-scraper weekday/month regexes. A date string is matched
+once against a single compiled pattern, the matching branch says which
+format it is, and the fields are converted directly. Supported forms:
+
+    March 14, 2026 / MARCH 14TH, 2026 / Mar 14 2026 / Sept. 3, 2026
+    Saturday, March 14, 2026 / Friday April 10th, 2026
+    03/14/2026 / 3/4/2026
+    2026-03-14 / 2026-07-31T10:00:00Z (the time of day is ignored)
+    April 25 (only when a ``default_year`` is given)
+
+``parse_date`` requires the whole string to be a date; ``find_date`` and
+``find_dates`` pull dates out of free text. Results are memoized in bounded
+LRU caches, and ``parse_dates`` parses a batch in one call.
+
+All functions return ``(iso_date, display_date)`` tuples such as
+``("2026-03-14", "Saturday, March 14, 2026")``.
+"""
+
+import re
+from datetime import date
+from functools import lru_cache
+from typing import Iterable
+
+MONTH_NAMES = ["", "January", "February", "March", "April", "May", "June", "July",
+               "August", "September", "October", "November", "December"]
+WEEKDAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+MONTHS = {name.lower(): i for i, name in enumerate(MONTH_NAMES) if name}
+MONTHS.update({name[:3].lower(): i for i, name in enumerate(MONTH_NAMES) if name})
+MONTHS["sept"] = 9
+
+_MONTH = r"(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|" \
+         r"sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)"
+_WEEKDAY = r"(?:mon|tues|wednes|thurs|fri|satur|sun)day"
+
+# One alternation per supported form; the group that matched picks the converter
+_DATE = (
+    rf"(?:{_WEEKDAY},?\s+)?(?P<month>{_MONTH})\.?\s+(?P<day>\d{{1,2}})(?:st|nd|rd|th)?\b"
+    rf"(?:,?\s+(?P<year>\d{{4}})\b)?"
+    r"|(?P<us_month>\d{1,2})/(?P<us_day>\d{1,2})/(?P<us_year>\d{4})\b"
+    r"|(?P<iso_year>\d{4})-(?P<iso_month>\d{1,2})-(?P<iso_day>\d{1,2})"
+    r"(?:T\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?)?(?!\d)"
+)
+_FULL_RE = re.compile(rf"^(?:{_DATE})$", re.IGNORECASE)
+_FIND_RE = re.compile(rf"\b(?:{_DATE})", re.IGNORECASE)
+
+
+def format_display(d: date) -> str:
+    """Human-readable form used in the output, e.g. 'Saturday, March 14, 2026'."""
+    return f"{WEEKDAY_NAMES[d.weekday()]}, {MONTH_NAMES[d.month]} {d.day:02d}, {d.year}"
+
+
+def _convert(match: re.Match, default_year: int | None) -> tuple[str, str] | None:
+    groups = match.groupdict()
+    try:
+        if groups["month"]:
+            year = groups["year"] or default_year
+            if year is None:
+                return None
+            d = date(int(year), MONTHS[groups["month"].lower()], int(groups["day"]))
+        elif groups["us_month"]:
+            d = date(int(groups["us_year"]), int(groups["us_month"]), int(groups["us_day"]))
+        else:
+            d = date(int(groups["iso_year"]), int(groups["iso_month"]), int(groups["iso_day"]))
+    except ValueError:  # e.g. February 30
+        return None
+    return d.isoformat(), format_display(d)
+
+
+@lru_cache(maxsize=4096)
+def _parse_cached(raw: str) -> tuple[str, str] | None:
+    match = _FULL_RE.match(raw.strip())
+    return _convert(match, None) if match else None
+
+
+def parse_date(raw: str) -> tuple[str, str]:
+    """Parse a string that is exactly one date.
+
+    Raises:
+        ValueError: If the string is not a supported date
+    """
+    result = _parse_cached(raw)
+    if result is None:
+        raise ValueError(f"Could not parse date: '{raw}'")
+    return result
+
+
+def parse_dates(raws: Iterable[str]) -> list[tuple[str, str] | None]:
+    """Parse many date strings; unparseable entries come back as None."""
+    return [_parse_cached(raw) for raw in raws]
+
+
+@lru_cache(maxsize=1024)
+def find_dates(text: str, default_year: int | str | None = None) -> tuple[tuple[str, str], ...]:
+    """Every valid date found in free text, in order of appearance.
+
+    Month-and-day dates without a year are only returned when
+    ``default_year`` is given.
+    """
+    year = int(default_year) if default_year is not None else None
+    found = (_convert(m, year) for m in _FIND_RE.finditer(text))
+    return tuple(d for d in found if d)
+
+
+def find_date(text: str, default_year: int | str | None = None) -> tuple[str, str] | None:
+    """The first valid date in free text, or None."""
+    dates = find_dates(text, default_year)
+    return dates[0] if dates else None
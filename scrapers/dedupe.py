@@ -0,0 +1,205 @@
+"""Duplicate detection within a run, across URLs and across sources.
+
+Two listings are the same auction when either
+
+* their URLs match after canonicalization (``url_key``: scrapers.delta's
+  canonical form, with ``www.`` and the scheme dropped as well), e.g.
+  ``http://barnoneauction.com/x/?utm_source=fb`` and
+  ``https://www.barnoneauction.com/x``; or
+* they are near-duplicates: same date and state, and titles that share most
+  of their words once dates, filler words and the source's own name are
+  stripped, e.g. one sale listed by two auction houses. In the same city a
+  looser title match is enough. A title left with a single word or none
+  ("Public Auction") says too little to match on, and listings from two
+  different sources must share at least MIN_SHARED_WORDS words unless they
+  are in the same city.
+
+Listings are only compared within their block, keyed on (date, state), so
+the work stays close to linear in the number of listings instead of growing
+with every pair. Titles whose remaining numbers differ ("Ring 1" vs "Ring 2"),
+and listings from the same source with different lot counts, never match.
+
+Which of two duplicates is kept must not depend on which scraper happened
+to finish first, or the published listing (and its ID) would flip between
+runs. The index ranks listings by source ``priority`` (the orchestrator's
+scraper order), then by position within their source: a better-ranked
+duplicate replaces the one kept so far, and ``kept`` lists the survivors in
+rank order.
+"""
+
+import re
+from dataclasses import dataclass
+from urllib.parse import urlsplit, urlunsplit
+
+from scrapers.base_scraper import AuctionListing
+from scrapers.delta import canonical_url
+from scrapers.query import STATE_NAMES
+
+# Word-set (Jaccard) similarity above which two titles name the same sale
+TITLE_MATCH = 0.8
+# Lower bar when both listings are in the same city
+SAME_CITY_TITLE_MATCH = 0.5
+# Words two sources' titles must share to match outside the same city
+MIN_SHARED_WORDS = 2
+
+STOPWORDS = {
+    "a", "an", "and", "at", "auction", "auctions", "for", "in", "of", "on", "sale", "the",
+    "online", "live", "timed", "inc", "llc", "co",
+    "monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday",
+    "january", "february", "march", "april", "may", "june", "july", "august",
+    "september", "october", "november", "december",
+    "jan", "feb", "mar", "apr", "jun", "jul", "aug", "sep", "sept", "oct", "nov", "dec",
+}
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_ORDINAL_RE = re.compile(r"^(\d+)(?:st|nd|rd|th)$")
+_STATE_CODE_RE = re.compile(r"(?:^|[\s,/(])([A-Z]{2})(?:[\s,\d/)]|$)")
+_STATE_NAME_RE = re.compile(
+    r"\b(" + "|".join(sorted(map(re.escape, STATE_NAMES.values()), key=len, reverse=True)) + r")\b",
+    re.IGNORECASE,
+)
+_CODES_BY_NAME = {name.lower(): code for code, name in STATE_NAMES.items()}
+
+
+def url_key(url: str) -> str:
+    """Canonical URL without scheme or ``www.``, for matching the same page."""
+    parts = urlsplit(canonical_url(url))
+    host = parts.netloc.removeprefix("www.")
+    return urlunsplit(("", host, parts.path, parts.query, "")).lstrip("/")
+
+
+def dedupe_key(listing: AuctionListing) -> str:
+    """Listings sharing this key are the same auction."""
+    return url_key(listing.url)
+
+
+def region_of(location: str) -> str:
+    """State code named in a location ("Perris, CA", "Southern California"), else the location."""
+    match = _STATE_CODE_RE.search(location)
+    if match and match.group(1) in STATE_NAMES:
+        return match.group(1)
+    match = _STATE_NAME_RE.search(location)
+    if match:
+        return _CODES_BY_NAME[match.group(1).lower()]
+    return " ".join(_WORD_RE.findall(location.lower()))
+
+
+def city_of(location: str) -> str:
+    """Normalized city of a "City, ST" location ("" if there is no comma)."""
+    head, sep, _ = location.rpartition(",")
+    if not sep:
+        return ""
+    head = re.sub(r"^online\s*-\s*", "", head.strip(), flags=re.IGNORECASE)
+    return " ".join(_WORD_RE.findall(head.lower()))
+
+
+def title_words(listing: AuctionListing) -> tuple[frozenset[str], frozenset[str]]:
+    """(words, numbers) of the title, without filler, dates or the source's name."""
+    year, day = listing.date[:4], listing.date[8:10].lstrip("0")
+    skip = STOPWORDS | set(_WORD_RE.findall(listing.source.lower()))
+    words, numbers = set(), set()
+    for word in _WORD_RE.findall(listing.title.lower()):
+        ordinal = _ORDINAL_RE.match(word)
+        if ordinal:
+            word = ordinal.group(1)
+        if word in skip:
+            continue
+        if word.isdigit():
+            word = word.lstrip("0") or "0"
+            if word in (year, day):
+                continue
+            numbers.add(word)
+        words.add(word)
+    return frozenset(words), frozenset(numbers)
+
+
+def similarity(a: frozenset[str], b: frozenset[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+@dataclass(slots=True)
+class _Entry:
+    listing: AuctionListing
+    words: frozenset[str]
+    numbers: frozenset[str]
+    city: str
+    block: tuple[str, str]  # (date, state)
+    rank: tuple[int, int]   # (source priority, position within the source)
+
+
+class DedupeIndex:
+    """Keeps the best-ranked listing of every duplicate group seen so far."""
+
+    def __init__(self, title_match: float = TITLE_MATCH,
+                 same_city_title_match: float = SAME_CITY_TITLE_MATCH,
+                 priority: list[str] | None = None):
+        self.title_match = title_match
+        self.same_city_title_match = same_city_title_match
+        # Sources in order of preference; unlisted sources rank after them
+        self.priority = {source: i for i, source in enumerate(priority or [])}
+        self._urls: dict[str, _Entry] = {}
+        self._blocks: dict[tuple[str, str], list[_Entry]] = {}
+        self._seen: dict[str, int] = {}  # source -> listings added so far
+        self.url_matches = 0
+        self.near_matches = 0
+
+    def add(self, listing: AuctionListing) -> AuctionListing | None:
+        """Index ``listing``; returns None if it duplicates nothing, else the duplicate dropped.
+
+        That is ``listing`` itself, or the listing it duplicates if ``listing``
+        ranks better and replaces it.
+        """
+        source_rank = self.priority.get(listing.source, len(self.priority))
+        position = self._seen.get(listing.source, 0)
+        self._seen[listing.source] = position + 1
+
+        words, numbers = title_words(listing)
+        entry = _Entry(listing, words, numbers, city_of(listing.location),
+                       (listing.date, region_of(listing.location)), (source_rank, position))
+        key = dedupe_key(listing)
+        match = self._urls.get(key)
+        if match is not None:
+            self.url_matches += 1
+        else:
+            match = next((other for other in self._blocks.get(entry.block, ())
+                          if self._same_auction(entry, other)), None)
+            if match is None:
+                self._urls[key] = entry
+                self._blocks.setdefault(entry.block, []).append(entry)
+                return None
+            self.near_matches += 1
+            self._urls[key] = match
+
+        if entry.rank >= match.rank:
+            return listing
+        dropped = match.listing
+        if entry.block != match.block:
+            self._blocks[match.block].remove(match)
+            self._blocks.setdefault(entry.block, []).append(match)
+        # Replace in place, so every URL already pointing at the group follows
+        for field in _Entry.__slots__:
+            setattr(match, field, getattr(entry, field))
+        return dropped
+
+    def kept(self) -> list[AuctionListing]:
+        """The surviving listings, by source priority and then in each source's order."""
+        entries = [entry for block in self._blocks.values() for entry in block]
+        return [entry.listing for entry in sorted(entries, key=lambda entry: entry.rank)]
+
+    def _same_auction(self, a: _Entry, b: _Entry) -> bool:
+        if a.numbers and b.numbers and a.numbers != b.numbers:
+            return False
+        if (a.listing.source == b.listing.source and a.listing.item_count is not None
+                and b.listing.item_count is not None
+                and a.listing.item_count != b.listing.item_count):
+            return False
+        if len(a.words) <= 1 or len(b.words) <= 1:
+            return False
+        same_city = bool(a.city) and a.city == b.city
+        if (a.listing.source != b.listing.source and not same_city
+                and len(a.words & b.words) < MIN_SHARED_WORDS):
+            return False
+        threshold = self.same_city_title_match if same_city else self.title_match
+        return similarity(a.words, b.words) >= threshold
@@ -0,0 +1,150 @@
+"""Stable listing IDs and the delta feed published next to the snapshot.
+
+Every listing in ``auctions.json`` carries an ``id`` derived from its source
+and canonical URL, so the same auction keeps its ID from run to run. Each
+time the snapshot's content changes, its ``sequence`` number goes up by one
+and the change is recorded in ``auctions.delta.json``:
+
+    {
+      "sequence": 42,
+      "deltas": [                       # oldest first, at most MAX_DELTAS
+        {
+          "sequence": 42, "base_sequence": 41, "generated": "2026-03-14T08:00:00",
+          "added":   [{"id": "...", "title": ..., ...}],
+          "updated": [{"id": "...", "changes": {"date": "2026-03-21", ...}}],
+          "removed": ["<id>", ...]
+        }
+      ]
+    }
+
+A client holding sequence N applies every delta whose ``base_sequence`` is
+N or later, in order; if its N is older than the first delta's base it
+re-downloads the snapshot.
+
+The previous state is read back from the published snapshot and delta
+files themselves, so the sequence survives a wiped ``.cache``. Listings are
+compared by their encoded JSON (scrapers.listing_json), so only the ones that
+changed are decoded into the delta.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+MAX_DELTAS = 20
+
+# Query parameters that only track the visit and never select a different page
+TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "mc_cid", "mc_eid")
+
+
+def canonical_url(url: str) -> str:
+    """Normalize a URL so trivially different spellings compare equal.
+
+    Lower-cases the scheme and host, drops default ports, fragments, tracking
+    parameters and trailing slashes, and sorts the query string.
+    """
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith(TRACKING_PARAMS)
+    )
+    path = parts.path.rstrip("/")
+    return urlunsplit((parts.scheme.lower(), host, path, urlencode(query), ""))
+
+
+def listing_id(source: str, url: str) -> str:
+    """Stable short ID for a listing: a hash of its source and canonical URL."""
+    key = f"{source}\n{canonical_url(url)}"
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def delta_path(snapshot_path: str) -> str:
+    root, ext = os.path.splitext(snapshot_path)
+    return f"{root}.delta{ext}"
+
+
+def diff(previous: dict[str, dict], current: dict[str, dict]) -> dict:
+    """Added, updated (changed fields only) and removed listings, keyed by ID."""
+    added = [record for id_, record in current.items() if id_ not in previous]
+    removed = [id_ for id_ in previous if id_ not in current]
+    updated = []
+    for id_, record in current.items():
+        old = previous.get(id_)
+        if old is None or old == record:
+            continue
+        changes = {k: v for k, v in record.items() if old.get(k) != v}
+        changes.update({k: None for k in old if k not in record})
+        updated.append({"id": id_, "changes": changes})
+    return {"added": added, "updated": updated, "removed": removed}
+
+
+class DeltaFeed:
+    """Tracks the published snapshot's sequence and builds the next delta."""
+
+    def __init__(self, snapshot_path: str, max_deltas: int = MAX_DELTAS):
+        self.snapshot_path = snapshot_path
+        self.delta_path = delta_path(snapshot_path)
+        self.max_deltas = max_deltas
+        self.logger = logging.getLogger("DeltaFeed")
+
+        snapshot = self._load(self.snapshot_path)
+        self.sequence: int = snapshot.get("sequence", 0)
+        # ID -> compact JSON, as encode_listing writes it; snapshots written
+        # before IDs existed have no "id" field, so it is added back first
+        self.previous: dict[str, str] = {}
+        for record in snapshot.get("auctions", []):
+            id_ = record.get("id") or listing_id(record["source"], record["url"])
+            self.previous[id_] = json.dumps({"id": id_, **record}, ensure_ascii=False,
+                                            separators=(",", ":"))
+        self.deltas: list[dict] = [
+            d for d in self._load(self.delta_path).get("deltas", [])
+            if d.get("sequence", 0) <= self.sequence
+        ]
+
+    def _load(self, path: str) -> dict:
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable {path}: {e}")
+            return {}
+
+    def update(self, encoded: dict[str, str]) -> dict | None:
+        """Record this run's listings; returns the new delta, or None if nothing changed.
+
+        ``encoded`` maps each listing's ID to its JSON with the ``id`` first
+        (``encode_listing(listing, id)``). ``self.sequence`` is bumped when a
+        delta is produced.
+        """
+        current = {id_: json.loads(text) for id_, text in encoded.items()
+                   if self.previous.get(id_) != text}
+        previous = {id_: json.loads(text) for id_, text in self.previous.items()
+                    if id_ in current or id_ not in encoded}
+        changes = diff(previous, current)
+        if not any(changes.values()):
+            return None
+
+        self.sequence += 1
+        delta = {
+            "sequence": self.sequence,
+            "base_sequence": self.sequence - 1,
+            "generated": datetime.now().isoformat(timespec="seconds"),
+            **changes,
+        }
+        self.deltas = (self.deltas + [delta])[-self.max_deltas:]
+        self.previous = dict(encoded)
+        self.logger.info(f"Sequence {self.sequence}: {len(changes['added'])} added, "
+                         f"{len(changes['updated'])} updated, {len(changes['removed'])} removed")
+        return delta
+
+    def document(self) -> dict:
+        """The delta file contents for the current sequence."""
+        return {"sequence": self.sequence, "deltas": self.deltas}
@@ -0,0 +1,66 @@
+"""Browser-side extraction of auction card markup.
+
+``driver.page_source`` serializes the whole rendered document, ships it over
+the WebDriver connection and leaves Python to parse all of it just to find a
+few dozen cards; on the Ritchie Bros SPA the cards are a small fraction of
+the DOM. ``extract_cards`` instead runs one script in the page that returns
+only the outer HTML of the top-level elements matching the card selector,
+plus the few pagination hints ``PageCrawler`` needs, in a single round trip:
+
+    page = extract_cards(driver, "div.auction-card", self.logger)
+    soup = self.make_soup(page.html)       # contains just the cards
+    urls = crawler.page_urls(page.hrefs, page.labels, self.base_url, 10)
+
+Cards nested inside another match are left to their outer card, so selectors
+that also match sub-elements (``div[data-testid^="auction-card-"]``) yield
+each card once.
+"""
+
+import logging
+from dataclasses import dataclass, field
+
+from scrapers.metrics import current
+
+EXTRACT_SCRIPT = """
+const selector = arguments[0];
+const cards = [];
+for (const el of document.querySelectorAll(selector)) {
+    if (!el.parentElement || !el.parentElement.closest(selector)) cards.push(el.outerHTML);
+}
+const hrefs = Array.from(document.querySelectorAll('a[href*="page="]'), a => a.getAttribute('href'));
+const labels = [];
+for (const el of document.querySelectorAll('[aria-label]')) {
+    const label = el.getAttribute('aria-label');
+    if (/page\\s*\\d+/i.test(label)) labels.push(label);
+}
+return {cards: cards, hrefs: hrefs, labels: labels};
+"""
+
+
+@dataclass
+class ExtractedPage:
+    """Card markup and pagination hints pulled from one rendered page."""
+
+    cards: list[str] = field(default_factory=list)
+    hrefs: list[str] = field(default_factory=list)   # pagination link targets
+    labels: list[str] = field(default_factory=list)  # "Go to page N" style aria-labels
+
+    @property
+    def html(self) -> str:
+        """All cards as one HTML fragment, ready for ``make_soup``/``select_cards``."""
+        return "\n".join(self.cards)
+
+
+def extract_cards(driver, selector: str, logger: logging.Logger | None = None) -> ExtractedPage:
+    """Collect the top-level elements matching ``selector`` on the current tab."""
+    metrics = current()
+    with metrics.phase("fetch"):
+        result = driver.execute_script(EXTRACT_SCRIPT, selector) or {}
+    page = ExtractedPage(result.get("cards") or [], result.get("hrefs") or [],
+                         result.get("labels") or [])
+    size = sum(len(card) for card in page.cards)
+    metrics.add("pages")
+    metrics.add("dom_bytes", size)
+    if logger:
+        logger.debug(f"Extracted {len(page.cards)} cards ({size / 1024:.0f} KB) in the browser")
+    return page
@@ -9,25 +9,40 @@ DOM Structure (discovered 2026-03-11):
     div.auction-card__timeline           -> "First lot closing on Mar 13, 2026 at 9:00AM PDT"
     span with "Running"/"Upcoming"/etc   -> status
     "LOTS" + number                      -> lot count
+
+Only the card markup is pulled out of the browser (scrapers.dom_extract).
+Pages past the first are loaded in parallel tabs by scrapers.pagination.
 """
 
 import re
-import time
+from itertools import chain
+from typing import Iterable, Iterator
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 
 from scrapers.base_scraper import BaseScraper, AuctionListing
+from scrapers.browser_pool import BROWSER_POOL
+from scrapers.dom_extract import extract_cards
+from scrapers.metrics import current
+from scrapers.pagination import PageCrawler
+from scrapers.readiness import wait_until_ready
 
 
 class GACScraper(BaseScraper):
 
+    # Upper bound on settling time after the first cards appear
+    READY_MAX_WAIT = 2
+    # Waiting for a pooled browser tab, page load and a possible retry
+    TIME_BUDGET = 150
+    USES_BROWSER = True
+    MAX_PAGES = 10
+    MAX_PARALLEL_PAGES = 3
+    # Results are listed by closing date, so pages past the query window can be skipped
+    PAGES_IN_DATE_ORDER = True
+
     @property
     def source_name(self) -> str:
         return "GAC"
@@ -36,49 +51,56 @@ class GACScraper(BaseScraper):
     def base_url(self) -> str:
         return "https://gacbids.com/auctions"
 
-    def _scrape_impl(self) -> list[AuctionListing]:
-        options = Options()
-        options.add_argument("--headless=new")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument(
-            "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-        )
+    def _scrape_impl(self) -> Iterator[AuctionListing]:
+        with BROWSER_POOL.tab(self.time_left()) as driver:
+            self.retry_fetch(driver.get, self.base_url)
+            with current().phase("wait"):
+                try:
+                    WebDriverWait(driver, 15).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, "div.auction-card"))
+                    )
+                except Exception:
+                    self.logger.warning("Timeout waiting for auction cards")
+            wait_until_ready(driver, "div.auction-card", self.READY_MAX_WAIT, self.logger)
+
+            first = extract_cards(driver, "div.auction-card", self.logger)
+            soup = self.make_soup(first.html)
+            crawler = PageCrawler(driver, self.MAX_PARALLEL_PAGES, self.logger)
+            page_urls = crawler.page_urls(first.hrefs, first.labels,
+                                          self.base_url, self.MAX_PAGES)
+            more_pages = crawler.crawl(page_urls, "div.auction-card", self.READY_MAX_WAIT,
+                                       parse=self.make_soup)
+            # Listings stream out while the remaining pages are still loading
+            yield from self._parse_cards(soup, more_pages)
+
+    def _parse_cards(self, soup: BeautifulSoup,
+                     more_pages: Iterable[BeautifulSoup] = ()) -> Iterator[AuctionListing]:
+        """Parse the cards of the first page and of any further pages as they stream in."""
+        def cards():
+            for page in chain([soup], more_pages):
+                page_cards = page.select("div.auction-card")
+                self.logger.info(f"Found {len(page_cards)} auction cards")
+                yield from page_cards
+                if self.PAGES_IN_DATE_ORDER and self.query.past_window(
+                        self._card_date(card) for card in page_cards):
+                    self.logger.info("Remaining pages are past the date window, not loading them")
+                    break
+            close = getattr(more_pages, "close", None)
+            if close:
+                close()
+
+        return self.iter_cards(cards(), self._parse_card, in_scope=self._card_in_scope)
+
+    def _card_date(self, card) -> str | None:
+        """ISO closing date from the card's timeline, or None if it has none."""
+        timeline_el = card.select_one("div.auction-card__timeline")
+        found = self.find_date(timeline_el.get_text(strip=True)) if timeline_el else None
+        return found[0] if found else None
 
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
-
-        try:
-            driver.get(self.base_url)
-            try:
-                WebDriverWait(driver, 15).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.auction-card"))
-                )
-            except Exception:
-                self.logger.warning("Timeout waiting for auction cards")
-            time.sleep(2)
-
-            soup = BeautifulSoup(driver.page_source, "lxml")
-            return self._parse_cards(soup)
-        finally:
-            driver.quit()
-
-    def _parse_cards(self, soup: BeautifulSoup) -> list[AuctionListing]:
-        listings = []
-        cards = soup.select("div.auction-card")
-        self.logger.info(f"Found {len(cards)} auction cards")
-
-        for card in cards:
-            try:
-                listing = self._parse_card(card)
-                if listing:
-                    listings.append(listing)
-            except Exception as e:
-                self.logger.warning(f"Failed to parse card: {e}")
-
-        return listings
+    def _card_in_scope(self, card) -> bool:
+        """Date check on the timeline alone; GAC only sells out of Redlands."""
+        iso_date = self._card_date(card)
+        return iso_date is None or self.query.in_window(iso_date)
 
     def _parse_card(self, card) -> AuctionListing | None:
         # Title + URL
@@ -93,32 +115,9 @@ class GACScraper(BaseScraper):
         timeline_el = card.select_one("div.auction-card__timeline")
         raw_timeline = timeline_el.get_text(strip=True) if timeline_el else ""
 
-        iso_date = "2099-12-31"
-        display_date = "Date TBD"
-
-        date_match = re.search(
-            r'([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})',
-            raw_timeline
-        )
-        if date_match:
-            month, day, year = date_match.group(1), date_match.group(2), date_match.group(3)
-            try:
-                iso_date, display_date = self.parse_date(f"{month} {day}, {year}")
-            except ValueError:
-                pass
-
-        # Also try parsing date from the title itself (e.g., "MARCH 13TH, 2026 PUBLIC AUCTION...")
-        if iso_date == "2099-12-31":
-            title_date = re.search(
-                r'([A-Za-z]+)\s+(\d{1,2})(?:ST|ND|RD|TH)?,?\s+(\d{4})',
-                title, re.IGNORECASE
-            )
-            if title_date:
-                month, day, year = title_date.group(1), title_date.group(2), title_date.group(3)
-                try:
-                    iso_date, display_date = self.parse_date(f"{month} {day}, {year}")
-                except ValueError:
-                    pass
+        # Fall back to the date in the title itself (e.g., "MARCH 13TH, 2026 PUBLIC AUCTION...")
+        found = self.find_date(raw_timeline) or self.find_date(title)
+        iso_date, display_date = found or ("2099-12-31", "Date TBD")
 
         # Location
         loc_el = card.select_one("div.auction-card__location-info")
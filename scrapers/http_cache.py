@@ -0,0 +1,91 @@
+"""Persistent HTTP response cache with ETag / Last-Modified revalidation.
+
+Stores each cached page's body and validators under ``.cache/http`` and turns
+the next fetch of that URL into a conditional request. When the server answers
+``304 Not Modified`` the stored body is served instead, so callers always see
+a complete 200 response; ``response.from_cache`` tells them which happened.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+
+import requests
+
+logger = logging.getLogger("HttpCache")
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    tmp = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+class HttpCache:
+    """On-disk store of response bodies and their validators, keyed by URL."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._lock = threading.Lock()
+
+    def _paths(self, url: str) -> tuple[str, str]:
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return (os.path.join(self.directory, f"{key}.json"),
+                os.path.join(self.directory, f"{key}.body"))
+
+    def lookup(self, url: str) -> dict | None:
+        """Return the cached entry for ``url`` (metadata plus ``body``), if any."""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                entry = json.load(f)
+            with open(body_path, "rb") as f:
+                entry["body"] = f.read()
+        except (OSError, ValueError):
+            return None
+        return entry
+
+    @staticmethod
+    def conditional_headers(entry: dict) -> dict:
+        """Request headers that revalidate ``entry`` with the origin server."""
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url: str, resp: requests.Response) -> None:
+        """Save a 200 response if it carries validators worth revalidating."""
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        meta_path, body_path = self._paths(url)
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "encoding": resp.encoding,
+        }
+        try:
+            with self._lock:
+                os.makedirs(self.directory, exist_ok=True)
+            # Body first, so a crash never leaves metadata pointing at a stale body
+            _atomic_write(body_path, resp.content)
+            _atomic_write(meta_path, json.dumps(meta).encode("utf-8"))
+        except OSError as e:
+            logger.warning(f"Could not cache {url}: {e}")
+
+    @staticmethod
+    def apply(resp: requests.Response, entry: dict) -> requests.Response:
+        """Turn a 304 response into a 200 carrying the cached body."""
+        resp.status_code = 200
+        resp._content = entry["body"]
+        resp.encoding = entry.get("encoding")
+        resp.from_cache = True
+        return resp
@@ -0,0 +1,160 @@
+"""Shared HTTP client for the requests-based scrapers.
+
+One pooled ``requests.Session`` is shared by every scraper, so repeat fetches
+to the same host (detail pages, pagination) reuse kept-alive connections
+instead of paying a new TLS handshake each time. Responses are negotiated
+with gzip/deflate, plus brotli when the ``brotli`` package is installed.
+
+Each host gets a concurrency cap and a token-bucket rate limit so that
+concurrent scrapers and bulk fetches stay polite. With ``use_cache=True``
+the request is revalidated against the on-disk ``HttpCache``:
+
+    resp = HTTP_CLIENT.get(url)
+    resp = HTTP_CLIENT.get(url, use_cache=True)   # resp.from_cache on a 304
+    pages = HTTP_CLIENT.get_many(urls)            # concurrent, via asyncio
+    pages = await HTTP_CLIENT.fetch_all(urls)     # the same, from a coroutine
+"""
+
+import asyncio
+import contextvars
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING  # includes "br" only if brotli is importable
+
+from scrapers import CACHE_DIR
+from scrapers.http_cache import HttpCache
+from scrapers.metrics import current
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+DEFAULT_TIMEOUT = 30  # seconds
+HTTP_CACHE_DIR = os.path.join(CACHE_DIR, "http")
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens per second, up to ``burst``."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class HttpClient:
+    """Pooled session with per-host concurrency caps and rate limits."""
+
+    def __init__(self, per_host_limit: int = 2, rate: float = 2.0, burst: int = 4,
+                 pool_size: int = 10, cache: HttpCache | None = None):
+        self.per_host_limit = per_host_limit
+        self.cache = cache
+        self.rate = rate
+        self.burst = burst
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "User-Agent": USER_AGENT,
+            "Accept-Encoding": ACCEPT_ENCODING,
+        })
+        self._hosts: dict[str, tuple[threading.BoundedSemaphore, TokenBucket]] = {}
+        self._hosts_lock = threading.Lock()
+
+    def _host_limits(self, url: str) -> tuple[threading.BoundedSemaphore, TokenBucket]:
+        host = urlsplit(url).hostname or ""
+        with self._hosts_lock:
+            if host not in self._hosts:
+                self._hosts[host] = (
+                    threading.BoundedSemaphore(self.per_host_limit),
+                    TokenBucket(self.rate, self.burst),
+                )
+            return self._hosts[host]
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send any request through the shared session, respecting the host's limits."""
+        kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+        slots, bucket = self._host_limits(url)
+        metrics = current()
+        # Waiting on the host's limits counts as fetch time too
+        with metrics.phase("fetch"), slots:
+            bucket.acquire()
+            resp = self.session.request(method, url, **kwargs)
+        metrics.add("requests")
+        metrics.add("http_bytes", len(resp.content))
+        return resp
+
+    def get(self, url: str, use_cache: bool = False, **kwargs) -> requests.Response:
+        """GET ``url`` through the shared session, respecting the host's limits.
+
+        With ``use_cache`` a cached copy is revalidated with If-None-Match /
+        If-Modified-Since and served (as a 200 with ``from_cache = True``)
+        when the server answers 304.
+        """
+        entry = None
+        if use_cache and self.cache:
+            entry = self.cache.lookup(url)
+            if entry:
+                kwargs["headers"] = {**kwargs.get("headers", {}), **HttpCache.conditional_headers(entry)}
+
+        resp = self.request("GET", url, **kwargs)
+        resp.from_cache = False
+        if entry and resp.status_code == 304:
+            current().add("cache_hits")
+            return HttpCache.apply(resp, entry)
+        if use_cache and self.cache and resp.status_code == 200:
+            self.cache.store(url, resp)
+        return resp
+
+    async def fetch_all(self, urls: list[str], **kwargs) -> list:
+        """Fetch many URLs concurrently from asyncio.
+
+        Each URL goes through ``get`` in a worker thread, so the host limits
+        and ``use_cache`` revalidation apply as for a single fetch. Returns one
+        entry per URL, in order: the ``Response``, or the exception raised for
+        that URL.
+        """
+        tasks = [asyncio.to_thread(self.get, url, **kwargs) for url in urls]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    def get_many(self, urls: list[str], **kwargs) -> list:
+        """Blocking form of ``fetch_all`` for synchronous callers.
+
+        ``asyncio.run`` can't be nested, so inside a running event loop the
+        fetches get their own loop on a worker thread (coroutines should
+        ``await fetch_all`` instead of blocking their loop).
+        """
+        coro = self.fetch_all(urls, **kwargs)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            # Carry the context over, so the fetches still count for the current source
+            return pool.submit(contextvars.copy_context().run, asyncio.run, coro).result()
+
+    def close(self) -> None:
+        self.session.close()
+
+
+# Shared client for the whole run; master_scraper closes it at the end
+HTTP_CLIENT = HttpClient(cache=HttpCache(HTTP_CACHE_DIR))
@@ -1,4 +1,4 @@
-"""Scraper for JJ Kane Auctions (jjkane.com) — Southern California only.
+"""Scraper for JJ Kane Auctions (jjkane.com), limited to the query's regions.
 
 Static HTML with Bootstrap grid. Simple requests + BeautifulSoup.
 
@@ -12,8 +12,7 @@ DOM Structure (discovered 2026-03-11):
 """
 
 import re
-import requests
-from bs4 import BeautifulSoup
+from typing import Iterable
 
 from scrapers.base_scraper import BaseScraper, AuctionListing
 
@@ -28,39 +27,29 @@ class JJKaneScraper(BaseScraper):
     def base_url(self) -> str:
         return "https://www.jjkane.com/auctions"
 
-    def _scrape_impl(self) -> list[AuctionListing]:
-        resp = requests.get(self.base_url, headers={
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        }, timeout=30)
+    def _scrape_impl(self) -> Iterable[AuctionListing]:
+        resp = self.fetch()
         resp.encoding = "utf-8"
-        resp.raise_for_status()
-
-        soup = BeautifulSoup(resp.text, "lxml")
-        listings = []
+        previous = self.previous_results()
+        if previous is not None:
+            return previous
 
         # Each auction is a div.row.border.shadow-sm
-        cards = soup.select("div.row.border.shadow-sm")
+        cards = self.select_cards(resp.text, "div.row.border.shadow-sm")
         self.logger.info(f"Found {len(cards)} auction cards")
 
-        for card in cards:
-            try:
-                listing = self._parse_card(card)
-                if listing:
-                    listings.append(listing)
-            except Exception as e:
-                self.logger.warning(f"Failed to parse card: {e}")
+        return self.iter_cards(cards, self._parse_card, in_scope=self._card_in_scope)
 
-        return listings
+    def _card_in_scope(self, card) -> bool:
+        """Only the region heading is needed to rule a card out (e.g. "Northern Texas")."""
+        region_el = card.select_one("h2.h3")
+        return region_el is not None and self.query.in_region(region_el.get_text(strip=True))
 
     def _parse_card(self, card) -> AuctionListing | None:
         # Region name from h2
         region_el = card.select_one("h2.h3")
         region = region_el.get_text(strip=True) if region_el else ""
 
-        # Only keep Southern California
-        if "Southern California" not in region:
-            return None
-
         # Auction type from h4
         type_el = card.select_one("h4")
         auction_type = type_el.get_text(strip=True) if type_el else "Online"
@@ -116,7 +105,7 @@ class JJKaneScraper(BaseScraper):
             title=title,
             date=iso_date,
             date_display=display_date,
-            location="Southern California",
+            location=region or "See auction details",
             url=url,
             auction_type=auction_type,
         )
@@ -0,0 +1,58 @@
+"""Direct JSON encoding of listings, without intermediate dicts.
+
+``json.dumps([asdict(l) for l in listings])`` deep-copies every listing into
+a dict before encoding it. ``encode_listing`` writes the JSON text straight
+from the slotted ``AuctionListing`` attributes: the key prefixes are built
+once per class, string values go through the C string encoder, and the
+encoded form of the low-cardinality fields (source, type, location, dates)
+is memoized, so a repeated value is encoded once per process.
+
+The output is identical to ``json.dumps(..., ensure_ascii=False,
+separators=(",", ":"))`` of the ``asdict`` form. The published snapshot,
+its delta feed and the shards are built from these strings (see
+scrapers.output.EncodedArray), as is each source's results snapshot.
+"""
+
+import json
+from dataclasses import fields
+from functools import lru_cache
+from json.encoder import encode_basestring
+
+# Fields with few distinct values across a run
+REPEATED_FIELDS = {"source", "auction_type", "location", "date", "date_display"}
+
+
+@lru_cache(maxsize=8192)
+def _encode_repeated(value) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _encode_value(value) -> str:
+    if isinstance(value, str):
+        return encode_basestring(value)
+    return json.dumps(value, ensure_ascii=False)
+
+
+@lru_cache(maxsize=None)
+def _field_plan(cls) -> tuple[tuple[str, str, bool], ...]:
+    """(attribute, '"key":' prefix, memoize?) per field, with ',' before all but the first."""
+    plan = []
+    for i, f in enumerate(fields(cls)):
+        prefix = ("{" if i == 0 else ",") + encode_basestring(f.name) + ":"
+        plan.append((f.name, prefix, f.name in REPEATED_FIELDS))
+    return tuple(plan)
+
+
+def encode_listing(listing, listing_id: str | None = None) -> str:
+    """One listing as compact JSON, optionally with a leading ``"id"`` member."""
+    parts = []
+    for i, (name, prefix, repeated) in enumerate(_field_plan(type(listing))):
+        if i == 0 and listing_id is not None:
+            parts.append('{"id":' + encode_basestring(listing_id) + "," + prefix[1:])
+        else:
+            parts.append(prefix)
+        value = getattr(listing, name)
+        parts.append(_encode_repeated(value) if repeated else _encode_value(value))
+    parts.append("}")
+    return "".join(parts)
+
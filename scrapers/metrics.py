@@ -0,0 +1,204 @@
+"""Per-source instrumentation and the JSON run report.
+
+``BaseScraper.stream`` gives every source a ``SourceMetrics`` and makes it
+current for the worker thread (a context variable, so it follows
+``HttpClient.fetch_all`` fan-outs too), and the shared helpers (HTTP fetches,
+the browser pool, readiness waits, DOM extraction, card parsing) record into
+it without being handed anything:
+
+    with current().phase("wait"):
+        ...
+    current().add("dom_bytes", len(html))
+
+Phases (seconds, summed over the run):
+
+    driver   leasing a browser tab, including starting Chrome
+    fetch    HTTP requests, page navigation and pulling markup out of the browser
+    wait     waiting for rendered pages to settle
+    parse    building soups and parsing cards
+    retry    attempts that failed, plus the delay before the next one
+
+Counters include ``http_bytes`` / ``dom_bytes`` downloaded, ``requests``,
+``pages``, ``cards`` (and how many were ``skipped`` by the query pre-check,
+``parsed`` or ``reused`` from the card memo), and ``kept`` / ``dropped``
+listings. ``peak_rss_mb`` is the process's peak resident set when the
+source finished; sources run concurrently, so it is an upper bound for any
+one of them.
+
+The orchestrator collects every source into a ``RunReport`` and writes it
+to ``.cache/reports/`` (one file per run); the same per-source entries are
+kept in the listing store's ``source_runs`` table next to the run history.
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+
+from scrapers import CACHE_DIR
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+REPORT_DIR = os.path.join(CACHE_DIR, "reports")
+
+PHASES = ("driver", "fetch", "wait", "parse", "retry")
+
+logger = logging.getLogger("Metrics")
+
+_current: ContextVar["SourceMetrics | None"] = ContextVar("source_metrics", default=None)
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of this process in MB, where the platform reports it."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, kilobytes elsewhere
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+class SourceMetrics:
+    """Timings, counters and outcome of one source's scrape."""
+
+    def __init__(self, source: str):
+        self.source = source
+        self.status = "running"
+        self.error: str | None = None
+        self.attempts = 0
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self.counts: Counter = Counter()
+        self.profile: str | None = None
+        self.peak_rss_mb: float | None = None
+        self._started = time.perf_counter()
+        self.elapsed: float | None = None
+        self._open: set[str] = set()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name: str):
+        """Add the time spent in the block to ``name`` (a nested block of the same phase counts once).
+
+        An exception leaving the block is tagged with ``scrape_phase = name``.
+        """
+        if name in self._open:
+            yield
+            return
+        self._open.add(name)
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            # Innermost phase wins; BaseScraper.stream uses it to decide what to retry
+            if not hasattr(e, "scrape_phase"):
+                e.scrape_phase = name
+            raise
+        finally:
+            self.phases[name] += time.perf_counter() - start
+            self._open.discard(name)
+
+    def add(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self.counts[name] += n
+
+    @contextmanager
+    def activate(self):
+        """Make this the current thread's metrics for the duration of the block."""
+        previous = _current.get()
+        _current.set(self)
+        try:
+            yield self
+        finally:
+            _current.set(previous)
+
+    def finish(self, status: str, error: str | None = None) -> None:
+        """Record the outcome; only the first call counts (a timed-out source may finish later)."""
+        if self.status != "running":
+            return
+        self.status = status
+        self.error = error
+        self.elapsed = time.perf_counter() - self._started
+        self.peak_rss_mb = peak_rss_mb()
+
+    def to_dict(self) -> dict:
+        elapsed = self.elapsed if self.elapsed is not None else time.perf_counter() - self._started
+        return {
+            "source": self.source,
+            "status": self.status,
+            "error": self.error,
+            "attempts": self.attempts,
+            "seconds": round(elapsed, 3),
+            "phases": {name: round(seconds, 3) for name, seconds in self.phases.items()},
+            "counts": dict(self.counts),
+            "peak_rss_mb": self.peak_rss_mb,
+            "profile": self.profile,
+        }
+
+
+# Sink for code running outside a scrape (benchmarks, ad-hoc calls)
+_DISCARD = SourceMetrics("")
+
+
+def current() -> SourceMetrics:
+    """The metrics of the source being scraped on this thread."""
+    return _current.get() or _DISCARD
+
+
+class RunReport:
+    """Every source's metrics for one run, written as one JSON document."""
+
+    def __init__(self, query: str | None = None):
+        self.started = datetime.now().isoformat(timespec="seconds")
+        self.query = query
+        self.sources: dict[str, dict] = {}
+
+    def add(self, metrics: SourceMetrics) -> None:
+        """Snapshot a source's metrics (called once it has finished or timed out)."""
+        self.sources[metrics.source] = metrics.to_dict()
+
+    def set_published(self, counts: dict[str, int]) -> None:
+        """Listings per source that survived the window and dedupe stages."""
+        for source, entry in self.sources.items():
+            entry["counts"]["published"] = counts.get(source, 0)
+
+    def to_dict(self) -> dict:
+        totals = Counter()
+        for entry in self.sources.values():
+            totals.update(entry["counts"])
+        return {
+            "started": self.started,
+            "finished": datetime.now().isoformat(timespec="seconds"),
+            "query": self.query,
+            "peak_rss_mb": peak_rss_mb(),
+            "totals": dict(totals),
+            "sources": list(self.sources.values()),
+        }
+
+    def write(self, directory: str = REPORT_DIR) -> str | None:
+        """Write ``run-<started>.json`` under ``directory``; returns its path."""
+        path = os.path.join(directory, f"run-{self.started.replace(':', '-')}.json")
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.to_dict(), f, indent=2)
+        except OSError as e:
+            logger.warning(f"Could not write run report: {e}")
+            return None
+        return path
+
+    def log_summary(self) -> None:
+        for entry in self.sources.values():
+            phases = " ".join(f"{name} {seconds:.1f}s" for name, seconds in entry["phases"].items()
+                              if seconds >= 0.05)
+            counts = entry["counts"]
+            logger.info(f"{entry['source']}: {entry['status']} in {entry['seconds']:.1f}s "
+                        f"({phases or 'no timed phases'}), {counts.get('cards', 0)} cards, "
+                        f"{counts.get('kept', 0)} kept, {counts.get('published', 0)} published")
@@ -0,0 +1,146 @@
+"""Targeted capture of JSON API responses inside a browser tab.
+
+Reading Chrome's performance log means pulling and ``json.loads``-ing every
+network event of the page (thousands on an SPA) and then calling
+``Network.getResponseBody`` once per candidate. Instead, ``NetworkCapture``
+registers a small script on the tab before navigation that hooks fetch/XHR
+and keeps only responses whose URL contains one of the keywords and whose
+content type matches. Matching bodies are read in the page as they arrive
+(concurrently, by the page's own event loop), buffered up to ``max_bytes``,
+and handed to Python in a single round trip by ``collect``.
+
+Classic WebDriver can't subscribe to CDP events, so the filtering happens in
+the page; each captured entry also records how the request was made (method,
+headers, body) so it can be replayed later.
+
+Time spent in the hooks and in the collection round trip is reported as
+capture overhead, separately from page load time.
+"""
+
+import json
+import logging
+import time
+
+CAPTURE_SCRIPT = """
+(() => {
+    const cfg = __CONFIG__;
+    const state = {entries: [], bytes: 0, dropped: 0, overheadMs: 0};
+    Object.defineProperty(window, '__trackerCapture', {get: () => state});
+
+    const wanted = (url, type) => {
+        const u = (url || '').toLowerCase();
+        return cfg.keywords.some(k => u.includes(k)) && (type || '').includes(cfg.mime);
+    };
+    const keep = (entry) => {
+        const t0 = performance.now();
+        if (state.bytes + entry.body.length > cfg.maxBytes) {
+            state.dropped++;
+        } else {
+            state.bytes += entry.body.length;
+            state.entries.push(entry);
+        }
+        state.overheadMs += performance.now() - t0;
+    };
+
+    const origFetch = window.fetch;
+    if (origFetch) {
+        window.fetch = function (input, init) {
+            const promise = origFetch.apply(this, arguments);
+            promise.then(resp => {
+                const t0 = performance.now();
+                if (!wanted(resp.url, resp.headers.get('content-type'))) {
+                    state.overheadMs += performance.now() - t0;
+                    return;
+                }
+                const headers = {};
+                new Headers((init && init.headers) || (input instanceof Request ? input.headers : undefined))
+                    .forEach((v, k) => { headers[k] = v; });
+                const request = {
+                    url: resp.url,
+                    method: (init && init.method) || (input instanceof Request ? input.method : 'GET'),
+                    headers: headers,
+                    postData: init && typeof init.body === 'string' ? init.body : null,
+                };
+                state.overheadMs += performance.now() - t0;
+                resp.clone().text().then(body => keep({...request, status: resp.status, body: body}));
+            }, () => {});
+            return promise;
+        };
+    }
+
+    const open = XMLHttpRequest.prototype.open;
+    const setHeader = XMLHttpRequest.prototype.setRequestHeader;
+    const send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.open = function (method, url) {
+        this.__trackerRequest = {method: method, url: String(url), headers: {}, postData: null};
+        return open.apply(this, arguments);
+    };
+    XMLHttpRequest.prototype.setRequestHeader = function (name, value) {
+        if (this.__trackerRequest) this.__trackerRequest.headers[name] = value;
+        return setHeader.apply(this, arguments);
+    };
+    XMLHttpRequest.prototype.send = function (body) {
+        const request = this.__trackerRequest;
+        if (request) {
+            request.postData = typeof body === 'string' ? body : null;
+            this.addEventListener('load', () => {
+                const t0 = performance.now();
+                if (wanted(this.responseURL, this.getResponseHeader('content-type'))) {
+                    let text = null;
+                    if (this.responseType === '' || this.responseType === 'text') text = this.responseText;
+                    else if (this.responseType === 'json') text = JSON.stringify(this.response);
+                    if (text !== null) {
+                        keep({...request, url: this.responseURL, status: this.status, body: text});
+                    }
+                }
+                state.overheadMs += performance.now() - t0;
+            }, {once: true});
+        }
+        return send.apply(this, arguments);
+    };
+})();
+"""
+
+COLLECT_SCRIPT = """
+const state = window.__trackerCapture;
+if (!state) return null;
+const result = {entries: state.entries, bytes: state.bytes, dropped: state.dropped,
+                overheadMs: state.overheadMs};
+state.entries = [];
+state.bytes = 0;
+return result;
+"""
+
+
+class NetworkCapture:
+    """Collects matching JSON responses from one browser tab."""
+
+    def __init__(self, keywords: list[str], mime: str = "json", max_bytes: int = 8_000_000,
+                 logger: logging.Logger | None = None):
+        self.keywords = [k.lower() for k in keywords]
+        self.mime = mime
+        self.max_bytes = max_bytes
+        self.logger = logger or logging.getLogger(__name__)
+        self.overhead = 0.0  # seconds, hooks + collection
+
+    def install(self, driver) -> None:
+        """Register the capture hooks on the current tab; call before ``driver.get``."""
+        config = {"keywords": self.keywords, "mime": self.mime, "maxBytes": self.max_bytes}
+        script = CAPTURE_SCRIPT.replace("__CONFIG__", json.dumps(config))
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": script})
+
+    def collect(self, driver) -> list[dict]:
+        """Return (and clear) the captured entries: url, method, headers, postData, status, body."""
+        start = time.perf_counter()
+        result = driver.execute_script(COLLECT_SCRIPT)
+        if not result:
+            self.logger.debug("Network capture was not installed on this page")
+            return []
+
+        self.overhead += time.perf_counter() - start + result["overheadMs"] / 1000
+        self.logger.info(
+            f"Captured {len(result['entries'])} API responses "
+            f"({result['bytes'] / 1024:.0f} KB, {result['dropped']} dropped over the cap); "
+            f"capture overhead {self.overhead:.3f}s"
+        )
+        return result["entries"]
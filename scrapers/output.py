@@ -0,0 +1,159 @@
+"""Change-aware, atomic writer for the auctions JSON consumed by the sites.
+
+The output used to be re-serialized and rewritten in place on every run,
+even when only ``last_updated`` had changed, which meant a needless git
+commit and redeploy for both sites and a window where a reader could see a
+half-written file. ``OutputWriter``:
+
+* serializes the document once per format, with the volatile fields
+  (``last_updated``) swapped for a placeholder, so the text itself is the
+  content to hash and the real timestamp is spliced in afterwards;
+* skips the write when the hash matches the last one written to that path
+  and the file is still the one it wrote (same size and mtime);
+* writes through a temp file in the same directory and ``os.replace``;
+* optionally writes a minified copy next to each file (``auctions.min.json``),
+  or writes only the compact form (``pretty=False``, used for data shards);
+* splices ``EncodedArray`` members in as they are, so listings already
+  encoded by scrapers.listing_json aren't turned back into dicts (one
+  listing per line in the pretty form).
+
+Hashes of the last writes are kept in ``.cache/output_state.json``.
+"""
+
+import hashlib
+import json
+import logging
+import os
+
+from scrapers import CACHE_DIR
+
+STATE_PATH = os.path.join(CACHE_DIR, "output_state.json")
+
+
+def atomic_write(path: str, data: bytes) -> None:
+    """Replace ``path`` with ``data`` so readers see the old or new file, never a mix."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def _placeholder(key: str) -> str:
+    # Control characters are always escaped by json.dumps, so this can't collide with data
+    return f"\x00{key}\x00"
+
+
+class EncodedArray(list):
+    """A top-level JSON array whose items are already-encoded JSON text."""
+
+
+def _splice(text: str, key: str, items: list[str], indent: int | None) -> str:
+    token = json.dumps(_placeholder(key))
+    if indent is None or not items:
+        array = "[" + ",".join(items) + "]"
+    else:
+        line = text[text.rfind("\n", 0, text.index(token)) + 1:]
+        outer = line[:len(line) - len(line.lstrip(" "))]
+        inner = outer + " " * indent
+        array = "[\n" + ",\n".join(inner + item for item in items) + "\n" + outer + "]"
+    return text.replace(token, array, 1)
+
+
+def minified_path(path: str) -> str:
+    root, ext = os.path.splitext(path)
+    return f"{root}.min{ext}"
+
+
+class OutputWriter:
+    """Writes one JSON document to several paths, only when its content changed."""
+
+    def __init__(self, paths: list[str], minified: bool = False, pretty: bool = True,
+                 volatile: tuple[str, ...] = ("last_updated",), state_path: str = STATE_PATH):
+        self.paths = paths
+        self.minified = minified
+        self.pretty = pretty
+        self.volatile = volatile
+        self.state_path = state_path
+        self.logger = logging.getLogger("OutputWriter")
+        self.digests: dict[str, str] = {}  # path -> content hash of the latest write() call
+        try:
+            with open(state_path, encoding="utf-8") as f:
+                self._state: dict[str, dict] = json.load(f)
+        except (OSError, ValueError):
+            self._state = {}
+
+    def _render(self, document: dict, **dump_kwargs) -> tuple[str, str]:
+        """Return (text, content hash); the hash ignores the volatile fields."""
+        masked = {k: (_placeholder(k) if k in self.volatile or isinstance(v, EncodedArray) else v)
+                  for k, v in document.items()}
+        text = json.dumps(masked, ensure_ascii=False, **dump_kwargs)
+        for key, value in document.items():
+            if isinstance(value, EncodedArray):
+                text = _splice(text, key, value, dump_kwargs.get("indent"))
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        for key in self.volatile:
+            if key in document:
+                value = json.dumps(document[key], ensure_ascii=False)
+                text = text.replace(json.dumps(_placeholder(key)), value, 1)
+        return text, digest
+
+    def _unchanged(self, path: str, digest: str) -> bool:
+        saved = self._state.get(path)
+        if not saved or saved["hash"] != digest:
+            return False
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        return st.st_size == saved["size"] and st.st_mtime_ns == saved["mtime_ns"]
+
+    def _write_one(self, path: str, text: str, digest: str) -> bool:
+        self.digests[path] = digest
+        if self._unchanged(path, digest):
+            self.logger.debug(f"Unchanged, not rewriting {path}")
+            return False
+        try:
+            atomic_write(path, text.encode("utf-8"))
+            st = os.stat(path)
+        except OSError as e:
+            self.logger.warning(f"Could not write to {path}: {e}")
+            return False
+        self._state[path] = {"hash": digest, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+        self.logger.info(f"Wrote {path} ({st.st_size / 1024:.0f} KB)")
+        return True
+
+    def write(self, document: dict, paths: list[str] | None = None) -> bool:
+        """Write ``document`` everywhere it changed; True if any file was written.
+
+        ``paths`` overrides the writer's paths for this call.
+        """
+        formats = []
+        if self.pretty:
+            formats.append((None, self._render(document, indent=2)))
+        if self.minified or not self.pretty:
+            compact = self._render(document, separators=(",", ":"))
+            formats.append((minified_path if self.pretty else None, compact))
+
+        written = False
+        for path in self.paths if paths is None else paths:
+            for transform, (text, digest) in formats:
+                target = transform(path) if transform else path
+                written |= self._write_one(os.path.normpath(target), text, digest)
+
+        if written:
+            self._save_state()
+        return written
+
+    def _save_state(self) -> None:
+        try:
+            atomic_write(self.state_path, json.dumps(self._state, indent=1).encode("utf-8"))
+        except OSError as e:
+            self.logger.warning(f"Could not save output state: {e}")
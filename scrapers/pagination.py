@@ -0,0 +1,128 @@
+"""Concurrent pagination crawler for the browser-rendered listing pages.
+
+The browser scrapers used to read only the first page of results. The
+crawler works out how many pages a listing has from the first page's
+pagination controls, then loads the remaining pages in extra tabs of the
+same leased browser session:
+
+    crawler = PageCrawler(driver, max_parallel=3, logger=self.logger)
+    first = extract_cards(driver, "div.auction-card")
+    urls = crawler.page_urls(first.hrefs, first.labels, self.base_url, max_pages=10)
+    for soup in crawler.crawl(urls, "div.auction-card", max_wait=2):
+        ...
+
+Up to ``max_parallel`` tabs are navigating at once. Navigation is started
+with ``location.href`` so WebDriver doesn't block while the page loads, so
+the browser fetches and renders those pages concurrently. Each page's cards
+are extracted in the browser (scrapers.dom_extract) and yielded, already
+parsed, in order as each page settles, and the next tab is opened as soon as
+one is consumed.
+"""
+
+import logging
+import re
+from collections import deque
+from typing import Callable, Iterator
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from selenium.common.exceptions import WebDriverException
+
+from scrapers.browser_pool import open_tab
+from scrapers.dom_extract import extract_cards
+from scrapers.parsing import parse_html
+from scrapers.readiness import wait_until_ready
+
+PAGE_HREF_RE = re.compile(r"[?&]page=(\d+)")
+PAGE_LABEL_RE = re.compile(r"^(?:go to )?page (\d+)$", re.IGNORECASE)
+
+
+def with_page(url: str, page: int, param: str = "page") -> str:
+    """Return ``url`` with its ``param`` query parameter set to ``page``."""
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query, keep_blank_values=True))
+    query[param] = str(page)
+    return parts._replace(query=urlencode(query)).geturl()
+
+
+class PageCrawler:
+    """Loads extra listing pages in parallel tabs of one WebDriver session."""
+
+    def __init__(self, driver, max_parallel: int = 3, logger: logging.Logger | None = None):
+        self.driver = driver
+        self.max_parallel = max(1, max_parallel)
+        self.logger = logger or logging.getLogger(__name__)
+
+    def page_urls(self, hrefs: list[str], labels: list[str], base_url: str,
+                  max_pages: int) -> list[str]:
+        """URLs of pages 2..N, where N is the highest page the pagination links to.
+
+        ``hrefs`` and ``labels`` are the page's link targets and aria-labels,
+        as returned by ``extract_cards``.
+        """
+        numbers = {1}
+        for href in hrefs:
+            match = PAGE_HREF_RE.search(href)
+            if match:
+                numbers.add(int(match.group(1)))
+        for label in labels:
+            match = PAGE_LABEL_RE.match(label.strip())
+            if match:
+                numbers.add(int(match.group(1)))
+
+        total = max(numbers)
+        if total > max_pages:
+            self.logger.warning(f"Listing has {total} pages, only crawling the first {max_pages}")
+            total = max_pages
+        if total > 1:
+            self.logger.info(f"Crawling {total - 1} more pages, {self.max_parallel} at a time")
+        return [with_page(base_url, n) for n in range(2, total + 1)]
+
+    def crawl(self, urls: list[str], card_selector: str, max_wait: float,
+              parse: Callable[[str], object] = parse_html) -> Iterator:
+        """Yield each page's parsed cards, in order, as soon as it has settled.
+
+        Only the elements matching ``card_selector`` are pulled out of the
+        page; ``parse`` turns that markup into a soup, and scrapers pass their
+        ``make_soup`` so extra pages use the same backend as the first one.
+
+        A page that fails to load is logged and skipped; every tab the crawl
+        opens is closed, whatever happens. The session is left focused on the
+        tab it had before the crawl.
+        """
+        home = self.driver.current_window_handle
+        waiting = deque(urls)
+        loading: deque[tuple[str, str]] = deque()
+        try:
+            while waiting or loading:
+                while waiting and len(loading) < self.max_parallel:
+                    url = waiting.popleft()
+                    handle = open_tab(self.driver)
+                    self.driver.execute_script("window.location.href = arguments[0];", url)
+                    loading.append((url, handle))
+
+                url, handle = loading.popleft()
+                html = None
+                try:
+                    self.driver.switch_to.window(handle)
+                    wait_until_ready(self.driver, card_selector, max_wait, self.logger)
+                    html = extract_cards(self.driver, card_selector, self.logger).html
+                except WebDriverException as e:
+                    self.logger.warning(f"Failed to load page {url}: {e}")
+                finally:
+                    self._close_tab(handle, home)
+                if html is not None:
+                    yield parse(html)
+        finally:
+            for _, handle in loading:
+                self._close_tab(handle, home)
+            self.driver.switch_to.window(home)
+
+    def _close_tab(self, handle: str, home: str) -> None:
+        """Close ``handle`` and focus ``home``: a closed window can't open the next tab."""
+        try:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        except WebDriverException:
+            pass  # already gone
+        finally:
+            self.driver.switch_to.window(home)
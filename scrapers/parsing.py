@@ -0,0 +1,137 @@
+"""Pluggable HTML parsing backends.
+
+Every scraper used to build a full BeautifulSoup tree of the page. The lxml
+backends skip BeautifulSoup's Python-level tree and work on lxml elements
+directly, with CSS selectors compiled once and cached:
+
+    bs4           BeautifulSoup(html, "lxml") — the original behaviour
+    lxml          full lxml tree, wrapped in LxmlNode
+    lxml-partial  like lxml, but ``select_cards`` builds only the card
+                  subtrees and never materializes the rest of the page
+
+``LxmlNode`` implements the subset of the BeautifulSoup ``Tag`` API the
+scrapers use (select, select_one, find_all, get_text, get, [] and str), so
+parsing code runs unchanged on either backend. Text inside script, style and
+template elements is ignored, as BeautifulSoup does.
+"""
+
+import io
+import re
+from functools import lru_cache
+
+import lxml.html
+from bs4 import BeautifulSoup
+from lxml import etree
+from lxml.cssselect import CSSSelector
+
+BACKENDS = ("bs4", "lxml", "lxml-partial")
+
+_TEXT = etree.XPath(
+    ".//text()[not(ancestor::script or ancestor::style or ancestor::template)]",
+    smart_strings=False,
+)
+
+
+@lru_cache(maxsize=256)
+def compiled(selector: str) -> CSSSelector:
+    """Compile a CSS selector once per process."""
+    return CSSSelector(selector, translator="html")
+
+
+def _matches(value, wanted) -> bool:
+    if wanted is True:
+        return value is not None
+    if value is None:
+        return False
+    if isinstance(wanted, re.Pattern):
+        return wanted.search(value) is not None
+    return value == wanted
+
+
+class LxmlNode:
+    """BeautifulSoup-compatible view of an lxml element."""
+
+    __slots__ = ("el",)
+
+    def __init__(self, el):
+        self.el = el
+
+    def select(self, selector: str) -> list["LxmlNode"]:
+        el = self.el
+        return [LxmlNode(match) for match in compiled(selector)(el) if match is not el]
+
+    def select_one(self, selector: str) -> "LxmlNode | None":
+        el = self.el
+        for match in compiled(selector)(el):
+            if match is not el:
+                return LxmlNode(match)
+        return None
+
+    def find_all(self, name: str | None = None, attrs: dict | None = None, **kwargs) -> list["LxmlNode"]:
+        wanted = {**(attrs or {}), **kwargs}
+        found = []
+        for match in (self.el.iterdescendants(name) if name else self.el.iterdescendants()):
+            if not isinstance(match.tag, str):
+                continue  # comments and processing instructions
+            if all(_matches(match.get(k), v) for k, v in wanted.items()):
+                found.append(LxmlNode(match))
+        return found
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        texts = _TEXT(self.el)
+        if strip:
+            return separator.join(t for t in (t.strip() for t in texts) if t)
+        return separator.join(texts)
+
+    def get(self, key: str, default=None):
+        return self.el.get(key, default)
+
+    def __getitem__(self, key: str) -> str:
+        return self.el.attrib[key]
+
+    def __str__(self) -> str:
+        return lxml.html.tostring(self.el, encoding="unicode", with_tail=False)
+
+
+def parse_html(html: str, backend: str = "bs4"):
+    """Parse a whole document with the chosen backend."""
+    if backend == "bs4":
+        return BeautifulSoup(html, "lxml")
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown parser backend: {backend}")
+    try:
+        return LxmlNode(lxml.html.document_fromstring(html))
+    except ValueError:
+        # lxml refuses str input that carries an XML encoding declaration
+        return LxmlNode(lxml.html.document_fromstring(html.encode("utf-8")))
+
+
+def parse_card_subtrees(html: str, selector: str) -> list[LxmlNode]:
+    """Collect only the subtrees matching a simple ``tag.class.class`` selector.
+
+    The page is parsed incrementally and only events for ``tag`` reach
+    Python. Each matching card is detached as soon as it closes and every
+    other ``tag`` element is cleared, so the rest of the page never
+    accumulates in memory.
+    """
+    tag, *classes = selector.split(".")
+    if not tag or not all(classes) or re.search(r"[\s\[\]:>#]", selector):
+        raise ValueError(f"Partial parsing needs a 'tag.class' selector, got {selector!r}")
+    wanted = frozenset(classes)
+
+    cards = []
+    depth = 0  # > 0 while inside a card
+    events = etree.iterparse(io.BytesIO(html.encode("utf-8")), events=("start", "end"), tag=tag,
+                             html=True, encoding="utf-8", no_network=True)
+    for event, el in events:
+        if event == "start":
+            if depth or wanted <= set((el.get("class") or "").split()):
+                depth += 1
+        elif depth:
+            depth -= 1
+            if depth == 0:
+                cards.append(LxmlNode(el))
+                el.getparent().remove(el)
+        else:
+            el.clear()
+    return cards
@@ -0,0 +1,150 @@
+"""Incremental processing of listings as the scrapers stream them in.
+
+The orchestrator used to wait for every scraper, concatenate their lists and
+then filter, deduplicate and write. Now each listing is pushed through a
+chain of stages the moment a scraper yields it:
+
+    collector = CollectStage()
+    pipeline = Pipeline(
+        StoreStage(store),             # record everything in the SQLite store
+        WindowStage(grace, cutoff),    # drop listings outside the date window
+        DedupeStage(priority),         # best-ranked of each duplicate (scrapers.dedupe)
+        collector,                     # what is left, for the JSON writers
+    )
+    pipeline.push(listing) ...
+    pipeline.close()
+    upcoming = collector.sorted()
+
+A stage's ``process`` returns False to stop a listing from reaching the
+stages after it; ``close`` runs once at the end of the run. A stage that
+can only decide once it has seen every listing returns False from
+``process`` and hands its survivors on from ``flush``, which the pipeline
+pushes through the stages after it at close. Only DedupeStage does, so that
+which duplicate wins doesn't depend on arrival order; it and the collector
+are the only stages that hold on to listings.
+"""
+
+import logging
+from typing import Iterable
+
+from scrapers.base_scraper import AuctionListing
+from scrapers.dedupe import DedupeIndex
+from scrapers.store import ListingStore
+
+logger = logging.getLogger("Pipeline")
+
+
+class Stage:
+    """One step of the pipeline."""
+
+    def process(self, listing: AuctionListing) -> bool:
+        """Handle one listing; False drops it from the rest of the pipeline."""
+        return True
+
+    def flush(self) -> Iterable[AuctionListing]:
+        """Listings held back by ``process``, for the later stages; called once at close."""
+        return ()
+
+    def close(self) -> None:
+        """Called once after the last listing."""
+
+
+class Pipeline:
+    """Pushes each listing through the stages in order."""
+
+    def __init__(self, *stages: Stage):
+        self.stages = stages
+        self.received = 0
+
+    def push(self, listing: AuctionListing) -> None:
+        self.received += 1
+        self._push(listing, 0)
+
+    def _push(self, listing: AuctionListing, first: int) -> None:
+        for stage in self.stages[first:]:
+            if not stage.process(listing):
+                return
+
+    def close(self) -> None:
+        for i, stage in enumerate(self.stages):
+            for listing in stage.flush():
+                self._push(listing, i + 1)
+            stage.close()
+
+
+class StoreStage(Stage):
+    """Upserts every listing into the store as part of one run."""
+
+    def __init__(self, store: ListingStore):
+        self.store = store
+        self.run_id = store.begin_run()
+
+    def process(self, listing: AuctionListing) -> bool:
+        self.store.add(listing)
+        return True
+
+    def close(self) -> None:
+        self.store.finish_run()
+
+
+class WindowStage(Stage):
+    """Keeps listings dated within [start, end] (ISO dates)."""
+
+    def __init__(self, start: str, end: str):
+        self.start = start
+        self.end = end
+        self.dropped = 0
+
+    def process(self, listing: AuctionListing) -> bool:
+        if self.start <= listing.date <= self.end:
+            return True
+        self.dropped += 1
+        return False
+
+    def close(self) -> None:
+        if self.dropped:
+            logger.info(f"Filtered out {self.dropped} auctions outside {self.start}..{self.end}")
+
+
+class DedupeStage(Stage):
+    """Drops duplicates (same URL or near-duplicate) and hands on the survivors at close.
+
+    Of two duplicates the one from the source earlier in ``priority`` is
+    kept, whichever arrived first (see scrapers.dedupe), so the same listing
+    is published from run to run.
+    """
+
+    def __init__(self, priority: list[str] | None = None, index: DedupeIndex | None = None):
+        self.index = index or DedupeIndex(priority=priority)
+
+    def process(self, listing: AuctionListing) -> bool:
+        dropped = self.index.add(listing)
+        if dropped is not None:
+            kept = listing if dropped is not listing else None
+            logger.debug(f"Dropped duplicate {dropped.source} '{dropped.title}'"
+                         + (f" in favour of {kept.source} '{kept.title}'" if kept else ""))
+        return False
+
+    def flush(self) -> list[AuctionListing]:
+        return self.index.kept()
+
+    def close(self) -> None:
+        dropped = self.index.url_matches + self.index.near_matches
+        if dropped:
+            logger.info(f"Removed {dropped} duplicate auctions ({self.index.url_matches} by URL, "
+                        f"{self.index.near_matches} near-duplicates)")
+
+
+class CollectStage(Stage):
+    """Keeps the listings that made it this far."""
+
+    def __init__(self):
+        self.listings: list[AuctionListing] = []
+
+    def process(self, listing: AuctionListing) -> bool:
+        self.listings.append(listing)
+        return True
+
+    def sorted(self) -> list[AuctionListing]:
+        """The collected listings by date, in the order they were collected within a day."""
+        return sorted(self.listings, key=lambda a: a.date)
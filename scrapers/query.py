@@ -0,0 +1,87 @@
+"""What a scrape run is looking for: a date window and a set of regions.
+
+The orchestrator builds one ``RunQuery`` per run and hands it to every
+scraper, so out-of-scope auctions are dropped as early as each source
+allows instead of after everything has been parsed:
+
+    query = RunQuery.upcoming(grace_days=3, window_days=30, regions=("CA", "AZ", "NV"))
+    scraper = BarNoneScraper(query)
+
+Card scrapers check a card's cheapest fields (the date or region element)
+before the full parse, browser scrapers stop loading result pages once they
+are past the window, and ``BaseScraper.stream`` drops any listing still
+dated outside it.
+
+Regions are US state codes. ``in_region`` matches either the code as a
+separate token ("Phoenix, AZ 85001") or the state's full name ("Southern
+California").
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import cached_property
+from typing import Iterable
+
+DEFAULT_REGIONS = ("CA", "AZ", "NV")
+
+STATE_NAMES = {
+    "AL": "Alabama", "AK": "Alaska", "AZ": "Arizona", "AR": "Arkansas", "CA": "California",
+    "CO": "Colorado", "CT": "Connecticut", "DE": "Delaware", "FL": "Florida", "GA": "Georgia",
+    "HI": "Hawaii", "ID": "Idaho", "IL": "Illinois", "IN": "Indiana", "IA": "Iowa",
+    "KS": "Kansas", "KY": "Kentucky", "LA": "Louisiana", "ME": "Maine", "MD": "Maryland",
+    "MA": "Massachusetts", "MI": "Michigan", "MN": "Minnesota", "MS": "Mississippi",
+    "MO": "Missouri", "MT": "Montana", "NE": "Nebraska", "NV": "Nevada", "NH": "New Hampshire",
+    "NJ": "New Jersey", "NM": "New Mexico", "NY": "New York", "NC": "North Carolina",
+    "ND": "North Dakota", "OH": "Ohio", "OK": "Oklahoma", "OR": "Oregon", "PA": "Pennsylvania",
+    "RI": "Rhode Island", "SC": "South Carolina", "SD": "South Dakota", "TN": "Tennessee",
+    "TX": "Texas", "UT": "Utah", "VT": "Vermont", "VA": "Virginia", "WA": "Washington",
+    "WV": "West Virginia", "WI": "Wisconsin", "WY": "Wyoming",
+}
+
+
+@dataclass(frozen=True)
+class RunQuery:
+    """Date window [start, end] (ISO dates) and the state codes a run keeps."""
+
+    start: str = "0000-01-01"
+    end: str = "9999-12-31"
+    regions: tuple[str, ...] = DEFAULT_REGIONS
+
+    @classmethod
+    def upcoming(cls, grace_days: int, window_days: int,
+                 regions: Iterable[str] = DEFAULT_REGIONS, today: date | None = None) -> "RunQuery":
+        """Auctions from ``grace_days`` ago up to ``window_days`` ahead."""
+        today = today or date.today()
+        return cls(
+            start=(today - timedelta(days=grace_days)).isoformat(),
+            end=(today + timedelta(days=window_days)).isoformat(),
+            regions=tuple(code.upper() for code in regions),
+        )
+
+    @property
+    def key(self) -> str:
+        """Stable description, stored with saved results so they are only reused for the same query."""
+        return f"{self.start}..{self.end}:{','.join(self.regions)}"
+
+    def in_window(self, iso_date: str) -> bool:
+        return self.start <= iso_date <= self.end
+
+    def past_window(self, iso_dates: Iterable[str | None]) -> bool:
+        """True if at least one date is known and every known date is after the window."""
+        known = [d for d in iso_dates if d]
+        return bool(known) and all(d > self.end for d in known)
+
+    @cached_property
+    def _region_re(self) -> re.Pattern:
+        codes = "|".join(re.escape(code) for code in self.regions)
+        names = "|".join(re.escape(STATE_NAMES[code].upper())
+                         for code in self.regions if code in STATE_NAMES)
+        alternatives = [rf"(?:^|[\s,])(?:{codes})(?:[\s,\d]|$)"] if codes else []
+        if names:
+            alternatives.append(rf"\b(?:{names})\b")
+        return re.compile("|".join(alternatives) or r"(?!)")
+
+    def in_region(self, text: str) -> bool:
+        """Whether ``text`` names one of the regions (by code or full state name)."""
+        return self._region_re.search(text.upper()) is not None
@@ -0,0 +1,106 @@
+"""Adaptive page-readiness detection for the Selenium scrapers.
+
+Replaces the fixed ``time.sleep()`` after ``WebDriverWait``. The page is
+sampled every couple of animation frames and treated as settled once, for
+``QUIET_PERIOD`` seconds in a row:
+
+    - document.readyState is "complete"
+    - no XHR/fetch requests are in flight (counted by PENDING_REQUESTS_SCRIPT,
+      which the browser pool registers on every tab before navigation)
+    - the number of loaded resources (Resource Timing entries) has stopped
+      growing, i.e. the network has gone idle
+    - the card count is non-zero and unchanged across frames
+
+Each source passes its own ``max_wait``; the wait never runs longer than that,
+so the worst case equals the old fixed sleep.
+"""
+
+import logging
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+from scrapers import metrics
+
+# Counts in-flight XHR/fetch calls; must run before any page script
+PENDING_REQUESTS_SCRIPT = """
+(() => {
+    let pending = 0;
+    Object.defineProperty(window, '__trackerPendingRequests', {get: () => pending});
+    const send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        pending++;
+        this.addEventListener('loadend', () => pending--, {once: true});
+        return send.apply(this, arguments);
+    };
+    const origFetch = window.fetch;
+    if (origFetch) {
+        window.fetch = function () {
+            pending++;
+            return origFetch.apply(this, arguments).finally(() => pending--);
+        };
+    }
+})();
+"""
+
+# Waits two animation frames, then reports the page state
+SAMPLE_SCRIPT = """
+const selector = arguments[0];
+const done = arguments[arguments.length - 1];
+requestAnimationFrame(() => requestAnimationFrame(() => done({
+    ready: document.readyState,
+    pending: window.__trackerPendingRequests || 0,
+    resources: performance.getEntriesByType('resource').length,
+    cards: selector ? document.querySelectorAll(selector).length : 0,
+})));
+"""
+
+QUIET_PERIOD = 0.3    # seconds the page must look unchanged
+POLL_INTERVAL = 0.05  # seconds between samples (on top of the two frames)
+
+
+def wait_until_ready(driver, card_selector: str | None = None, max_wait: float = 5.0,
+                     logger: logging.Logger | None = None) -> float:
+    """Block until the page is settled or ``max_wait`` seconds have passed.
+
+    Returns the time spent waiting in seconds and logs it as time-to-ready.
+    """
+    logger = logger or logging.getLogger(__name__)
+    start = time.perf_counter()
+    deadline = start + max_wait
+    previous = None
+    stable_since = start
+    reason = "max wait reached"
+
+    with metrics.current().phase("wait"):
+        while True:
+            try:
+                sample = driver.execute_async_script(SAMPLE_SCRIPT, card_selector)
+            except WebDriverException as e:
+                # Can't observe the page: fall back to waiting out the maximum
+                logger.debug(f"Readiness probe failed: {e}")
+                time.sleep(max(0.0, deadline - time.perf_counter()))
+                reason = "probe failed"
+                break
+
+            now = time.perf_counter()
+            settled = (
+                sample["ready"] == "complete"
+                and sample["pending"] == 0
+                and (not card_selector or sample["cards"] > 0)
+            )
+            current = (sample["cards"], sample["resources"])
+            if not settled or current != previous:
+                stable_since = now
+            elif now - stable_since >= QUIET_PERIOD:
+                reason = f"settled, {sample['cards']} cards"
+                break
+            previous = current
+
+            if now >= deadline:
+                break
+            time.sleep(POLL_INTERVAL)
+
+    elapsed = time.perf_counter() - start
+    logger.info(f"Page ready in {elapsed:.2f}s of {max_wait:.0f}s max ({reason})")
+    return elapsed
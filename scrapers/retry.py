@@ -0,0 +1,99 @@
+"""Retrying transient fetch failures with exponential backoff and jitter.
+
+Only the step that failed is repeated: an HTTP request or a page load is
+retried in place (``call_with_retry``), not the whole scrape, so a flaky
+request doesn't cost a new Chrome tab and a full re-parse. Errors that will
+not go away by asking again (a 404, a parse error) are raised at once, and
+so is a dead browser session (``is_session_lost``): asking the same driver
+again cannot help, the scrape has to start over on a new lease.
+
+Delays use "full jitter": attempt ``n`` sleeps a random time between 0 and
+``min(cap, base * 2**n)``, so concurrent scrapers hitting the same outage
+don't retry in lock step. A numeric ``Retry-After`` header is honoured.
+"""
+
+import logging
+import random
+import time
+from typing import Callable, TypeVar
+
+import requests
+from selenium.common.exceptions import (
+    InvalidSessionIdException, NoSuchWindowException, WebDriverException,
+)
+from urllib3.exceptions import MaxRetryError
+
+from scrapers.metrics import current
+
+T = TypeVar("T")
+
+# HTTP statuses worth asking again for
+TRANSIENT_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# Messages of generic WebDriverExceptions raised once the browser is gone
+SESSION_LOST_MESSAGES = ("chrome not reachable", "disconnected", "target window already closed")
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Jittered delay before retry number ``attempt`` (0 for the first retry)."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def is_session_lost(error: BaseException) -> bool:
+    """Whether ``error`` means the browser session (or its tab) is gone."""
+    if isinstance(error, (InvalidSessionIdException, NoSuchWindowException, MaxRetryError)):
+        return True  # MaxRetryError: chromedriver itself no longer answers
+    return (isinstance(error, WebDriverException)
+            and any(m in str(error.msg or "").lower() for m in SESSION_LOST_MESSAGES))
+
+
+def is_transient(error: BaseException) -> bool:
+    """Whether ``error`` is a network or browser hiccup that a retry may get past."""
+    if isinstance(error, requests.HTTPError):
+        return error.response is not None and error.response.status_code in TRANSIENT_STATUSES
+    return isinstance(error, (requests.ConnectionError, requests.Timeout, WebDriverException,
+                              MaxRetryError))
+
+
+def _retry_after(error: BaseException) -> float | None:
+    response = getattr(error, "response", None)
+    value = response.headers.get("Retry-After") if response is not None else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None  # an HTTP date; fall back to the backoff
+
+
+def call_with_retry(fn: Callable[..., T], *args, tries: int = 3, base: float = 2.0,
+                    cap: float = 30.0, phase: str = "fetch",
+                    logger: logging.Logger | None = None, **kwargs) -> T:
+    """Call ``fn(*args, **kwargs)``, retrying transient errors up to ``tries`` times in all.
+
+    Each call is timed as the current source's ``phase`` and the sleeps in
+    between as its retry phase. An error still failing after every try is
+    raised with ``scrape_retried = True``, so the scrape isn't repeated for it;
+    a lost browser session is raised at once, untagged, so it is.
+    """
+    logger = logger or logging.getLogger(__name__)
+    metrics = current()
+    attempt = 0
+    while True:
+        try:
+            with metrics.phase(phase):
+                return fn(*args, **kwargs)
+        except Exception as e:
+            if not is_transient(e) or is_session_lost(e):
+                raise
+            if attempt >= tries - 1:
+                e.scrape_retried = True
+                raise
+            delay = backoff_delay(attempt, base, cap)
+            retry_after = _retry_after(e)
+            if retry_after is not None:
+                delay = min(cap, max(delay, retry_after))
+            logger.warning(f"{type(e).__name__}: {e}; retrying in {delay:.1f}s "
+                           f"({attempt + 1}/{tries - 1})")
+            metrics.add("retries")
+            with metrics.phase("retry"):
+                time.sleep(delay)
+            attempt += 1
@@ -2,30 +2,73 @@
 
 This site aggressively blocks non-browser requests (403 on everything).
 Uses Selenium to load the page, then attempts to discover and use their
-internal API via network interception. Falls back to DOM parsing.
+internal API via network interception (see scrapers.network_capture).
+Falls back to DOM parsing, crawling every results page in parallel tabs
+(scrapers.pagination) and pulling only the auction cards out of each
+rendered page (scrapers.dom_extract).
+
+API endpoints that yield auctions are saved (URL, method, headers, body) to
+.cache/ritchie_bros_api.json. Later runs replay them over plain HTTP, paging
+through the results (once a GET endpoint's first page gives the total, the
+remaining pages are fetched at once), and only launch the browser when the
+replay fails or returns an unexpected shape.
 """
 
+import os
 import re
 import json
 import time
+from functools import partial
+from itertools import chain
+from typing import Iterable, Iterator
+from urllib.parse import parse_qsl, urlencode, urlsplit
 from bs4 import BeautifulSoup
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 
+from scrapers import CACHE_DIR
 from scrapers.base_scraper import BaseScraper, AuctionListing
+from scrapers.browser_pool import BROWSER_POOL
+from scrapers.dom_extract import extract_cards
+from scrapers.http_client import HTTP_CLIENT
+from scrapers.metrics import current
+from scrapers.network_capture import NetworkCapture
+from scrapers.pagination import PageCrawler
+from scrapers.readiness import wait_until_ready
+from scrapers.retry import is_transient
 
-# States we care about
-TARGET_STATES = {"CA", "AZ", "NV", "California", "Arizona", "Nevada"}
+CARD_SELECTOR = 'div[data-testid^="auction-card-"]'
+
+# URL keywords of API responses that might contain auction data
+API_KEYWORDS = ["auction", "event", "sale", "catalog"]
+
+API_STATE_PATH = os.path.join(CACHE_DIR, "ritchie_bros_api.json")
+MAX_API_PAGES = 25
+
+# Request parameters that drive API paging
+PAGE_NUMBER_KEYS = ("page", "pageNumber", "pageIndex", "pageNo")
+OFFSET_KEYS = ("offset", "from", "start", "skip")
+SIZE_KEYS = ("size", "limit", "pageSize", "rows", "perPage")
+TOTAL_KEYS = ("total", "totalCount", "totalResults", "totalHits")
+
+# Captured request headers that must not be replayed verbatim
+SKIP_HEADERS = {"content-length", "host", "connection", "accept-encoding"}
 
 
 class RitchieBrosScraper(BaseScraper):
 
+    # Upper bound on settling time after the first cards appear
+    READY_MAX_WAIT = 5
+    # Waiting for a pooled browser tab, page load and a possible retry
+    TIME_BUDGET = 180
+    USES_BROWSER = True
+    MAX_PAGES = 10
+    MAX_PARALLEL_PAGES = 3
+    # Results are listed soonest first, so pages past the query window can be skipped
+    PAGES_IN_DATE_ORDER = True
+
     @property
     def source_name(self) -> str:
         return "Ritchie Bros"
@@ -34,107 +77,92 @@ class RitchieBrosScraper(BaseScraper):
     def base_url(self) -> str:
         return "https://www.rbauction.com/heavy-equipment-auctions"
 
-    def _init_driver(self) -> webdriver.Chrome:
-        options = Options()
-        options.add_argument("--headless=new")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument(
-            "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/131.0.0.0 Safari/537.36"
-        )
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        # Enable network logging to capture API calls
-        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    def __init__(self, query=None):
+        super().__init__(query)
+        self._discovered_endpoints: list[dict] = []
 
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
+    def _scrape_impl(self) -> Iterator[AuctionListing]:
+        # Strategy 0: Replay the API endpoints found on an earlier run
+        listings = self._replay_api()
+        if listings is not None:
+            yield from listings
+            return
 
-        driver.execute_cdp_cmd(
-            "Page.addScriptToEvaluateOnNewDocument",
-            {"source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"},
-        )
-        return driver
-
-    def _scrape_impl(self) -> list[AuctionListing]:
-        driver = self._init_driver()
-        try:
-            driver.get(self.base_url)
+        with BROWSER_POOL.tab(self.time_left()) as driver:
+            capture = NetworkCapture(API_KEYWORDS, logger=self.logger)
+            capture.install(driver)
+            load_start = time.perf_counter()
+            self.retry_fetch(driver.get, self.base_url)
 
             # Wait for content to load
-            try:
-                WebDriverWait(driver, 20).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "main"))
-                )
-            except Exception:
-                self.logger.warning("Page load timeout")
-
-            time.sleep(5)  # Extra time for SPA rendering
-
-            # Strategy 1: Try to find auction data in network logs (JSON API responses)
-            listings = self._extract_from_network(driver)
+            with current().phase("wait"):
+                try:
+                    WebDriverWait(driver, 20).until(
+                        EC.presence_of_element_located((By.TAG_NAME, "main"))
+                    )
+                except Exception:
+                    self.logger.warning("Page load timeout")
+
+            # Extra time for SPA rendering and its API calls
+            wait_until_ready(driver, CARD_SELECTOR, self.READY_MAX_WAIT, self.logger)
+            self.logger.info(f"Page loaded in {time.perf_counter() - load_start:.2f}s")
+
+            # Strategy 1: Try to find auction data in captured JSON API responses
+            self._discovered_endpoints = []
+            listings = self._extract_from_network(driver, capture)
             if listings:
-                return listings
-
-            # Strategy 2: Parse the rendered DOM
-            soup = BeautifulSoup(driver.page_source, "lxml")
-            return self._parse_dom(soup)
-        finally:
-            driver.quit()
-
-    def _extract_from_network(self, driver) -> list[AuctionListing]:
+                self._save_endpoints()
+                yield from listings
+                return
+
+            # Strategy 2: Parse the rendered DOM of every results page
+            first = extract_cards(driver, CARD_SELECTOR, self.logger)
+            soup = self.make_soup(first.html)
+            crawler = PageCrawler(driver, self.MAX_PARALLEL_PAGES, self.logger)
+            page_urls = crawler.page_urls(first.hrefs, first.labels,
+                                          self.base_url, self.MAX_PAGES)
+            more_pages = crawler.crawl(page_urls, CARD_SELECTOR, self.READY_MAX_WAIT,
+                                       parse=self.make_soup)
+            yield from self._parse_dom(soup, more_pages)
+
+    def _extract_from_network(self, driver, capture: NetworkCapture) -> list[AuctionListing]:
         """Try to extract auction data from intercepted network API responses."""
         listings = []
         try:
-            logs = driver.get_log("performance")
-            for entry in logs:
-                try:
-                    message = json.loads(entry["message"])["message"]
-                    if message["method"] != "Network.responseReceived":
-                        continue
-                    url = message["params"]["response"]["url"]
-                    # Look for API responses that might contain auction data
-                    if any(kw in url.lower() for kw in ["auction", "event", "sale", "catalog"]):
-                        if "json" in message["params"]["response"].get("mimeType", ""):
-                            request_id = message["params"]["requestId"]
-                            try:
-                                body = driver.execute_cdp_cmd(
-                                    "Network.getResponseBody",
-                                    {"requestId": request_id}
-                                )
-                                data = json.loads(body.get("body", "{}"))
-                                api_listings = self._parse_api_response(data)
-                                if api_listings:
-                                    self.logger.info(
-                                        f"Found {len(api_listings)} auctions from API: {url[:80]}"
-                                    )
-                                    listings.extend(api_listings)
-                            except Exception:
-                                pass
-                except (KeyError, json.JSONDecodeError):
-                    continue
+            with current().phase("fetch"):
+                entries = capture.collect(driver)
         except Exception as e:
-            self.logger.debug(f"Network log extraction failed: {e}")
+            self.logger.debug(f"Network capture failed: {e}")
+            return listings
+
+        for entry in entries:
+            try:
+                data = json.loads(entry["body"])
+            except (KeyError, TypeError, json.JSONDecodeError):
+                continue
+            api_listings = self._parse_api_response(data)
+            if api_listings:
+                self.logger.info(f"Found {len(api_listings)} auctions from API: {entry['url'][:80]}")
+                listings.extend(api_listings)
+                self._discovered_endpoints.append(self._endpoint_record(entry))
 
         return listings
 
-    def _parse_api_response(self, data) -> list[AuctionListing]:
-        """Try to parse auction data from a JSON API response."""
-        listings = []
-        # Handle various possible response shapes
-        items = []
+    @staticmethod
+    def _api_items(data) -> list | None:
+        """Return the auction list from an API response, or None if the shape is unknown."""
         if isinstance(data, list):
-            items = data
-        elif isinstance(data, dict):
+            return data
+        if isinstance(data, dict):
             for key in ["auctions", "events", "results", "data", "items"]:
                 if key in data and isinstance(data[key], list):
-                    items = data[key]
-                    break
+                    return data[key]
+        return None
 
-        for item in items:
+    def _parse_api_response(self, data) -> list[AuctionListing]:
+        """Try to parse auction data from a JSON API response."""
+        listings = []
+        for item in self._api_items(data) or []:
             if not isinstance(item, dict):
                 continue
             listing = self._parse_api_item(item)
@@ -143,6 +171,150 @@ class RitchieBrosScraper(BaseScraper):
 
         return listings
 
+    @staticmethod
+    def _endpoint_record(entry: dict) -> dict:
+        """Describe a captured API request so it can be replayed over HTTP."""
+        headers = {
+            k: v for k, v in (entry.get("headers") or {}).items()
+            if not k.startswith(":") and k.lower() not in SKIP_HEADERS
+        }
+        return {
+            "url": entry["url"],
+            "method": (entry.get("method") or "GET").upper(),
+            "headers": headers,
+            "post_data": entry.get("postData"),
+        }
+
+    def _save_endpoints(self) -> None:
+        if not self._discovered_endpoints:
+            return
+        unique = {(e["method"], e["url"], e["post_data"]): e for e in self._discovered_endpoints}
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(API_STATE_PATH, "w", encoding="utf-8") as f:
+                json.dump({"endpoints": list(unique.values())}, f, indent=2)
+            self.logger.info(f"Saved {len(unique)} API endpoint(s) for replay")
+        except OSError as e:
+            self.logger.warning(f"Could not save API endpoints: {e}")
+
+    def _replay_api(self) -> list[AuctionListing] | None:
+        """Call the saved API endpoints directly, without a browser.
+
+        Returns None when nothing is saved or any endpoint fails or answers
+        with an unexpected shape; the saved endpoints are then dropped so the
+        browser run can rediscover them (unless the API was just unreachable).
+        """
+        try:
+            with open(API_STATE_PATH, encoding="utf-8") as f:
+                endpoints = json.load(f)["endpoints"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+        listings = []
+        for endpoint in endpoints:
+            try:
+                found = self._replay_endpoint(endpoint)
+            except Exception as e:
+                self.logger.info(f"API replay of {endpoint['url'][:80]} failed: {e}")
+                if is_transient(e):
+                    # The API is down rather than changed; keep the endpoints for next run
+                    self.logger.info("API unavailable, falling back to the browser")
+                    return None
+                found = None
+            if found is None:
+                self.logger.info("API replay unusable, falling back to the browser")
+                try:
+                    os.remove(API_STATE_PATH)
+                except OSError:
+                    pass
+                return None
+            listings.extend(found)
+
+        self.logger.info(f"API replay: {len(listings)} auctions from {len(endpoints)} endpoint(s)")
+        return listings
+
+    @staticmethod
+    def _request(method: str, url: str, **kwargs):
+        resp = HTTP_CLIENT.request(method, url, **kwargs)
+        resp.raise_for_status()
+        return resp
+
+    def _replay_endpoint(self, endpoint: dict) -> list[AuctionListing] | None:
+        """Replay one endpoint, following its page/offset parameter to the end."""
+        parts = urlsplit(endpoint["url"])
+        query = dict(parse_qsl(parts.query, keep_blank_values=True))
+        body = None
+        if endpoint.get("post_data"):
+            try:
+                body = json.loads(endpoint["post_data"])
+            except ValueError:
+                pass
+        # Paging parameters live in the JSON body for POST searches, else the query
+        params = body if isinstance(body, dict) else query
+        page_key = next((k for k in PAGE_NUMBER_KEYS + OFFSET_KEYS if k in params), None)
+        size_key = next((k for k in SIZE_KEYS if k in params), None)
+
+        listings = []
+        seen = 0
+        for page in range(MAX_API_PAGES):
+            kwargs = {"headers": endpoint["headers"]}
+            if isinstance(body, dict):
+                kwargs["json"] = body
+            elif endpoint.get("post_data"):
+                kwargs["data"] = endpoint["post_data"]
+            url = parts._replace(query=urlencode(query)).geturl()
+            resp = self.retry_fetch(self._request, endpoint["method"], url, **kwargs)
+            data = resp.json()
+
+            items = self._api_items(data)
+            if items is None or (page == 0 and not items):
+                return None if page == 0 else listings
+            listings.extend(self._parse_api_response(data))
+            seen += len(items)
+
+            if not page_key:
+                break
+            try:
+                size = int(params[size_key]) if size_key else len(items)
+                page_value = int(params[page_key])
+            except (TypeError, ValueError):
+                break
+            total = next((data[k] for k in TOTAL_KEYS if isinstance(data, dict) and k in data), None)
+            if len(items) < size or (isinstance(total, int) and seen >= total):
+                break
+            params[page_key] = (page_value + 1 if page_key in PAGE_NUMBER_KEYS
+                                else page_value + len(items))
+            if (isinstance(total, int) and size > 0 and params is query
+                    and endpoint["method"] == "GET"):
+                listings.extend(self._replay_pages(parts, query, page_key, size, total - seen,
+                                                   endpoint["headers"], MAX_API_PAGES - page - 1))
+                break
+
+        return listings
+
+    def _replay_pages(self, parts, query: dict, page_key: str, size: int, remaining: int,
+                      headers: dict, max_pages: int) -> list[AuctionListing]:
+        """Fetch the pages holding the ``remaining`` items concurrently, from ``query``'s page on.
+
+        A page that fails is retried on its own; the first one without an
+        item list ends the replay.
+        """
+        start = int(query[page_key])
+        step = 1 if page_key in PAGE_NUMBER_KEYS else size
+        count = min(max_pages, -(-remaining // size))
+        urls = [parts._replace(query=urlencode({**query, page_key: start + i * step})).geturl()
+                for i in range(count)]
+
+        listings = []
+        for url, resp in zip(urls, self.fetch_many(urls, headers=headers)):
+            if isinstance(resp, BaseException) or not resp.ok:
+                resp = self.retry_fetch(self._request, "GET", url, headers=headers)
+            data = resp.json()
+            if self._api_items(data) is None:
+                break
+            listings.extend(self._parse_api_response(data))
+        return listings
+
     def _parse_api_item(self, item: dict) -> AuctionListing | None:
         """Parse a single auction from API JSON."""
         # Try to find location and filter for target states
@@ -160,7 +332,7 @@ class RitchieBrosScraper(BaseScraper):
                 location = ", ".join(parts)
                 break
 
-        if not self._is_target_state(location):
+        if not self.query.in_region(location):
             return None
 
         # Title
@@ -189,6 +361,8 @@ class RitchieBrosScraper(BaseScraper):
                     iso_date, display_date = self.parse_date(date_match.group(1))
                 except ValueError:
                     pass
+        if not self.query.in_window(iso_date):
+            return None
 
         # URL
         url = ""
@@ -232,8 +406,9 @@ class RitchieBrosScraper(BaseScraper):
             item_count=item_count,
         )
 
-    def _parse_dom(self, soup: BeautifulSoup) -> list[AuctionListing]:
-        """Parse auction cards from the rendered MUI DOM.
+    def _parse_dom(self, soup: BeautifulSoup,
+                   more_pages: Iterable[BeautifulSoup] = ()) -> Iterator[AuctionListing]:
+        """Parse auction cards from the rendered MUI DOM of each results page.
 
         Card structure (Material UI):
             div[data-testid="auction-card-XXXXXXX"]  -> card container
@@ -241,66 +416,90 @@ class RitchieBrosScraper(BaseScraper):
             h5.MuiCardHeader-subheader                -> "California Regional Auction, USA"
             Card text contains: item count, auction type, location
         """
-        listings = []
+        current_year = time.strftime("%Y")
 
-        # Select only top-level auction cards (not nested sub-elements)
-        cards = soup.find_all("div", attrs={
-            "data-testid": re.compile(r"^auction-card-\d+$")
-        })
-        self.logger.info(f"DOM: Found {len(cards)} auction cards")
+        def cards():
+            for page in chain([soup], more_pages):
+                # Select only top-level auction cards (not nested sub-elements)
+                page_cards = page.find_all("div", attrs={
+                    "data-testid": re.compile(r"^auction-card-\d+$")
+                })
+                self.logger.info(f"DOM: Found {len(page_cards)} auction cards")
+                yield from page_cards
+                if self.PAGES_IN_DATE_ORDER and self.query.past_window(
+                        self._card_date(card, current_year) for card in page_cards):
+                    self.logger.info("Remaining pages are past the date window, not loading them")
+                    break
+            close = getattr(more_pages, "close", None)
+            if close:
+                close()
 
-        current_year = time.strftime("%Y")
+        return self.iter_cards(
+            cards(), partial(self._parse_dom_card, current_year=current_year),
+            context=current_year, in_scope=partial(self._card_in_scope, current_year=current_year),
+        )
 
-        for card in cards:
-            text = card.get_text(" ", strip=True)
-            if not self._is_target_state(text):
-                continue
+    def _card_date(self, card, current_year: str) -> str | None:
+        """ISO start date from the card's date-range element, or None if it has none."""
+        date_el = card.select_one('[data-testid^="auction-card-date-range-"]')
+        iso_date, _ = self._parse_rb_date(date_el.get_text(strip=True) if date_el else "",
+                                          current_year)
+        return None if iso_date == "2099-12-31" else iso_date
 
-            # Auction ID from data-testid
-            testid = card.get("data-testid", "")
-            auction_id = testid.replace("auction-card-", "")
+    def _card_in_scope(self, card, current_year: str) -> bool:
+        """Region and start-date check before the full parse."""
+        if not self.query.in_region(card.get_text(" ", strip=True)):
+            return False
+        iso_date = self._card_date(card, current_year)
+        return iso_date is None or self.query.in_window(iso_date)
 
-            # Title from subheader
-            title_el = card.select_one(".MuiCardHeader-subheader")
-            title = title_el.get_text(strip=True) if title_el else "Ritchie Bros Auction"
+    def _parse_dom_card(self, card, current_year: str) -> AuctionListing | None:
+        """Parse one top-level MUI auction card (already checked by ``_card_in_scope``)."""
+        text = card.get_text(" ", strip=True)
 
-            # Date from date-range element (e.g., "Mar 25 - Mar 27" or "Apr 8")
-            date_el = card.select_one(f'[data-testid="auction-card-date-range-{auction_id}"]')
-            raw_date = date_el.get_text(strip=True) if date_el else ""
+        # Auction ID from data-testid
+        testid = card.get("data-testid", "")
+        auction_id = testid.replace("auction-card-", "")
 
-            iso_date, display_date = self._parse_rb_date(raw_date, current_year)
+        # Title from subheader
+        title_el = card.select_one(".MuiCardHeader-subheader")
+        title = title_el.get_text(strip=True) if title_el else "Ritchie Bros Auction"
 
-            # Location from card text
-            location = self._extract_location(text)
+        # Date from date-range element (e.g., "Mar 25 - Mar 27" or "Apr 8")
+        date_el = card.select_one(f'[data-testid="auction-card-date-range-{auction_id}"]')
+        raw_date = date_el.get_text(strip=True) if date_el else ""
 
-            # Item count from text (e.g., "6,897 Items" or "95 Items")
-            item_count = None
-            count_match = re.search(r'([\d,]+)\s+Items?', text)
-            if count_match:
-                try:
-                    item_count = int(count_match.group(1).replace(",", ""))
-                except ValueError:
-                    pass
+        iso_date, display_date = self._parse_rb_date(raw_date, current_year)
 
-            # Auction type
-            auction_type = "Timed" if "Timed auction" in text else "Live & Online"
+        # Location from card text
+        location = self._extract_location(text)
 
-            # Build URL from auction ID
-            slug = title.lower().replace(",", "").replace(" ", "-").replace(".", "")
-            slug = re.sub(r'-+', '-', slug).strip("-")
-            url = f"https://www.rbauction.com/heavy-equipment-auctions/{slug}-{auction_id}"
+        # Item count from text (e.g., "6,897 Items" or "95 Items")
+        item_count = None
+        count_match = re.search(r'([\d,]+)\s+Items?', text)
+        if count_match:
+            try:
+                item_count = int(count_match.group(1).replace(",", ""))
+            except ValueError:
+                pass
 
-            listings.append(self._create_listing(
-                title=title,
-                date=iso_date,
-                date_display=display_date,
-                location=location,
-                url=url,
-                auction_type=auction_type,
-                item_count=item_count,
-            ))
+        # Auction type
+        auction_type = "Timed" if "Timed auction" in text else "Live & Online"
 
-        return listings
+        # Build URL from auction ID
+        slug = title.lower().replace(",", "").replace(" ", "-").replace(".", "")
+        slug = re.sub(r'-+', '-', slug).strip("-")
+        url = f"https://www.rbauction.com/heavy-equipment-auctions/{slug}-{auction_id}"
+
+        return self._create_listing(
+            title=title,
+            date=iso_date,
+            date_display=display_date,
+            location=location,
+            url=url,
+            auction_type=auction_type,
+            item_count=item_count,
+        )
 
     def _parse_rb_date(self, raw: str, year: str) -> tuple[str, str]:
         """Parse Ritchie Bros date format like 'Mar 25 - Mar 27' or 'Apr 8'.
@@ -328,23 +527,11 @@ class RitchieBrosScraper(BaseScraper):
         display = f"{raw}, {year}"
         return iso_date, display
 
-    def _is_target_state(self, text: str) -> bool:
-        """Check if text mentions CA, AZ, or NV."""
-        text_upper = text.upper()
-        # Check state abbreviations (with word boundaries via common delimiters)
-        for abbr in ["CA", "AZ", "NV"]:
-            if re.search(rf'(?:^|[\s,]){abbr}(?:[\s,\d]|$)', text_upper):
-                return True
-        # Check full state names
-        for name in ["CALIFORNIA", "ARIZONA", "NEVADA"]:
-            if name in text_upper:
-                return True
-        return False
-
     def _extract_location(self, text: str) -> str:
         """Try to extract a city, state from text."""
         # Look for "City, ST" pattern
-        match = re.search(r'([A-Z][a-z]+(?:\s[A-Z][a-z]+)*),\s*(CA|AZ|NV)\b', text)
+        codes = "|".join(self.query.regions)
+        match = re.search(rf'([A-Z][a-z]+(?:\s[A-Z][a-z]+)*),\s*({codes})\b', text)
         if match:
             return f"{match.group(1)}, {match.group(2)}"
-        return "CA/AZ/NV"
+        return "/".join(self.query.regions)
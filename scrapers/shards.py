@@ -0,0 +1,93 @@
+"""Sharded copy of the auction data for the docs frontend.
+
+``auctions.json`` holds every listing, and the frontend has to download and
+parse all of it before showing anything. Next to it the orchestrator also
+writes one shard per source and month, plus a small manifest:
+
+    data/manifest.json
+        {"last_updated": ..., "sequence": 42, "total_count": 118,
+         "shards": [{"url": "shards/bar_none-2026-03.json", "source": "Bar None",
+                     "month": "2026-03", "count": 4, "hash": "9f2c..."}, ...]}
+    data/shards/bar_none-2026-03.json
+        {"source": "Bar None", "month": "2026-03", "auctions": [...]}
+
+Shards are written compact and only when their content changes, so an
+unchanged shard keeps its bytes (and its browser/CDN cache entry; the
+frontend appends the hash to the URL). Shards that no longer have listings
+are deleted.
+"""
+
+import logging
+import os
+import re
+
+from scrapers.base_scraper import AuctionListing
+from scrapers.output import EncodedArray, OutputWriter
+
+SHARD_DIR = "shards"
+MANIFEST_NAME = "manifest.json"
+
+logger = logging.getLogger("Shards")
+
+
+def shard_name(source: str, month: str) -> str:
+    slug = re.sub(r"\W+", "_", source.lower()).strip("_")
+    return f"{slug}-{month}.json"
+
+
+def group_shards(auctions: list[AuctionListing],
+                 encoded: list[str]) -> dict[tuple[str, str], list[str]]:
+    """(source, YYYY-MM) -> encoded listings, ordered by month, keeping listing order in a shard."""
+    shards: dict[tuple[str, str], list[str]] = {}
+    for auction, text in zip(auctions, encoded):
+        shards.setdefault((auction.source, auction.date[:7]), []).append(text)
+    return dict(sorted(shards.items(), key=lambda item: (item[0][1], item[0][0])))
+
+
+def write_sharded(auctions: list[AuctionListing], encoded: list[str], data_dir: str,
+                  last_updated: str, sequence: int) -> bool:
+    """Write the shards and manifest under ``data_dir``; True if anything was written.
+
+    ``encoded`` holds each listing's JSON as published in ``auctions.json``.
+    """
+    shard_dir = os.path.join(data_dir, SHARD_DIR)
+    writer = OutputWriter([], pretty=False)
+
+    entries = []
+    written = False
+    for (source, month), shard_records in group_shards(auctions, encoded).items():
+        name = shard_name(source, month)
+        path = os.path.normpath(os.path.join(shard_dir, name))
+        written |= writer.write({"source": source, "month": month,
+                                 "auctions": EncodedArray(shard_records)}, [path])
+        entries.append({
+            "url": f"{SHARD_DIR}/{name}",
+            "source": source,
+            "month": month,
+            "count": len(shard_records),
+            "hash": writer.digests[path][:16],
+        })
+
+    manifest = {
+        "last_updated": last_updated,
+        "sequence": sequence,
+        "total_count": len(auctions),
+        "shards": entries,
+    }
+    written |= writer.write(manifest, [os.path.join(data_dir, MANIFEST_NAME)])
+    _remove_stale(shard_dir, {os.path.basename(e["url"]) for e in entries})
+    return written
+
+
+def _remove_stale(shard_dir: str, keep: set[str]) -> None:
+    try:
+        names = os.listdir(shard_dir)
+    except OSError:
+        return
+    for name in names:
+        if name.endswith(".json") and name not in keep:
+            try:
+                os.remove(os.path.join(shard_dir, name))
+                logger.info(f"Removed stale shard {name}")
+            except OSError as e:
+                logger.warning(f"Could not remove stale shard {name}: {e}")
@@ -0,0 +1,191 @@
+"""SQLite store of every listing ever scraped, with per-run history.
+
+Each run upserts its listings into ``.cache/listings.sqlite3``:
+
+    listings         one row per listing ID (source + canonical URL, see
+                     scrapers.delta.listing_id) with the latest field values,
+                     first_seen / last_seen times and the run that last saw it
+    listing_history  one row per changed field per run (old and new value),
+                     e.g. item_count growing as lots are added
+    runs             start/finish time and listing count of every run
+    source_runs      each source's outcome in a run: status, seconds and the
+                     full scrapers.metrics entry (phase timings, bytes,
+                     card counts, peak RSS) as JSON
+
+Listings are added one at a time as the scrapers stream them in
+(``begin_run`` / ``add`` / ``finish_run``) and committed together at the end;
+windowing and dedupe for the published export happen in the pipeline
+(scrapers.pipeline), not here. The history answers questions such as "when
+did this sale first appear" without re-scraping:
+
+    sqlite3 .cache/listings.sqlite3 \\
+        "SELECT title, first_seen FROM listings WHERE source = 'Bar None' ORDER BY first_seen"
+"""
+
+import json
+import logging
+import os
+import sqlite3
+from dataclasses import fields
+from datetime import datetime
+from typing import Iterable
+
+from scrapers import CACHE_DIR
+from scrapers.base_scraper import AuctionListing
+from scrapers.delta import listing_id
+
+STORE_PATH = os.path.join(CACHE_DIR, "listings.sqlite3")
+
+LISTING_FIELDS = [f.name for f in fields(AuctionListing)]
+_COLUMNS = ", ".join(LISTING_FIELDS)
+_PLACEHOLDERS = ", ".join("?" for _ in LISTING_FIELDS)
+_ASSIGNMENTS = ", ".join(f"{name} = ?" for name in LISTING_FIELDS)
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    listings INTEGER
+);
+CREATE TABLE IF NOT EXISTS listings (
+    id TEXT PRIMARY KEY,
+    {_COLUMNS},
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    last_run INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS listings_source_url ON listings (source, url);
+CREATE INDEX IF NOT EXISTS listings_date ON listings (date);
+CREATE INDEX IF NOT EXISTS listings_location ON listings (location);
+CREATE TABLE IF NOT EXISTS listing_history (
+    listing_id TEXT NOT NULL REFERENCES listings (id),
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    field TEXT NOT NULL,
+    old_value,
+    new_value
+);
+CREATE INDEX IF NOT EXISTS history_listing ON listing_history (listing_id, run_id);
+CREATE TABLE IF NOT EXISTS source_runs (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    source TEXT NOT NULL,
+    status TEXT NOT NULL,
+    seconds REAL,
+    metrics TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS source_runs_source ON source_runs (source, run_id);
+"""
+
+
+class ListingStore:
+    """Upserts each run's listings and keeps their history."""
+
+    def __init__(self, path: str = STORE_PATH):
+        self.path = path
+        self.logger = logging.getLogger("ListingStore")
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "ListingStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def begin_run(self) -> int:
+        """Start a run; listings are then passed to ``add`` as they arrive."""
+        self._now = datetime.now().isoformat(timespec="seconds")
+        self._run_id = self.conn.execute(
+            "INSERT INTO runs (started_at) VALUES (?)", (self._now,)
+        ).lastrowid
+        self._seen: set[str] = set()
+        self._added = self._updated = 0
+        return self._run_id
+
+    def add(self, listing: AuctionListing) -> None:
+        """Upsert one listing into the current run.
+
+        A listing ID seen twice in the same run keeps its first occurrence.
+        """
+        id_ = listing_id(listing.source, listing.url)
+        if id_ in self._seen:
+            return
+        self._seen.add(id_)
+        values = [getattr(listing, name) for name in LISTING_FIELDS]
+
+        row = self.conn.execute(f"SELECT {_COLUMNS} FROM listings WHERE id = ?", (id_,)).fetchone()
+        if row is None:
+            self.conn.execute(
+                f"INSERT INTO listings (id, {_COLUMNS}, first_seen, last_seen, last_run) "
+                f"VALUES (?, {_PLACEHOLDERS}, ?, ?, ?)",
+                (id_, *values, self._now, self._now, self._run_id),
+            )
+            self._added += 1
+            return
+
+        changes = [(name, old, new) for name, old, new in zip(LISTING_FIELDS, row, values)
+                   if old != new]
+        if changes:
+            self._updated += 1
+            self.conn.executemany(
+                "INSERT INTO listing_history (listing_id, run_id, field, old_value, new_value) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(id_, self._run_id, name, old, new) for name, old, new in changes],
+            )
+        self.conn.execute(
+            f"UPDATE listings SET {_ASSIGNMENTS}, last_seen = ?, last_run = ? WHERE id = ?",
+            (*values, self._now, self._run_id, id_),
+        )
+
+    def finish_run(self) -> None:
+        """Close the current run and commit everything added to it."""
+        self.conn.execute(
+            "UPDATE runs SET finished_at = ?, listings = ? WHERE id = ?",
+            (datetime.now().isoformat(timespec="seconds"), len(self._seen), self._run_id),
+        )
+        self.conn.commit()
+        self.logger.info(f"Run {self._run_id}: stored {len(self._seen)} listings "
+                         f"({self._added} new, {self._updated} changed)")
+
+    def record_sources(self, entries: Iterable[dict]) -> None:
+        """Store the latest run's per-source metrics (``SourceMetrics.to_dict`` entries)."""
+        self.conn.executemany(
+            "INSERT INTO source_runs (run_id, source, status, seconds, metrics) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [(self._run_id, e["source"], e["status"], e["seconds"], json.dumps(e))
+             for e in entries],
+        )
+        self.conn.commit()
+
+    def source_runs(self, source: str) -> list[tuple[str, str, float]]:
+        """(run started_at, status, seconds) for every run of ``source``."""
+        return self.conn.execute(
+            """
+            SELECT r.started_at, s.status, s.seconds
+            FROM source_runs s JOIN runs r ON r.id = s.run_id
+            WHERE s.source = ? ORDER BY s.run_id
+            """,
+            (source,),
+        ).fetchall()
+
+    def first_seen(self, source: str, url: str) -> str | None:
+        """When a listing first appeared, or None if it never has."""
+        row = self.conn.execute(
+            "SELECT first_seen FROM listings WHERE id = ?", (listing_id(source, url),)
+        ).fetchone()
+        return row[0] if row else None
+
+    def history(self, source: str, url: str) -> list[tuple[str, str, object, object]]:
+        """(run started_at, field, old value, new value) for every change to a listing."""
+        return self.conn.execute(
+            """
+            SELECT r.started_at, h.field, h.old_value, h.new_value
+            FROM listing_history h JOIN runs r ON r.id = h.run_id
+            WHERE h.listing_id = ? ORDER BY h.run_id
+            """,
+            (listing_id(source, url),),
+        ).fetchall()
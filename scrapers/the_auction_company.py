@@ -14,22 +14,28 @@ DOM Structure (discovered 2026-03-11):
 """
 
 import re
-import time
-from bs4 import BeautifulSoup, Tag
+from typing import Iterator
+from bs4 import Tag
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 
 from scrapers.base_scraper import BaseScraper, AuctionListing
+from scrapers.browser_pool import BROWSER_POOL
+from scrapers.dom_extract import extract_cards
+from scrapers.metrics import current
+from scrapers.readiness import wait_until_ready
 
 
 class TheAuctionCompanyScraper(BaseScraper):
 
+    # Upper bound on settling time after the first cards appear
+    READY_MAX_WAIT = 2
+    # Waiting for a pooled browser tab, page load and a possible retry
+    TIME_BUDGET = 150
+    USES_BROWSER = True
+
     @property
     def source_name(self) -> str:
         return "The Auction Company"
@@ -38,66 +44,39 @@ class TheAuctionCompanyScraper(BaseScraper):
     def base_url(self) -> str:
         return "https://bid.theauctioncompany.net"
 
-    def _init_driver(self) -> webdriver.Chrome:
-        """Initialize headless Chrome with realistic browser fingerprint."""
-        options = Options()
-        options.add_argument("--headless=new")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument(
-            "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/131.0.0.0 Safari/537.36"
-        )
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
-
-        driver.execute_cdp_cmd(
-            "Page.addScriptToEvaluateOnNewDocument",
-            {"source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"},
-        )
-        return driver
-
-    def _scrape_impl(self) -> list[AuctionListing]:
+    def _scrape_impl(self) -> Iterator[AuctionListing]:
         """Scrape auction listings from bid.theauctioncompany.net."""
-        driver = self._init_driver()
-        try:
-            driver.get(self.base_url)
+        with BROWSER_POOL.tab(self.time_left()) as driver:
+            self.retry_fetch(driver.get, self.base_url)
 
             # Wait for the auction cards to render
-            try:
-                WebDriverWait(driver, 15).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "ul.auclting"))
-                )
-            except Exception:
-                self.logger.warning("Timeout waiting for auction cards")
+            with current().phase("wait"):
+                try:
+                    WebDriverWait(driver, 15).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, "ul.auclting"))
+                    )
+                except Exception:
+                    self.logger.warning("Timeout waiting for auction cards")
 
-            time.sleep(2)
+            wait_until_ready(driver, "ul.auclting", self.READY_MAX_WAIT, self.logger)
 
-            soup = BeautifulSoup(driver.page_source, "lxml")
-            return self._parse_listings(soup)
-        finally:
-            driver.quit()
+            page = extract_cards(driver, "ul.auclting", self.logger)
+            yield from self._parse_listings(page.html)
 
-    def _parse_listings(self, soup: BeautifulSoup) -> list[AuctionListing]:
+    def _parse_listings(self, html: str) -> Iterator[AuctionListing]:
         """Parse auction cards from the Bidpath platform HTML."""
-        listings = []
-        cards = soup.select("ul.auclting")
+        cards = self.select_cards(html, "ul.auclting")
         self.logger.info(f"Found {len(cards)} auction cards")
 
-        for card in cards:
-            try:
-                listing = self._parse_card(card)
-                if listing:
-                    listings.append(listing)
-            except Exception as e:
-                self.logger.warning(f"Failed to parse card: {e}")
+        return self.iter_cards(cards, self._parse_card, in_scope=self._card_in_scope)
 
-        return listings
+    def _card_in_scope(self, card: Tag) -> bool:
+        """Date check on the date spans alone (all sales are in California)."""
+        raw_date = self._raw_date(card)
+        if not raw_date:
+            return True
+        iso_date, _ = self._parse_auction_date(raw_date, "")
+        return iso_date == "2099-12-31" or self.query.in_window(iso_date)
 
     def _parse_card(self, card: Tag) -> AuctionListing | None:
         """Parse a single <ul class='auclting'> element."""
@@ -120,20 +99,7 @@ class TheAuctionCompanyScraper(BaseScraper):
         title = title.strip()
 
         # --- Date ---
-        # For timed/online auctions, prefer the "Starts Ending" date (closing date)
-        # over the start date, since the start date is when bidding opened (possibly weeks ago)
-        ending_el = card.select_one("span.auc-starts-ending-date")
-        start_el = card.select_one("span.auction_list_start_date")
-
-        raw_date = ""
-        if ending_el:
-            raw_date = ending_el.get_text(strip=True)
-            # Text is like "Starts Ending 04/27/2026 12:00 PM PDT"
-            raw_date = re.sub(r"^Starts\s+Ending\s+", "", raw_date, flags=re.IGNORECASE)
-        elif start_el:
-            raw_date = start_el.get_text(strip=True)
-
-        iso_date, display_date = self._parse_auction_date(raw_date, title)
+        iso_date, display_date = self._parse_auction_date(self._raw_date(card), title)
 
         # --- Auction type ---
         type_el = card.select_one("li.aucdes p a[id^='sale']")
@@ -172,6 +138,21 @@ class TheAuctionCompanyScraper(BaseScraper):
             item_count=item_count,
         )
 
+    @staticmethod
+    def _raw_date(card: Tag) -> str:
+        """Text of the card's date span, or "" if it has none.
+
+        For timed/online auctions, prefer the "Starts Ending" date (closing date)
+        over the start date, since the start date is when bidding opened (possibly weeks ago).
+        """
+        ending_el = card.select_one("span.auc-starts-ending-date")
+        if ending_el:
+            # Text is like "Starts Ending 04/27/2026 12:00 PM PDT"
+            return re.sub(r"^Starts\s+Ending\s+", "", ending_el.get_text(strip=True),
+                          flags=re.IGNORECASE)
+        start_el = card.select_one("span.auction_list_start_date")
+        return start_el.get_text(strip=True) if start_el else ""
+
     def _parse_auction_date(self, raw_date: str, title: str) -> tuple[str, str]:
         """Extract date from the date span or fall back to title text.
 
@@ -194,17 +175,8 @@ class TheAuctionCompanyScraper(BaseScraper):
                     pass
 
         # Fallback: parse from title (e.g., "SATURDAY, APRIL 25TH-Ring 1...")
-        title_date_match = re.search(
-            r"(?:MONDAY|TUESDAY|WEDNESDAY|THURSDAY|FRIDAY|SATURDAY|SUNDAY),?\s+"
-            r"([A-Z]+)\s+(\d+)",
-            title, re.IGNORECASE
-        )
-        if title_date_match:
-            month_str = title_date_match.group(1)
-            day_str = title_date_match.group(2)
-            try:
-                return self.parse_date(f"{month_str} {day_str}, 2026")
-            except ValueError:
-                pass
+        found = self.find_date(title, default_year=2026)
+        if found:
+            return found
 
         return "2099-12-31", "Date TBD"
@@ -10,8 +10,6 @@ run together. Two auction types:
 """
 
 import re
-import requests
-from bs4 import BeautifulSoup
 
 from scrapers.base_scraper import BaseScraper, AuctionListing
 
@@ -27,12 +25,18 @@ class VantageScraper(BaseScraper):
         return "https://www.vantageauctions.com/auctions/"
 
     def _scrape_impl(self) -> list[AuctionListing]:
-        resp = requests.get(self.base_url, headers={
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        }, timeout=30)
-        resp.raise_for_status()
+        resp = self.fetch()
+        previous = self.previous_results()
+        if previous is not None:
+            return previous
 
-        soup = BeautifulSoup(resp.text, "lxml")
+        listings = self._parse_page(resp.text)
+        self.logger.info(f"Parsed {len(listings)} auction listings")
+        return listings
+
+    def _parse_page(self, html: str) -> list[AuctionListing]:
+        """Parse every auction link on the auctions page."""
+        soup = self.make_soup(html)
         listings = []
 
         # Find all links that contain auction-related text
@@ -56,7 +60,6 @@ class VantageScraper(BaseScraper):
                 if listing:
                     listings.append(listing)
 
-        self.logger.info(f"Parsed {len(listings)} auction listings")
         return listings
 
     def _parse_equipment_auction(self, text: str, href: str) -> AuctionListing | None:
@@ -65,19 +68,10 @@ class VantageScraper(BaseScraper):
         Text format: "Heavy Construction EquipmentSaturday, March 21, 2026 9:00 am"
         """
         # Extract date — look for "Day, Month DD, YYYY"
-        date_match = re.search(
-            r'(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+'
-            r'([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})',
-            text
-        )
-        if not date_match:
-            return None
-
-        month, day, year = date_match.group(1), date_match.group(2), date_match.group(3)
-        try:
-            iso_date, display_date = self.parse_date(f"{month} {day}, {year}")
-        except ValueError:
+        found = self.find_date(text)
+        if not found:
             return None
+        iso_date, display_date = found
 
         return self._create_listing(
             title="Heavy Construction Equipment Auction",
@@ -94,29 +88,17 @@ class VantageScraper(BaseScraper):
         Text format: "Timed Land AuctionBidding Starts: Tuesday, March 10, 2026...
                       Bidding Ends: Tuesday, March 24, 2026..."
         """
-        # Use the "Bidding Ends" date as the auction date
-        ends_match = re.search(
-            r'Bidding\s+Ends:\s*(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+'
-            r'([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})',
-            text
-        )
-        if not ends_match:
-            # Fall back to "Bidding Starts" date
-            starts_match = re.search(
-                r'Bidding\s+Starts:\s*(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+'
-                r'([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})',
-                text
-            )
-            if not starts_match:
-                return None
-            month, day, year = starts_match.group(1), starts_match.group(2), starts_match.group(3)
-        else:
-            month, day, year = ends_match.group(1), ends_match.group(2), ends_match.group(3)
-
-        try:
-            iso_date, display_date = self.parse_date(f"{month} {day}, {year}")
-        except ValueError:
+        # Use the "Bidding Ends" date as the auction date, else "Bidding Starts"
+        found = None
+        for label in (r'Bidding\s+Ends:', r'Bidding\s+Starts:'):
+            label_match = re.search(label, text)
+            if label_match:
+                found = self.find_date(text[label_match.end():])
+            if found:
+                break
+        if not found:
             return None
+        iso_date, display_date = found
 
         return self._create_listing(
             title="Timed Land Auction",
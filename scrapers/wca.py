@@ -10,9 +10,7 @@ Structure:
 """
 
 import re
-import requests
 from datetime import datetime
-from bs4 import BeautifulSoup
 
 from scrapers.base_scraper import BaseScraper, AuctionListing
 
@@ -31,13 +29,18 @@ class WCAScraper(BaseScraper):
     DEFAULT_LOCATION = "Lake Elsinore, CA"
 
     def _scrape_impl(self) -> list[AuctionListing]:
-        resp = requests.get(self.base_url, headers={
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        }, timeout=30)
-        resp.raise_for_status()
+        resp = self.fetch()
+        previous = self.previous_results()
+        if previous is not None:
+            return previous
 
-        soup = BeautifulSoup(resp.text, "lxml")
-        page_text = soup.get_text("\n", strip=True)
+        listings = self._parse_page(resp.text)
+        self.logger.info(f"Parsed {len(listings)} auction listings")
+        return listings
+
+    def _parse_page(self, html: str) -> list[AuctionListing]:
+        """Parse the next auction and the future dates from the preview page."""
+        page_text = self.make_soup(html).get_text("\n", strip=True)
         listings = []
 
         # --- Parse the next upcoming auction ---
@@ -48,28 +51,17 @@ class WCAScraper(BaseScraper):
         # --- Parse future auction dates ---
         future_auctions = self._parse_future_dates(page_text)
         listings.extend(future_auctions)
-
-        self.logger.info(f"Parsed {len(listings)} auction listings")
         return listings
 
     def _parse_next_auction(self, text: str) -> AuctionListing | None:
         """Parse the primary 'Next Auction' block."""
         # Pattern: "Next Auction: Friday April 10th, 2026 - 8:30am"
-        match = re.search(
-            r'Next\s+Auction:\s*'
-            r'(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\s+'
-            r'([A-Za-z]+)\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})',
-            text, re.IGNORECASE
-        )
-        if not match:
+        match = re.search(r'Next\s+Auction:', text, re.IGNORECASE)
+        found = self.find_date(text[match.end():match.end() + 80]) if match else None
+        if not found:
             self.logger.warning("Could not find 'Next Auction' date")
             return None
-
-        month, day, year = match.group(1), match.group(2), match.group(3)
-        try:
-            iso_date, display_date = self.parse_date(f"{month} {day}, {year}")
-        except ValueError:
-            return None
+        iso_date, display_date = found
 
         # Check for preview dates
         notes = ""
@@ -118,15 +110,10 @@ class WCAScraper(BaseScraper):
                 continue
 
             # Parse "June 12th" or "August 14th"
-            date_match = re.match(r'([A-Za-z]+)\s+(\d{1,2})(?:st|nd|rd|th)?', part)
-            if not date_match:
-                continue
-
-            month, day = date_match.group(1), date_match.group(2)
-            try:
-                iso_date, display_date = self.parse_date(f"{month} {day}, {year}")
-            except ValueError:
+            found = self.find_date(part, default_year=year)
+            if not found:
                 continue
+            iso_date, display_date = found
 
             listings.append(self._create_listing(
                 title="WCA Public Auction",